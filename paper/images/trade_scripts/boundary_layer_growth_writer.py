@@ -3,9 +3,9 @@ import matplotlib.pylab as plt
 from openmdao.api import Group, Problem, IndepVarComp
 
 from hyperloop.Python import boundary_layer_sensitivity
+from hyperloop.Python.tools.sweep import Sweep, grid
 
-if __name__ == '__main__':
-
+def create_problem():
     top = Problem()
     root = top.root = Group()
 
@@ -23,21 +23,17 @@ if __name__ == '__main__':
     root.connect('L_pod', 'p.L')
     root.connect('length_calc', 'p.length_calc')
 
-    top.setup()
+    return top
+
+if __name__ == '__main__':
 
     delta_star = np.linspace(.02, .12, num = 50)
     A_pod = np.linspace(2, 3, num = 3)
 
-    A_tube = np.zeros((len(A_pod), len(delta_star)))
-
-    for i in range(len(delta_star)):
-        for j in range(len(A_pod)):
-            top['delta_star'] = delta_star[i]
-            top['A_pod'] = A_pod[j]
-
-            top.run()
+    sweep = Sweep(create_problem, ['p.A_tube'])
+    results = sweep.run(grid(('delta_star', delta_star), ('A_pod', A_pod)))
 
-            A_tube[j,i] = top['p.A_tube']
+    A_tube = results['p.A_tube'].reshape(len(delta_star), len(A_pod)).T
 
     np.savetxt('../../../paper/images/data_files/boundary_layer_growth_trades/delta_star.txt', delta_star, fmt = '%f', delimiter = '\t', newline = '\r\n')
     np.savetxt('../../../paper/images/data_files/boundary_layer_growth_trades/A_tube.txt', A_tube, fmt = '%f', delimiter = '\t', newline = '\r\n')
@@ -3,20 +3,9 @@ import matplotlib.pylab as plt
 from openmdao.api import Group, Problem, IndepVarComp, ExecComp, ScipyOptimizer
 
 from hyperloop.Python import structural_optimization
+from hyperloop.Python.tools.sweep import Sweep, grid
 
-# def create_problem(component):
-#     root = Group()
-#     prob = Problem(root)
-#     prob.root.add('comp', component)
-#     return prob
-
-# class PressureTradeStudy(object):
-#     def test_case1_vs_npss(self):
-
-#         component = tube_and_pod.TubeAndPod()
-#         prob = create_problem(component)
-
-if __name__ == '__main__':
+def create_problem():
 	top = Problem()
 	root = top.root = Group()
 
@@ -67,31 +56,27 @@ if __name__ == '__main__':
 	top.driver.add_constraint('con1.c1', lower=0.0, scaler=1000.0)
 	top.driver.add_constraint('con2.c2', lower=0.0)
 
-	top.setup()
+	return top
 
-	top['p.p_tunnel'] = 850.0
-	# top['p.m_pod']= 10000.0
-	top['p.h'] = 10.0
+if __name__ == '__main__':
 
 	m_pod = np.linspace(10000.0, 20000, num = 3)
 	A_tube = np.linspace(20.0, 50.0, num = 30)
 
-	dx = np.zeros((len(m_pod), len(A_tube)))
-	t_tube = np.zeros((len(m_pod), len(A_tube)))
-	r_pylon = np.zeros((len(m_pod), len(A_tube)))
-	cost = np.zeros((1, len(A_tube)))
+	cases = grid(('input_vars.tube_area', A_tube), ('p.m_pod', m_pod))
+	for case in cases:
+		case['p.p_tunnel'] = 850.0
+		case['p.h'] = 10.0
 
-	for i in range(len(A_tube)):
-		for j in range(len(m_pod)):
-			top['input_vars.tube_area'] = A_tube[i]
-			top['p.m_pod'] = m_pod[j]
+	outputs = ['p.dx', 'p.t', 'p.r_pylon', 'p.total_material_cost']
 
-			top.run()
+	sweep = Sweep(create_problem, outputs)
+	results = sweep.run(cases)
 
-			dx[j,i] = top['p.dx']
-			t_tube[j,i] = top['p.t']
-			r_pylon[j,i] = top['p.r_pylon']
-		cost[0,i] = top['p.total_material_cost']
+	dx = results['p.dx'].reshape(len(A_tube), len(m_pod)).T
+	t_tube = results['p.t'].reshape(len(A_tube), len(m_pod)).T
+	r_pylon = results['p.r_pylon'].reshape(len(A_tube), len(m_pod)).T
+	cost = results['p.total_material_cost'].reshape(len(A_tube), len(m_pod))[:, -1].reshape(1, -1)
 
 	np.savetxt('../../../paper/images/data_files/overland_structural_trades/m_pod.txt', m_pod, fmt = '%f', delimiter = '\t', newline = '\r\n')
 	np.savetxt('../../../paper/images/data_files/overland_structural_trades/A_tube.txt', A_tube, fmt = '%f', delimiter = '\t', newline = '\r\n')
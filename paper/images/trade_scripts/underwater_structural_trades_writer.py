@@ -3,31 +3,30 @@ import matplotlib.pylab as plt
 from openmdao.api import Group, Problem, IndepVarComp
 
 from hyperloop.Python.tube import submerged_tube
+from hyperloop.Python.tools.sweep import Sweep, grid
 
-if __name__ == '__main__':
+def create_problem():
 	top = Problem()
 	root = top.root = Group()
 
 	root.add('p', submerged_tube.SubmergedTube())
 
-	top.setup()
-	top['p.p_tube'] = 850.0
+	return top
+
+if __name__ == '__main__':
 
 	depth = np.linspace(20.0, 60.0, num = 3)
 	A_tube = np.linspace(20.0, 50.0, num = 30)
 
-	cost = np.zeros((len(depth), len(A_tube)))
-	t = np.zeros((len(depth), len(A_tube)))
-
-	for i in range(len(A_tube)):
-		for j in range(len(depth)):
-			top['p.A_tube'] = A_tube[i]
-			top['p.depth'] = depth[j]
+	cases = grid(('p.A_tube', A_tube), ('p.depth', depth))
+	for case in cases:
+		case['p.p_tube'] = 850.0
 
-			top.run()
+	sweep = Sweep(create_problem, ['p.t', 'p.material_cost'])
+	results = sweep.run(cases)
 
-			t[j,i] = top['p.t']
-			cost[j,i] = top['p.material_cost']
+	t = results['p.t'].reshape(len(A_tube), len(depth)).T
+	cost = results['p.material_cost'].reshape(len(A_tube), len(depth)).T
 
 	np.savetxt('../../../paper/images/data_files/underwater_structural_trades/depth.txt', depth, fmt = '%f', delimiter = '\t', newline = '\r\n')
 	np.savetxt('../../../paper/images/data_files/underwater_structural_trades/A_tube.txt', A_tube, fmt = '%f', delimiter = '\t', newline = '\r\n')
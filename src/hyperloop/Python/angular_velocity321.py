@@ -3,6 +3,22 @@ from __future__ import print_function
 import numpy as np
 from openmdao.api import IndepVarComp, Component, Group, Problem
 
+def angular_velocity321_kernel(p):
+	'''
+	Vectorized AngularVelocity321 for a dict of params given as scalars or
+	arrays of samples. 'omega_b' has the body axes on its last dimension.
+	'''
+	psi_dot = p['psi_dot']
+	theta_dot = p['theta_dot']
+	phi_dot = p['phi_dot']
+	s_theta, c_theta = np.sin(p['theta']), np.cos(p['theta'])
+	s_phi, c_phi = np.sin(p['phi']), np.cos(p['phi'])
+
+	omega = np.broadcast_arrays(phi_dot - psi_dot*s_theta,
+	                            theta_dot*c_phi + psi_dot*s_phi*c_theta,
+	                            psi_dot*c_phi*c_theta - theta_dot*s_phi)
+	return {'omega_b' : np.concatenate([w[..., None] for w in omega], axis=-1)}
+
 class AngularVelocity321(Component):
     """
 	Notes
@@ -44,14 +60,16 @@ class AngularVelocity321(Component):
     	self.add_param('theta_dot', val = 0.0, units = 'rad', desc = 'Pod pitch rate')
     	self.add_param('phi_dot', val = 0.0, units = 'rad', desc = 'Pod roll rate')
 
-    	self.add_output('omega_b', val = np.matrix('0.0; 0.0; 0.0'), units = 'rad/s', desc = 'Angular velocity vector')
+    	self.add_output('omega_b', val = np.zeros(3), units = 'rad/s', desc = 'Angular velocity vector')
+
+    kernel = staticmethod(angular_velocity321_kernel)
 
     def solve_nonlinear(self, p, u, r):
     	"""
 		Notes
 		------
 
-		omega = [[s(psi)*s(theta), c(psi), 0], [c(psi)*s(theta), -s(psi), 0], [c(theta), 0,1]] * [[phi], [theta], [psi]]
+		omega = [[-s(theta), 0, 1], [s(phi)*c(theta), c(phi), 0], [c(phi)*c(theta), -s(phi), 0]] * [[psi_dot], [theta_dot], [phi_dot]]
 
 	    Params
 	    ------
@@ -76,16 +94,8 @@ class AngularVelocity321(Component):
 	    	Returns the body fame angular velocity of the pod in rad/s
 	    """
 
-    	psi = p['psi']
-    	theta = p['theta']
-    	phi = p['phi']
-    	psi_dot = p['psi_dot']
-    	theta_dot = p['theta_dot']
-    	phi_dot = p['phi_dot']
-
-    	B = np.matrix([[-np.sin(theta), 0.0, 1.0], [np.sin(phi)*np.cos(theta), np.cos(phi), 0.0], [np.cos(phi)*np.cos(theta), -np.sin(phi), 0]])
-
-    	u['omega_b'] = B * np.matrix([[phi_dot], [theta_dot], [psi_dot]])
+    	for name, val in angular_velocity321_kernel(p).items():
+    		u[name] = val
 
 
 if __name__ == '__main__':
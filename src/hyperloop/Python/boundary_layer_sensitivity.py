@@ -2,7 +2,64 @@ from __future__ import print_function
 
 import numpy as np
 from openmdao.api import IndepVarComp, Component, Group, Problem, ExecComp
-import matplotlib.pylab as plt
+
+from hyperloop.Python.pod.pod_mach import mach_to_area
+
+def boundary_layer_sensitivity_kernel(p):
+	"""
+	Vectorized BoundaryLayerSensitivity. Takes a dict of params by name, as
+	scalars or arrays of design points, and returns a dict of outputs.
+	"""
+	gam = p['gam']
+	BF = p['BF']
+	A_pod = p['A_pod']
+	L = p['L']
+	prc = p['prc']
+	p_tube = p['p_tube']
+	R = p['R']
+	T_ambient = p['T_ambient']
+	mu = p['mu']
+	M_duct = p['M_duct']
+	M_diff = p['M_diff']
+	cp = p['cp']
+	delta_star = p['delta_star']
+	M_pod = p['M_pod']
+
+	#Define intermediate variables
+	rho_inf = p_tube / (R *
+	                    T_ambient)  #Calculate density of free stream flow
+	U_inf = M_pod * (np.sqrt((gam * R * T_ambient)))        #Calculate velocity of free stream flow
+	r_pod = np.sqrt((A_pod / np.pi))  #Calculate pod radius
+
+	Re = (rho_inf * U_inf *
+	      L) / mu  #Calculate length based Reynolds Number
+
+	delta_star = np.where(p['length_calc'], (.04775*L)/(Re**.2), delta_star)
+
+	A_diff = BF * A_pod  #Calculate diffuser output area based on blockage factor input
+
+	#Calculate inlet area. Inlet is necessary if free stream Mach number is greater than max compressore mach number M_diff
+	A_inlet = np.where(np.real(M_pod) > np.real(M_diff),
+	                   A_diff * mach_to_area(M_diff, M_pod, gam),
+	                   A_diff)
+
+	eps = mach_to_area(M_pod, M_duct, gam)
+	A_tube = (A_pod + np.pi * (((r_pod + delta_star)**2.0) - (r_pod**2.0)) -
+	          (eps * A_inlet)) / ((1.0 + (np.sqrt(eps))) * (1.0 - (np.sqrt(eps))))
+	pwr_comp = (rho_inf * U_inf * A_inlet) * cp * T_ambient * (1.0 + (
+	    (gam - 1) / 2.0) * (M_pod**2)) * ((prc**((gam - 1) / gam)) - 1)
+	A_bypass = A_tube - A_inlet
+	A_duct_eff = A_tube - A_pod - np.pi * ((
+	    (r_pod + delta_star)**2) - (r_pod**2))
+
+	return {'pwr_comp' : pwr_comp,
+	        'A_inlet' : A_inlet,
+	        'A_tube' : A_tube,
+	        'A_bypass' : A_bypass,
+	        'A_duct_eff' : A_duct_eff,
+	        'A_diff' : A_diff,
+	        'Re' : Re}
+
 
 class BoundaryLayerSensitivity(Component):
 	
@@ -127,66 +184,11 @@ class BoundaryLayerSensitivity(Component):
 		                desc='Area after diffuser')
 		self.add_output('Re', val=0.0, desc='Reynolds Number')
 
+	kernel = staticmethod(boundary_layer_sensitivity_kernel)
+
 	def solve_nonlinear(self, params, unknowns, resids):
-		gam = params['gam']
-		BF = params['BF']
-		A_pod = params['A_pod']
-		L = params['L']
-		prc = params['prc']
-		p_tube = params['p_tube']
-		R = params['R']
-		T_ambient = params['T_ambient']
-		mu = params['mu']
-		M_duct = params['M_duct']
-		M_diff = params['M_diff']
-		cp = params['cp']
-		delta_star = params['delta_star']
-		M_pod = params['M_pod']
-
-		def mach_to_area(M1, M2, gam):
-			'''(A2/A1) = f(M2)/f(M1) where f(M) = (1/M)*((2/(gam+1))*(1+((gam-1)/2)*M**2))**((gam+1)/(2*(gam-1)))'''
-			A_ratio = (M1 / M2) * (((1.0 + ((gam - 1.0) / 2.0) * (M2**2.0)) /
-			                        (1.0 + ((gam - 1.0) / 2.0) * (M1**2.0)))**(
-			                            (gam + 1.0) / (2.0 * (gam - 1.0))))
-			return A_ratio
-
-		#Define intermediate variables
-		rho_inf = p_tube / (R *
-		                    T_ambient)  #Calculate density of free stream flow
-		U_inf = M_pod * (np.sqrt((gam * R * T_ambient)))        #Calculate velocity of free stream flow
-		r_pod = np.sqrt((A_pod / np.pi))  #Calculate pod radius
-
-		Re = (rho_inf * U_inf *
-		      L) / mu  #Calculate length based Reynolds Number
-
-
-		if params['length_calc']:
-			delta_star = (.04775*L)/(Re**.2)
-
-		A_diff = BF * A_pod  #Calculate diffuser output area based on blockage factor input
-
-		#Calculate inlet area. Inlet is necessary if free stream Mach number is greater than max compressore mach number M_diff
-		if M_pod > M_diff:
-		    A_inlet = A_diff * mach_to_area(M_diff, M_pod, gam)
-		else:
-		    A_inlet = A_diff
-
-		eps = mach_to_area(M_pod, M_duct, gam)
-		A_tube = (A_pod + np.pi * (((r_pod + delta_star)**2.0) - (r_pod**2.0)) -
-		          (eps * A_inlet)) / ((1.0 + (np.sqrt(eps))) * (1.0 - (np.sqrt(eps))))
-		pwr_comp = (rho_inf * U_inf * A_inlet) * cp * T_ambient * (1.0 + (
-		    (gam - 1) / 2.0) * (M_pod**2)) * ((prc**((gam - 1) / gam)) - 1)
-		A_bypass = A_tube - A_inlet
-		A_duct_eff = A_tube - A_pod - np.pi * ((
-		    (r_pod + delta_star)**2) - (r_pod**2))
-
-		unknowns['pwr_comp'] = pwr_comp
-		unknowns['A_inlet'] = A_inlet
-		unknowns['A_tube'] = A_tube
-		unknowns['A_bypass'] = A_bypass
-		unknowns['A_duct_eff'] = A_duct_eff
-		unknowns['A_diff'] = A_diff
-		unknowns['Re'] = Re
+		for name, val in boundary_layer_sensitivity_kernel(params).items():
+			unknowns[name] = val
 
 if __name__ == '__main__':
 
@@ -4,6 +4,24 @@ import numpy as np
 from math import sin, cos
 from openmdao.api import IndepVarComp, Component, Group, Problem
 
+def body_frame_acceleration_kernel(p):
+	'''
+	Vectorized BodyFrameAcceleration for a dict of params given as scalars
+	or arrays of samples, 'omega' and 'a_body' with the body axes on their
+	last dimension.
+	'''
+	omega = np.asarray(p['omega'], dtype=float)
+	v = np.asarray(p['v'], dtype=float)[..., None]
+	a_linear = np.asarray(p['a_linear'], dtype=float)[..., None]
+	L_pod = np.asarray(p['L_pod'], dtype=float)[..., None]
+
+	b1 = np.array([1.0, 0.0, 0.0])
+	r = -L_pod*b1
+
+	# Centripetal acceleration of the point r, omega x (omega x r), points
+	# towards the rotation axis
+	return {'a_body' : a_linear*b1 + v*np.cross(omega, b1) + np.cross(omega, np.cross(omega, r))}
+
 class BodyFrameAcceleration(Component):
 	''' 
 	Super sweet docs, bro
@@ -20,24 +38,19 @@ class BodyFrameAcceleration(Component):
 		self.add_param('a_linear', val = 9.81, desc = 'Pod linear acceleration', units = 'm/s**2')
 		self.add_param('L_pod', val = 20.5, desc = 'Pod yaw angle', units = 'rad')
 
-		self.add_output('a_body', val = np.matrix([[0.0], [0.0], [0.0]]), desc = 'Body fram acceleration vector', units = 'm/s**2')
+		self.add_output('a_body', val = np.zeros(3), desc = 'Body fram acceleration vector', units = 'm/s**2')
 
-	def solve_nonlinear(self, p, u, r):
+	kernel = staticmethod(body_frame_acceleration_kernel)
 
-		omega = p['omega']
-		v = p['v']
-		a_linear = p['a_linear']
-		L_pod = p['L_pod']
+	def solve_nonlinear(self, p, u, r):
 
 		#Calculate rotational matrix from inertial frame into the body frame
 		# BN = np.matrix([[cos(theta)*cos(psi), cos(theta)*sin*(psi), -sin(theta)], \
 		# 	[sin(phi)*sin(theta)*cos(psi) - cos(phi)*sin(psi), sin(phi)*sin(theta)*sin(psi) + cos(phi)*sin(psi), sin(phi)*cos(theta)], \
 		# 	[cos(phi)*sin(theta)*cos(psi) + sin(phi)*sin(psi), cos(phi)*sin(theta)*sin(psi) - sin(phi)*cos(psi), cos(phi)*cos(theta)]])
 
-		b1 = np.array([1.0, 0.0, 0.0])
-		r = -L_pod*b1
-
-		u['a_body'] = a_linear*b1 + v*np.cross(omega, b1) - np.cross(omega, np.cross(omega,r))
+		for name, val in body_frame_acceleration_kernel(p).items():
+			u[name] = val
 
 if __name__ == '__main__':
 
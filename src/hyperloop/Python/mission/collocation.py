@@ -0,0 +1,405 @@
+"""
+Direct collocation of the Magneplane equations of motion.
+
+The trajectory is transcribed with the trapezoidal rule on `num_nodes`
+nodes: the states x, y, z, v and the chosen controls (any of theta, psi and
+F_thrust) at every node, plus the final time when it is free, are the
+design variables, and the defects
+
+    X[i+1] - X[i] - h[i]/2*(f(i) + f(i+1)) = 0
+
+of the `MagneplaneEOM` rates f are equality constraints. Since every rate
+only depends on its own node, the constraint Jacobian has a few nonzeros per
+row and the Hessian of the Lagrangian is block diagonal plus a final time
+row. Both are assembled analytically as sparse matrices, so the problem is
+solved with scipy's `trust-constr` for thousands of nodes, without pointer.
+`trust-constr` needs scipy 1.1 or later. Older scipy can still build the
+problem and its derivatives, but not `solve` it.
+"""
+from __future__ import print_function, division
+
+from collections import OrderedDict
+
+import numpy as np
+from scipy.optimize import minimize
+from scipy.sparse import coo_matrix, diags
+
+try:
+    from scipy.optimize import Bounds, NonlinearConstraint
+except ImportError:  # scipy < 1.1, without trust-constr
+    Bounds = NonlinearConstraint = None
+STATES = ('x', 'y', 'z', 'v')
+CONTROLS = ('theta', 'psi', 'F_thrust')
+
+
+def magneplane_rates(v, theta, psi, F_thrust, F_drag, mass, g, c_drag=0.0):
+    """
+    Rates of the states x (north), y (east), z (down) and v, as in
+    `MagneplaneEOM`, with an optional aerodynamic drag c_drag*v**2 on top of
+    F_drag.
+    """
+    ctheta = np.cos(theta)
+    stheta = np.sin(theta)
+
+    return OrderedDict([('x', v*ctheta*np.cos(psi)),
+                        ('y', v*ctheta*np.sin(psi)),
+                        ('z', -v*stheta),
+                        ('v', -g*stheta + (F_thrust - F_drag - c_drag*v**2)/mass)])
+
+
+def magneplane_rate_partials(v, theta, psi, F_thrust, F_drag, mass, g, c_drag=0.0):
+    """
+    Partials of `magneplane_rates` with respect to v, theta, psi and
+    F_thrust, as {(state, variable) : array}. Missing entries are zero.
+    """
+    ctheta, stheta = np.cos(theta), np.sin(theta)
+    cpsi, spsi = np.cos(psi), np.sin(psi)
+
+    return {('x', 'v'): ctheta*cpsi,
+            ('x', 'theta'): -v*stheta*cpsi,
+            ('x', 'psi'): -v*ctheta*spsi,
+            ('y', 'v'): ctheta*spsi,
+            ('y', 'theta'): -v*stheta*spsi,
+            ('y', 'psi'): v*ctheta*cpsi,
+            ('z', 'v'): -stheta,
+            ('z', 'theta'): -v*ctheta,
+            ('v', 'v'): -2.0*c_drag*v/mass,
+            ('v', 'theta'): -g*ctheta,
+            ('v', 'F_thrust'): 1.0/mass}
+
+
+def magneplane_rate_hessians(v, theta, psi, F_thrust, F_drag, mass, g, c_drag=0.0):
+    """
+    Second partials of `magneplane_rates`, as {(state, var1, var2) : array}
+    with var1, var2 in the order of `STATES + CONTROLS`. Missing entries are
+    zero.
+    """
+    ctheta, stheta = np.cos(theta), np.sin(theta)
+    cpsi, spsi = np.cos(psi), np.sin(psi)
+
+    return {('x', 'v', 'theta'): -stheta*cpsi,
+            ('x', 'v', 'psi'): -ctheta*spsi,
+            ('x', 'theta', 'theta'): -v*ctheta*cpsi,
+            ('x', 'theta', 'psi'): v*stheta*spsi,
+            ('x', 'psi', 'psi'): -v*ctheta*cpsi,
+            ('y', 'v', 'theta'): -stheta*spsi,
+            ('y', 'v', 'psi'): ctheta*cpsi,
+            ('y', 'theta', 'theta'): -v*ctheta*spsi,
+            ('y', 'theta', 'psi'): -v*stheta*cpsi,
+            ('y', 'psi', 'psi'): -v*ctheta*spsi,
+            ('z', 'v', 'theta'): -ctheta,
+            ('z', 'theta', 'theta'): v*stheta,
+            ('v', 'v', 'v'): -2.0*c_drag/mass,
+            ('v', 'theta', 'theta'): g*stheta}
+
+
+class MagneplaneCollocation(object):
+    """
+    Optimal trajectory of the Magneplane pod by trapezoidal collocation.
+
+    Params
+    ------
+    num_nodes : int
+        Number of nodes, evenly spaced in time.
+    controls : tuple
+        Controls optimized at every node, any of 'theta', 'psi' and
+        'F_thrust'. The others are held at their value in `params`.
+    objective : str
+        'time' to minimize the final time, or 'energy' to minimize the
+        propulsive work, the integral of F_thrust*v (needs 'F_thrust' in
+        `controls`).
+    t_final : float
+        Final time in s, or None to optimize it within `bounds['t']`.
+    initial, final : dict
+        {state : value} of the states fixed at the first and last node.
+    bounds : dict
+        {variable : (lower, upper)} of states, controls and 't'.
+    ref : dict
+        {variable : reference magnitude} the design variables, defects and
+        the objective ('objective') are scaled by. Defaults to 1.
+    params : dict
+        Values of g (m/s**2), mass (kg), F_drag (N), c_drag (kg/m), theta,
+        psi (rad) and F_thrust (N) for the params that are not controls.
+
+    Notes
+    -----
+    A free final time is a design variable at every node, held equal by
+    linking constraints, rather than a single variable every defect depends
+    on. That keeps the KKT matrix banded, so its sparse factorization does
+    not fill in.
+    """
+
+    def __init__(self, num_nodes, controls=('theta',), objective='time', t_final=None,
+                 initial=None, final=None, bounds=None, ref=None, **params):
+        if objective not in ('time', 'energy'):
+            raise ValueError("objective must be 'time' or 'energy', not '%s'" % objective)
+        if objective == 'energy' and 'F_thrust' not in controls:
+            raise ValueError("the 'energy' objective needs 'F_thrust' in controls")
+        if objective == 'time' and t_final is not None:
+            raise ValueError("the 'time' objective needs a free final time")
+
+        self.num_nodes = n = num_nodes
+        self.controls = tuple(controls)
+        self.objective = objective
+        self.t_final = t_final
+        self.initial = dict(initial or {})
+        self.final = dict(final or {})
+        self.bounds = dict(bounds or {})
+        self.ref = dict(ref or {})
+
+        self.params = {'g': 9.80665, 'mass': 1000.0, 'F_drag': 0.0, 'c_drag': 0.0,
+                       'theta': 0.0, 'psi': 0.0, 'F_thrust': 0.0}
+        self.params.update(params)
+
+        # Design vector: each state and control at all nodes, then the final
+        # time at all nodes when it is free
+        self.variables = STATES + self.controls + (('t',) if t_final is None else ())
+        self.index = dict((name, slice(k*n, (k + 1)*n)) for k, name in enumerate(self.variables))
+        self.size = len(self.variables)*n
+        self.scale = np.repeat([self.ref.get(name, 1.0) for name in self.variables], n)
+
+        self.tau = np.linspace(0.0, 1.0, n)
+        self.dtau = np.diff(self.tau)
+
+        self._boundary = [(self.index[name].start, val, name) for name, val in sorted(self.initial.items())] + \
+                         [(self.index[name].stop - 1, val, name) for name, val in sorted(self.final.items())]
+        defects = STATES + (('t',) if t_final is None else ())
+        self.row_scale = np.concatenate([np.repeat([self.ref.get(s, 1.0) for s in defects], n - 1),
+                                         [self.ref.get(name, 1.0) for i, val, name in self._boundary]])
+        self.num_constraints = len(self.row_scale)
+
+    def _values(self, z):
+        # Node values of every param, state and control, and the final time
+        n = self.num_nodes
+        X = z*self.scale
+        vals = dict((name, self.params[name]*np.ones(n))
+                    for name in ('g', 'mass', 'F_drag', 'c_drag') + CONTROLS)
+        for name in self.variables:
+            vals[name] = X[self.index[name]]
+        if self.t_final is not None:
+            vals['t'] = self.t_final*np.ones(n)
+        args = (vals['v'], vals['theta'], vals['psi'], vals['F_thrust'], vals['F_drag'],
+                vals['mass'], vals['g'], vals['c_drag'])
+        return vals, args
+
+    def _col(self, name, i):
+        return self.index[name].start + i
+
+    def _symmetric(self, entries, scale):
+        # Symmetric sparse matrix from entries on one side of the diagonal
+        rows, cols, data = [np.concatenate(a) for a in zip(*entries)]
+        h = coo_matrix((data, (rows, cols)), shape=(self.size, self.size)).tocsr()
+        h = h + h.T - diags(h.diagonal())
+        D = diags(self.scale)
+        return (D*h*D/scale).tocsr()
+
+    def constraints(self, z):
+        """
+        Scaled defects, final time links and boundary conditions at the
+        scaled design vector z.
+        """
+        vals, args = self._values(z)
+        f = magneplane_rates(*args)
+        h = vals['t'][:-1]*self.dtau
+
+        c = [vals[s][1:] - vals[s][:-1] - h/2.0*(f[s][1:] + f[s][:-1]) for s in STATES]
+        if self.t_final is None:
+            c.append(np.diff(vals['t']))
+        c.append(np.array([vals[name][col - self.index[name].start] - val
+                           for col, val, name in self._boundary]))
+        return np.concatenate(c)/self.row_scale
+
+    def jacobian(self, z):
+        """
+        Sparse Jacobian of `constraints` with respect to z.
+        """
+        n = self.num_nodes
+        vals, args = self._values(z)
+        f = magneplane_rates(*args)
+        partials = magneplane_rate_partials(*args)
+        h = vals['t'][:-1]*self.dtau
+        i = np.arange(n - 1)
+        ones = np.ones(n - 1)
+
+        entries = []
+        for k, s in enumerate(STATES):
+            r = k*(n - 1) + i
+            entries += [(r, self._col(s, i + 1), ones), (r, self._col(s, i), -ones)]
+            for q in self.variables:
+                if (s, q) in partials:
+                    dfdq = partials[s, q]*np.ones(n)
+                    entries += [(r, self._col(q, i), -h/2.0*dfdq[:-1]),
+                                (r, self._col(q, i + 1), -h/2.0*dfdq[1:])]
+            if self.t_final is None:
+                entries.append((r, self._col('t', i), -self.dtau/2.0*(f[s][1:] + f[s][:-1])))
+        if self.t_final is None:
+            r = 4*(n - 1) + i
+            entries += [(r, self._col('t', i + 1), ones), (r, self._col('t', i), -ones)]
+        r = self.num_constraints - len(self._boundary) + np.arange(len(self._boundary))
+        entries.append((r, np.array([col for col, val, name in self._boundary], dtype=int),
+                        np.ones(len(self._boundary))))
+
+        rows, cols, data = [np.concatenate(a) for a in zip(*entries)]
+        J = coo_matrix((data, (rows, cols)), shape=(self.num_constraints, self.size))
+        return (diags(1.0/self.row_scale)*J*diags(self.scale)).tocsr()
+
+    def constraint_hessian(self, z, lmbda):
+        """
+        Sparse Hessian of lmbda . `constraints` with respect to z.
+        """
+        n = self.num_nodes
+        vals, args = self._values(z)
+        partials = magneplane_rate_partials(*args)
+        hessians = magneplane_rate_hessians(*args)
+        h = vals['t'][:-1]*self.dtau
+        i = np.arange(n - 1)
+        j = np.arange(n)
+
+        # Multipliers of the defects of each state, and the weight of its
+        # rate at each node in lmbda . defects
+        mu = dict((s, lmbda[k*(n - 1):(k + 1)*(n - 1)]/self.ref.get(s, 1.0))
+                  for k, s in enumerate(STATES))
+        w = dict((s, -(np.concatenate([[0.0], mu[s]*h]) + np.concatenate([mu[s]*h, [0.0]]))/2.0)
+                 for s in STATES)
+
+        entries = []
+        for (s, q1, q2), d2f in hessians.items():
+            if q1 in self.variables and q2 in self.variables:
+                entries.append((self._col(q1, j), self._col(q2, j), w[s]*d2f))
+        if self.t_final is None:
+            for (s, q), dfdq in partials.items():
+                if q in self.variables:
+                    dfdq = dfdq*np.ones(n)
+                    entries += [(self._col(q, i), self._col('t', i), -mu[s]*self.dtau/2.0*dfdq[:-1]),
+                                (self._col(q, i + 1), self._col('t', i), -mu[s]*self.dtau/2.0*dfdq[1:])]
+        return self._symmetric(entries, 1.0)
+
+    def objective_value(self, z):
+        """
+        Scaled objective at z.
+        """
+        vals, args = self._values(z)
+        if self.objective == 'time':
+            J = vals['t'][0]
+        else:
+            power = vals['F_thrust']*vals['v']
+            J = np.sum(vals['t'][:-1]*self.dtau/2.0*(power[1:] + power[:-1]))
+        return J/self.ref.get('objective', 1.0)
+
+    def objective_gradient(self, z):
+        """
+        Gradient of `objective_value` with respect to z.
+        """
+        vals, args = self._values(z)
+        grad = np.zeros(self.size)
+        if self.objective == 'time':
+            grad[self._col('t', 0)] = 1.0
+        else:
+            h = vals['t'][:-1]*self.dtau
+            weights = np.concatenate([h/2.0, [0.0]]) + np.concatenate([[0.0], h/2.0])
+            grad[self.index['F_thrust']] = weights*vals['v']
+            grad[self.index['v']] = weights*vals['F_thrust']
+            if self.t_final is None:
+                power = vals['F_thrust']*vals['v']
+                grad[self.index['t']][:-1] = self.dtau/2.0*(power[1:] + power[:-1])
+        return grad*self.scale/self.ref.get('objective', 1.0)
+
+    def objective_hessian(self, z):
+        """
+        Sparse Hessian of `objective_value` with respect to z.
+        """
+        n = self.num_nodes
+        vals, args = self._values(z)
+        entries = [(np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros(0))]
+        if self.objective == 'energy':
+            h = vals['t'][:-1]*self.dtau
+            weights = np.concatenate([h/2.0, [0.0]]) + np.concatenate([[0.0], h/2.0])
+            entries.append((self._col('v', np.arange(n)), self._col('F_thrust', np.arange(n)), weights))
+            if self.t_final is None:
+                i = np.arange(n - 1)
+                for q1, q2 in (('v', 'F_thrust'), ('F_thrust', 'v')):
+                    entries += [(self._col(q1, i), self._col('t', i), self.dtau/2.0*vals[q2][:-1]),
+                                (self._col(q1, i + 1), self._col('t', i), self.dtau/2.0*vals[q2][1:])]
+        return self._symmetric(entries, self.ref.get('objective', 1.0))
+
+    def guess(self, t_final=None, **values):
+        """
+        Initial design vector: states interpolated linearly between `initial`
+        and `final` (0 where not given), controls at their `params` value,
+        unless given in `values` as a scalar or an array over the nodes.
+        """
+        X = np.zeros(self.size)
+        for name in self.variables:
+            if name in values:
+                X[self.index[name]] = values[name]
+            elif name == 't':
+                X[self.index[name]] = t_final if t_final is not None else self.bounds.get('t', (1.0, 1.0))[1]
+            elif name in STATES:
+                start = self.initial.get(name, self.final.get(name, 0.0))
+                end = self.final.get(name, start)
+                X[self.index[name]] = start + self.tau*(end - start)
+            else:
+                X[self.index[name]] = self.params[name]
+        return X/self.scale
+
+    def solve(self, z0=None, **options):
+        """
+        Solves the problem from the scaled design vector z0 (default
+        `guess()`) with `trust-constr` and the given solver options.
+
+        Returns
+        -------
+        trajectory : OrderedDict
+            't' and every state and control at the nodes.
+        result : OptimizeResult
+            Result of `scipy.optimize.minimize`.
+        """
+        if NonlinearConstraint is None:
+            raise RuntimeError('MagneplaneCollocation.solve needs scipy 1.1 or later for trust-constr')
+        if z0 is None:
+            z0 = self.guess()
+
+        lower = -np.inf*np.ones(self.size)
+        upper = np.inf*np.ones(self.size)
+        for name, (lo, hi) in self.bounds.items():
+            if name in self.index:
+                lower[self.index[name]] = lo
+                upper[self.index[name]] = hi
+
+        constraint = NonlinearConstraint(self.constraints, 0.0, 0.0, jac=self.jacobian,
+                                         hess=self.constraint_hessian)
+        result = minimize(self.objective_value, z0, method='trust-constr',
+                          jac=self.objective_gradient, hess=self.objective_hessian,
+                          bounds=Bounds(lower/self.scale, upper/self.scale),
+                          constraints=[constraint], options=options)
+
+        vals, args = self._values(result.x)
+        trajectory = OrderedDict([('t', vals['t'][0]*self.tau)])
+        for name in STATES + self.controls:
+            trajectory[name] = vals[name]
+        return trajectory, result
+
+if __name__ == '__main__':
+    import time
+
+    #Brachistochrone of MagneplaneEOM from (0 m, 10 m up) to (10 m, 5 m up)
+    t0 = time.time()
+    brach = MagneplaneCollocation(1000, controls=('theta',), objective='time',
+                                  initial={'x': 0.0, 'y': 0.0, 'z': -10.0, 'v': 0.0},
+                                  final={'x': 10.0, 'z': -5.0},
+                                  bounds={'theta': (-1.57, 1.57), 'v': (0.0, np.inf),
+                                          't': (.5, 10.0)})
+    traj, result = brach.solve(brach.guess(t_final=2.0, theta=-.46), gtol=1e-8)
+    print('Brachistochrone time    %f s (%d nodes, %f s)' % (traj['t'][-1], brach.num_nodes,
+                                                            time.time() - t0))
+
+    #Least work to cover 1 km in 60 s from rest, with at most 2 m/s**2
+    t0 = time.time()
+    energy = MagneplaneCollocation(1000, controls=('F_thrust',), objective='energy', t_final=60.0,
+                                   initial={'x': 0.0, 'y': 0.0, 'z': 0.0, 'v': 0.0},
+                                   final={'x': 1000.0}, bounds={'F_thrust': (0.0, 2000.0)},
+                                   ref={'x': 1000.0, 'v': 10.0, 'F_thrust': 1000.0,
+                                        'objective': 1.0e5})
+    traj, result = energy.solve(energy.guess(v=1000.0/60.0, F_thrust=100.0), gtol=1e-8, maxiter=5000)
+    work = np.trapz(traj['F_thrust']*traj['v'], traj['t'])
+    print('Least work              %f J (%d nodes, %f s)' % (work, energy.num_nodes, time.time() - t0))
@@ -0,0 +1,292 @@
+"""
+Tiled, memory-mapped elevation store for routes of any extent.
+
+The elevation grid is cut into fixed-size square tiles on a global grid of
+nodes, anchored near (-90 deg, -180 deg) at an offset that lines it up with
+the first data written, so the tile holding a point only depends on the
+point and the grid. Each tile is a float32 `.npy` file in one directory,
+next to an `index.json` holding the resolution, the grid origin, the tile
+size and the tiles present. Tiles are memory-mapped on first use and
+kept in an LRU cache, so a lookup along a route never maps more than the
+tiles the route touches and memory stays bounded for any region size.
+
+Conversion can be done in chunks (`write_tiles` adds to an existing store),
+so inputs larger than memory can be converted too.
+"""
+from __future__ import print_function, division
+
+import json
+import os
+from collections import OrderedDict
+from itertools import islice
+
+import numpy as np
+
+TILE_SIZE = 256
+INDEX_FILE = 'index.json'
+
+# Mean earth radius for polyline distances, m
+R_EARTH = 6371.0e3
+
+
+def _tile_file(i, j):
+    return '%d_%d.npy' % (i, j)
+
+
+def _load_index(path):
+    with open(os.path.join(path, INDEX_FILE)) as f:
+        return json.load(f)
+
+
+def _tile_keys(node_i, node_j, tile_size):
+    # One integer per tile, to group points by tile with np.unique
+    return (node_i//tile_size).astype(np.int64)*2**32 + node_j//tile_size
+
+
+def write_tiles(path, lat, long, elev, resolution, tile_size=TILE_SIZE):
+    """
+    Adds grid points to the tile store in `path`, creating it if needed.
+
+    Params
+    ------
+    path : str
+        Directory of the tile store.
+    lat, long, elev : array
+        Latitude and longitude in deg and elevation in m of grid points, in
+        any order. Points are snapped to the nearest grid node.
+    resolution : float
+        Grid spacing in deg. Must match the store's if it already exists.
+    tile_size : int
+        Nodes along each side of a tile. Must match the store's if it
+        already exists.
+    """
+    if os.path.exists(os.path.join(path, INDEX_FILE)):
+        index = _load_index(path)
+        if index['resolution'] != resolution or index['tile_size'] != tile_size:
+            raise ValueError('%s holds tiles of %d nodes at %g deg, not %d nodes at %g deg' %
+                             (path, index['tile_size'], index['resolution'], tile_size, resolution))
+    else:
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        lat0 = np.ravel(lat)[0]
+        long0 = np.ravel(long)[0]
+        index = {'resolution' : resolution,
+                 'tile_size' : tile_size,
+                 'origin' : [-90.0 + np.mod(lat0 + 90.0, resolution),
+                             -180.0 + np.mod(long0 + 180.0, resolution)],
+                 'tiles' : []}
+
+    lat0, long0 = index['origin']
+    node_i = np.round((np.ravel(lat) - lat0)/resolution).astype(int)
+    node_j = np.round((np.ravel(long) - long0)/resolution).astype(int)
+    elev = np.asarray(elev, dtype=np.float32).ravel()
+
+    tiles = set(index['tiles'])
+    keys, inverse = np.unique(_tile_keys(node_i, node_j, tile_size), return_inverse=True)
+    for n in range(len(keys)):
+        mask = inverse == n
+        i = node_i[mask][0]//tile_size
+        j = node_j[mask][0]//tile_size
+        name = _tile_file(i, j)
+        filename = os.path.join(path, name)
+        if name in tiles:
+            tile = np.lib.format.open_memmap(filename, mode='r+')
+        else:
+            tile = np.lib.format.open_memmap(filename, mode='w+', dtype=np.float32,
+                                             shape=(tile_size, tile_size))
+            tile[:] = np.nan
+            tiles.add(name)
+        tile[node_i[mask] % tile_size, node_j[mask] % tile_size] = elev[mask]
+        tile.flush()
+        del tile
+
+    index['tiles'] = sorted(tiles)
+    with open(os.path.join(path, INDEX_FILE), 'w') as f:
+        json.dump(index, f, indent=2)
+
+
+def convert_usgs_text(filename, path, resolution, tile_size=TILE_SIZE, chunk_rows=1000000):
+    """
+    Converts a USGS text export (a header line, then 'long,lat,elev' rows)
+    into a tile store, `chunk_rows` rows at a time.
+    """
+    with open(filename) as f:
+        f.readline()
+        while True:
+            lines = list(islice(f, chunk_rows))
+            if not lines:
+                break
+            data = np.loadtxt(lines, delimiter=',', ndmin=2)
+            write_tiles(path, data[:, 1], data[:, 0], data[:, 2], resolution, tile_size)
+
+
+def convert_npz(filename, path, tile_size=TILE_SIZE):
+    """
+    Converts a grid saved by usgs_data_converter.py (Elevation indexed
+    [lat, long]) into a tile store.
+    """
+    usgs_file = np.load(filename)
+    long, lat = np.meshgrid(usgs_file['Longitude'], usgs_file['Latitude'])
+    lats = usgs_file['Latitude']
+    resolution = float((lats[-1] - lats[0])/(len(lats) - 1))
+    write_tiles(path, lat, long, usgs_file['Elevation'], resolution, tile_size)
+
+
+class DEMTiles(object):
+    """
+    Reads elevations from a tile store.
+
+    Params
+    ------
+    path : str
+        Directory of the tile store.
+    cache_size : int
+        Most tiles kept mapped at once. The least recently used tile is
+        unmapped when another one is needed.
+
+    Notes
+    -----
+    Elevations are bilinear in the grid nodes. Points over missing tiles or
+    missing nodes are nan. `ev` has the signature of
+    `RectBivariateSpline.ev` with longitude as x, so a DEMTiles can stand
+    in for the terrain spline.
+    """
+
+    def __init__(self, path, cache_size=64):
+        self.path = path
+        self.cache_size = cache_size
+
+        index = _load_index(path)
+        self.resolution = index['resolution']
+        self.tile_size = index['tile_size']
+        self.origin = index['origin']
+        self.tiles = set(index['tiles'])
+
+        self._cache = OrderedDict()
+        self.loads = 0
+
+    def tile(self, i, j):
+        """
+        Returns the memory-mapped tile (i, j), or None if it is not in the
+        store.
+        """
+        name = _tile_file(i, j)
+        if name in self._cache:
+            self._cache[name] = tile = self._cache.pop(name)
+            return tile
+        if name not in self.tiles:
+            return None
+
+        tile = np.load(os.path.join(self.path, name), mmap_mode='r')
+        self.loads += 1
+        self._cache[name] = tile
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return tile
+
+    def nodes(self, node_i, node_j):
+        """
+        Elevation at integer grid nodes, nan where there is no data.
+        """
+        ts = self.tile_size
+        elev = np.empty(node_i.shape)
+        elev.fill(np.nan)
+        keys, inverse = np.unique(_tile_keys(node_i, node_j, ts), return_inverse=True)
+        inverse = inverse.reshape(node_i.shape)
+        for n in range(len(keys)):
+            mask = inverse == n
+            tile = self.tile(node_i[mask][0]//ts, node_j[mask][0]//ts)
+            if tile is not None:
+                elev[mask] = tile[node_i[mask] % ts, node_j[mask] % ts]
+        return elev
+
+    def ev(self, long, lat, dx=0, dy=0):
+        """
+        Elevation at points (long, lat) in deg, or with dx=1 / dy=1 its
+        first derivative along longitude / latitude in m/deg.
+        """
+        fi = (np.asarray(lat, dtype=float) - self.origin[0])/self.resolution
+        fj = (np.asarray(long, dtype=float) - self.origin[1])/self.resolution
+        # Points on a grid line only use the nodes on that line, so lookups at
+        # the edge of the data are not nan
+        fi = np.where(np.abs(fi - np.round(fi)) < 1e-6, np.round(fi), fi)
+        fj = np.where(np.abs(fj - np.round(fj)) < 1e-6, np.round(fj), fj)
+        i = np.floor(fi).astype(int)
+        j = np.floor(fj).astype(int)
+        wi = fi - i
+        wj = fj - j
+
+        #all four corners in one pass, so each tile is mapped once per call
+        corners = self.nodes(np.array([i, i, i + 1, i + 1]), np.array([j, j + 1, j, j + 1]))
+        e00, e01, e10, e11 = corners
+        if not dy:
+            e10 = np.where(wi == 0.0, 0.0, e10)
+            e11 = np.where(wi == 0.0, 0.0, e11)
+        if not dx:
+            e01 = np.where(wj == 0.0, 0.0, e01)
+            e11 = np.where(wj == 0.0, 0.0, e11)
+
+        if dx:
+            return ((1.0 - wi)*(e01 - e00) + wi*(e11 - e10))/self.resolution
+        if dy:
+            return ((1.0 - wj)*(e10 - e00) + wj*(e11 - e01))/self.resolution
+        return (1.0 - wi)*((1.0 - wj)*e00 + wj*e01) + wi*((1.0 - wj)*e10 + wj*e11)
+
+    def elevation(self, lat, long):
+        """
+        Elevation in m at points (lat, long) in deg.
+        """
+        return self.ev(long, lat)
+
+    def profile(self, lat, long, spacing=100.0):
+        """
+        Elevation profile along a polyline.
+
+        Params
+        ------
+        lat, long : array
+            Vertices of the polyline in deg.
+        spacing : float
+            Largest distance between samples in m. Every vertex is sampled.
+
+        Returns
+        -------
+        s, lat, long, elev : array
+            Distance along the polyline in m, position in deg and elevation
+            in m of each sample.
+        """
+        lat = np.asarray(lat, dtype=float)
+        long = np.asarray(long, dtype=float)
+
+        #haversine length of each leg
+        phi = np.radians(lat)
+        a = np.sin(np.diff(phi)/2.0)**2 + \
+            np.cos(phi[:-1])*np.cos(phi[1:])*np.sin(np.radians(np.diff(long))/2.0)**2
+        legs = 2.0*R_EARTH*np.arcsin(np.sqrt(a))
+
+        n = np.maximum(np.ceil(legs/spacing).astype(int), 1)
+        leg = np.repeat(np.arange(len(legs)), n)
+        frac = np.concatenate([np.arange(k)/float(k) for k in n])
+
+        s = np.append(np.concatenate([[0.0], np.cumsum(legs)])[leg] + frac*legs[leg], np.sum(legs))
+        lat_s = np.append(lat[leg] + frac*(lat[leg + 1] - lat[leg]), lat[-1])
+        long_s = np.append(long[leg] + frac*(long[leg + 1] - long[leg]), long[-1])
+
+        return s, lat_s, long_s, self.elevation(lat_s, long_s)
+
+if __name__ == '__main__':
+    import tempfile
+
+    mydir = os.path.dirname(os.path.realpath(__file__))
+    path = os.path.join(tempfile.mkdtemp(), 'usgs_tiles')
+    convert_npz(os.path.join(mydir, 'usgs_data.npz'), path, tile_size=128)
+
+    dem = DEMTiles(path, cache_size=4)
+
+    #San Francisco to Los Angeles
+    s, lat, long, elev = dem.profile([37.77, 36.6, 34.05], [-122.0 + .01, -120.5, -118.25], spacing=500.0)
+
+    print('Tiles in store            %d' % len(dem.tiles))
+    print('Tiles loaded              %d' % dem.loads)
+    print('Route length              %f km' % (s[-1]/1.0e3))
+    print('Highest point             %f m' % np.nanmax(elev))
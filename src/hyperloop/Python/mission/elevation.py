@@ -0,0 +1,40 @@
+"""
+Terrain elevation lookup shared by the trajectory and the route tools.
+
+Kept apart from terrain.py, whose components need pointer, so that the NumPy
+route tools (route_profile.py, route_search.py) can read the elevation data
+without it.
+"""
+from __future__ import print_function, division
+
+import os
+
+import numpy as np
+from scipy import interpolate
+
+from hyperloop.Python.mission.dem_tiles import DEMTiles
+
+USGS_DATA = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'usgs_data.npz')
+
+# Interpolants already built, by data file, shared by every TerrainElevationComp
+# in the process
+_interpolants = {}
+
+def terrain_interpolant(data_file_path=USGS_DATA):
+    '''
+    Returns the elevation interpolant of `data_file_path` (Longitude as x,
+    Latitude as y), loading the file and fitting the spline on first use
+    only. A directory is read as a tile store (see dem_tiles.py), which only
+    maps the tiles that are looked up.
+    '''
+    data_file_path = os.path.realpath(data_file_path)
+    if data_file_path not in _interpolants:
+        if os.path.isdir(data_file_path):
+            _interpolants[data_file_path] = DEMTiles(data_file_path)
+        else:
+            # Elevation is stored [lat, long]
+            usgs_file = np.load(data_file_path)
+            _interpolants[data_file_path] = interpolate.RectBivariateSpline(usgs_file['Longitude'],
+                                                                            usgs_file['Latitude'],
+                                                                            usgs_file['Elevation'].T)
+    return _interpolants[data_file_path]
@@ -25,8 +25,6 @@ class MagneplaneEOM(EOMComp):
     def __init__(self, grid_data):
         super(MagneplaneEOM, self).__init__(grid_data, time_units='s')
 
-        self.deriv_options['type'] = 'fd'
-
         nn = grid_data['num_nodes']
 
         self.add_param('x',
@@ -95,3 +93,44 @@ class MagneplaneEOM(EOMComp):
         unknowns['dXdt:x'][:] = v*ctheta*np.cos(psi)
         unknowns['dXdt:y'][:] = v*ctheta*np.sin(psi)
         unknowns['dXdt:z'][:] = -v*stheta
+
+    def linearize(self, params, unknowns, resids):
+        """ Each node only depends on the params at the same node, so every
+        partial is diagonal.
+        """
+
+        theta = params['theta']
+        psi = params['psi']
+
+        ctheta = np.cos(theta)
+        stheta = np.sin(theta)
+        cpsi = np.cos(psi)
+        spsi = np.sin(psi)
+
+        g = params['g']
+        v = params['v']
+
+        T = params['F_thrust']
+        D = params['F_drag']
+        mass = params['mass']
+
+        J = {}
+
+        J['dXdt:v', 'g'] = np.diag(-stheta)
+        J['dXdt:v', 'theta'] = np.diag(-g*ctheta)
+        J['dXdt:v', 'F_thrust'] = np.diag(1.0/mass)
+        J['dXdt:v', 'F_drag'] = np.diag(-1.0/mass)
+        J['dXdt:v', 'mass'] = np.diag(-(T-D)/mass**2)
+
+        J['dXdt:x', 'v'] = np.diag(ctheta*cpsi)
+        J['dXdt:x', 'theta'] = np.diag(-v*stheta*cpsi)
+        J['dXdt:x', 'psi'] = np.diag(-v*ctheta*spsi)
+
+        J['dXdt:y', 'v'] = np.diag(ctheta*spsi)
+        J['dXdt:y', 'theta'] = np.diag(-v*stheta*spsi)
+        J['dXdt:y', 'psi'] = np.diag(v*ctheta*cpsi)
+
+        J['dXdt:z', 'v'] = np.diag(-stheta)
+        J['dXdt:z', 'theta'] = np.diag(-v*ctheta)
+
+        return J
@@ -0,0 +1,104 @@
+"""
+Conversions between a local north-east frame and latitude/longitude.
+
+x is the distance north of the origin along the meridian and y the
+distance east along the parallel of the point, both in km, on a sphere of
+radius Re or on an ellipsoid such as WGS-84. The conversions are exact
+inverses of each other and take arrays of any shape, so a whole track is
+converted in one call.
+"""
+from __future__ import print_function, division
+
+import numpy as np
+
+# Semi-major axis in km and flattening
+WGS84 = (6378.137, 1.0/298.257223563)
+
+# Newton steps of the inverse meridian arc, each one about squares the error
+NEWTON_STEPS = 4
+
+
+def meridian_arc(lat, ellipsoid=WGS84):
+    """
+    Distance in km from the equator to latitude `lat` in deg along a
+    meridian of `ellipsoid` (Helmert's series, well under a mm).
+    """
+    a, f = ellipsoid
+    n = f/(2.0 - f)
+    phi = np.radians(lat)
+    return a/(1.0 + n)*((1.0 + n**2/4.0 + n**4/64.0)*phi -
+                        1.5*(n - n**3/8.0)*np.sin(2.0*phi) +
+                        15.0/16.0*(n**2 - n**4/4.0)*np.sin(4.0*phi) -
+                        35.0/48.0*n**3*np.sin(6.0*phi) +
+                        315.0/512.0*n**4*np.sin(8.0*phi))
+
+
+def _radii(phi, ellipsoid):
+    # Meridian and prime vertical radii of curvature at latitude phi in rad
+    a, f = ellipsoid
+    e2 = f*(2.0 - f)
+    w2 = 1.0 - e2*np.sin(phi)**2
+    return a*(1.0 - e2)/w2**1.5, a/np.sqrt(w2)
+
+
+def ned_to_lat_long(x, y, Re=6378.137, lon_origin=-121.0, lat_origin=35.0, ellipsoid=None):
+    """
+    Latitude and longitude in deg of points x (north) and y (east) in km
+    from the origin.
+
+    Params
+    ------
+    x, y : array
+        North and east distances in km.
+    Re : float
+        Radius of the sphere in km, when `ellipsoid` is None.
+    lon_origin, lat_origin : float
+        Origin in deg.
+    ellipsoid : tuple
+        (semi-major axis in km, flattening), e.g. WGS84. None for a sphere.
+    """
+    if ellipsoid is None:
+        lat_rad = np.radians(lat_origin) + x/Re
+        long_rad = np.radians(lon_origin) + y/(Re*np.cos(lat_rad))
+        return np.degrees(lat_rad), np.degrees(long_rad)
+
+    # Latitude whose meridian arc is x past the origin's
+    arc = meridian_arc(lat_origin, ellipsoid) + x
+    phi = np.radians(lat_origin) + x/ellipsoid[0]
+    for i in range(NEWTON_STEPS):
+        phi = phi + (arc - meridian_arc(np.degrees(phi), ellipsoid))/_radii(phi, ellipsoid)[0]
+
+    N = _radii(phi, ellipsoid)[1]
+    return np.degrees(phi), lon_origin + np.degrees(y/(N*np.cos(phi)))
+
+
+def lat_long_to_ned(lat, long, Re=6378.137, lon_origin=-121.0, lat_origin=35.0, ellipsoid=None):
+    """
+    Inverse of `ned_to_lat_long`: x (north) and y (east) in km of points
+    (lat, long) in deg.
+    """
+    phi = np.radians(lat)
+    dlong = np.radians(np.asarray(long) - lon_origin)
+    if ellipsoid is None:
+        return (phi - np.radians(lat_origin))*Re, dlong*Re*np.cos(phi)
+
+    N = _radii(phi, ellipsoid)[1]
+    return meridian_arc(lat, ellipsoid) - meridian_arc(lat_origin, ellipsoid), dlong*N*np.cos(phi)
+
+if __name__ == '__main__':
+    import time
+
+    n = 1000000
+    x = np.linspace(-500.0, 500.0, n)
+    y = np.linspace(300.0, -300.0, n)
+
+    for name, ellipsoid in (('Sphere', None), ('WGS-84', WGS84)):
+        t0 = time.time()
+        lat, long = ned_to_lat_long(x, y, ellipsoid=ellipsoid)
+        x2, y2 = lat_long_to_ned(lat, long, ellipsoid=ellipsoid)
+        elapsed = time.time() - t0
+
+        print('%s: %d points there and back in %f s, round trip error %g m' %
+              (name, n, elapsed, 1.0e3*max(np.abs(x2 - x).max(), np.abs(y2 - y).max())))
+
+    print('Equator to pole on WGS-84: %f km' % meridian_arc(90.0))
@@ -4,9 +4,16 @@ import numpy as np
 from openmdao.api import IndepVarComp, Component, Group, Problem
 from pointer.components import EOMComp
 
+from hyperloop.Python.mission.geodesy import ned_to_lat_long
+
 class LatLong(EOMComp):
+	'''
+	Latitude and longitude of NED positions, see geodesy.py. With
+	`ellipsoid` (e.g. geodesy.WGS84) the earth is an ellipsoid instead of
+	a sphere of radius Re.
+	'''
 
-	def __init__(self, grid_data, Re=6378.137, lon_origin=-121.0, lat_origin=35.0):
+	def __init__(self, grid_data, Re=6378.137, lon_origin=-121.0, lat_origin=35.0, ellipsoid=None):
 		super(LatLong, self).__init__(grid_data, time_units='s')
 
 		nn = grid_data['num_nodes']
@@ -17,22 +24,14 @@ class LatLong(EOMComp):
 		self._Re = Re
 		self._lon_origin = lon_origin
 		self._lat_origin = lat_origin
+		self._ellipsoid = ellipsoid
 
 		self.add_output('lat', shape=(nn,), desc='Latitude at input coordinate', units='deg')
 		self.add_output('long', shape=(nn,), desc='Longitude at an input coordinate', units='deg')
 
 	def solve_nonlinear(self, p, u, r):
-		x = p['x']
-		y = p['y']
-
-		lat_origin_rad = self._lat_origin * (np.pi/180.0)
-		long_origin_rad = self._lon_origin * (np.pi/180.0)
-
-		lat_rad = lat_origin_rad + (x/self._Re)
-		long_rad = long_origin_rad + (y/(self._Re*np.cos(lat_rad)))
-
-		u['lat'] = lat_rad*(180.0/np.pi)
-		u['long'] = long_rad*(180.0/np.pi)
+		u['lat'], u['long'] = ned_to_lat_long(p['x'], p['y'], self._Re, self._lon_origin,
+		                                      self._lat_origin, self._ellipsoid)
 
 if __name__ == '__main__':
 	top = Problem()
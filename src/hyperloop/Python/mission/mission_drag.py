@@ -4,6 +4,17 @@ from math import pi, sqrt
 from openmdao.api import IndepVarComp, Component, Group, Problem, ExecComp
 
 
+def mission_drag_kernel(p):
+    """
+    Vectorized MissionDrag. Evaluates D = .5*rho*(V**2)*S + D_magnetic for
+    a dict of params given as scalars or arrays of design points.
+    """
+
+    #Calculate air density and drag force
+    rho = p['p_tube'] / (p['R'] * p['T_ambient'])
+    return {'D' : (.5 * rho * (p['V']**2) * p['S']) + p['D_magnetic']}
+
+
 class MissionDrag(Component):
     """
 
@@ -64,6 +75,8 @@ class MissionDrag(Component):
 
         self.add_output('D', val=0.0, units='N', desc='Drag Force')
 
+    kernel = staticmethod(mission_drag_kernel)
+
     def solve_nonlinear(self, params, unknowns, resids):
         """
 
@@ -99,10 +112,8 @@ class MissionDrag(Component):
 
         """
 
-        #Calculate air density and drag force
-        rho = params['p_tube'] / (params['R'] * params['T_ambient'])
-        unknowns['D'] = (.5 * rho *
-                         (params['V']**2) * params['S']) + params['D_magnetic']
+        for name, val in mission_drag_kernel(params).items():
+            unknowns[name] = val
 
 
 if __name__ == '__main__':
@@ -1,9 +1,24 @@
 from __future__ import print_function
 
-from math import pi, sqrt, sin
+from math import pi, sqrt
+
+import numpy as np
 from openmdao.api import IndepVarComp, Component, Group, Problem, ExecComp
 
 
+def mission_thrust_kernel(p):
+    """
+    Vectorized MissionThrust. Evaluates
+    T = m*g*(1+sin(theta)) + .5*Cd*rho*(V**2)*S + D_magnetic for a dict of
+    params given as scalars or arrays of design points.
+    """
+
+    #Calculate air density and drag force
+    rho = p['p_tube'] / (p['R'] * p['T_ambient'])
+    return {'Thrust' : (p['m_pod'] * p['g']) * (1 + np.sin(p['theta'])) +
+                       .5 * p['Cd'] * rho * p['S'] * (p['V']**2) + p['D_magnetic']}
+
+
 class MissionThrust(Component):
     """
 
@@ -77,6 +92,8 @@ class MissionThrust(Component):
 
         self.add_output('Thrust', val=0.0, units='N', desc='Thrust Force')
 
+    kernel = staticmethod(mission_thrust_kernel)
+
     def solve_nonlinear(self, params, unknowns, resids):
         """
         Notes
@@ -116,18 +133,8 @@ class MissionThrust(Component):
             Total thrust force acting on pod. Default value is 0.0.
         """
 
-        m_pod = params['m_pod']
-        g = params['g']
-        theta = params['theta']
-        Cd = params['Cd']
-        S = params['S']
-        V = params['V']
-        D_magnetic = params['D_magnetic']
-
-        #Calculate air density and drag force
-        rho = params['p_tube'] / (params['R'] * params['T_ambient'])
-        unknowns['Thrust'] = (m_pod * g) * (
-            1 + sin(theta)) + .5 * Cd * rho * S * (V**2) + D_magnetic
+        for name, val in mission_thrust_kernel(params).items():
+            unknowns[name] = val
 
 
 if __name__ == '__main__':
@@ -0,0 +1,125 @@
+"""
+Passenger loads along a whole trajectory.
+
+`ride_comfort` evaluates the `AngularVelocity321` and
+`BodyFrameAcceleration` kernels on full time histories at once, takes the
+jerk from the acceleration history and flags every sample where either
+exceeds its comfort limit, so a route of 10^5 samples is checked in
+milliseconds instead of one Problem run per sample.
+"""
+from __future__ import print_function, division
+
+from collections import OrderedDict
+
+import numpy as np
+
+from hyperloop.Python.angular_velocity321 import angular_velocity321_kernel
+from hyperloop.Python.mission.body_frame_acceleration import body_frame_acceleration_kernel
+
+# Comfort limits along the body x (forward), y (right) and z (down) axes:
+# .5 g longitudinal as in Hyperloop Alpha, .15 g lateral and vertical and
+# 2 m/s**3 of jerk as in high speed rail practice
+A_MAX = np.array([4.905, 1.4715, 1.4715])
+JERK_MAX = np.array([2.0, 2.0, 2.0])
+
+
+def time_derivative(y, t):
+    """
+    Derivative of `y` along its first axis with respect to times `t`,
+    second order at unevenly spaced samples. A repeated time marks a jump
+    (e.g. an event of `RouteSimulator`), and each side of it is
+    differentiated one-sided.
+    """
+    y = np.asarray(y, dtype=float)
+    t = np.asarray(t, dtype=float)
+    shape = (-1,) + (1,)*(y.ndim - 1)
+
+    # Steps to the previous and next sample, 0 at the ends and at jumps
+    h1 = np.concatenate([[0.0], np.diff(t)]).reshape(shape)
+    h2 = np.concatenate([np.diff(t), [0.0]]).reshape(shape)
+    y0 = np.concatenate([y[:1], y[:-1]])
+    y2 = np.concatenate([y[1:], y[-1:]])
+
+    both = (h1 > 0.0) & (h2 > 0.0)
+    h1s = np.where(h1 > 0.0, h1, 1.0)
+    h2s = np.where(h2 > 0.0, h2, 1.0)
+    central = (h1s**2*(y2 - y) + h2s**2*(y - y0))/(h1s*h2s*(h1s + h2s))
+    one_sided = np.where(h2 > 0.0, (y2 - y)/h2s, np.where(h1 > 0.0, (y - y0)/h1s, 0.0))
+    return np.where(both, central, one_sided)
+
+
+def ride_comfort(t, psi, theta, phi, psi_dot, theta_dot, phi_dot, v, a_linear, L_pod=20.5,
+                 a_max=A_MAX, jerk_max=JERK_MAX):
+    """
+    Body frame acceleration and jerk of the pod along a trajectory.
+
+    Params
+    ------
+    t : array
+        Time in s, non decreasing.
+    psi, theta, phi : array
+        321 Euler angles (yaw, pitch, roll) in rad.
+    psi_dot, theta_dot, phi_dot : array
+        Their rates in rad/s.
+    v : array
+        Pod speed in m/s.
+    a_linear : array
+        Pod acceleration along its path in m/s**2.
+    L_pod : float
+        Pod length in m, as in `BodyFrameAcceleration`.
+    a_max, jerk_max : array
+        Largest comfortable acceleration (m/s**2) and jerk (m/s**3) along
+        each body axis.
+
+    Returns
+    -------
+    comfort : OrderedDict
+        'omega_b' angular velocity (rad/s), 'a_body' acceleration (m/s**2)
+        and 'jerk' (m/s**3), each of shape (n, 3), 'a_exceed' and
+        'jerk_exceed' flags of the same shape and 'exceed', true where any
+        limit is exceeded.
+    """
+    omega = angular_velocity321_kernel({'psi': psi, 'theta': theta, 'phi': phi,
+                                        'psi_dot': psi_dot, 'theta_dot': theta_dot,
+                                        'phi_dot': phi_dot})['omega_b']
+    a_body = body_frame_acceleration_kernel({'omega': omega, 'v': v, 'a_linear': a_linear,
+                                             'L_pod': L_pod})['a_body']
+
+    # Constant inputs come out of the kernels as a single sample
+    ones = np.ones((len(t), 1))
+    omega = omega*ones
+    a_body = a_body*ones
+    jerk = time_derivative(a_body, t)
+
+    a_exceed = np.abs(a_body) > a_max
+    jerk_exceed = np.abs(jerk) > jerk_max
+
+    return OrderedDict([('omega_b', omega),
+                        ('a_body', a_body),
+                        ('jerk', jerk),
+                        ('a_exceed', a_exceed),
+                        ('jerk_exceed', jerk_exceed),
+                        ('exceed', np.any(a_exceed | jerk_exceed, axis=-1))])
+
+if __name__ == '__main__':
+    import time
+
+    #Cruise at 300 m/s through a 40 km radius curve with 10 s spirals, then
+    #brake at 1 m/s**2 all at once
+    n = 100000
+    t = np.linspace(0.0, 200.0, n)
+    v = 300.0*np.ones(n)
+    psi_dot = v/40.0e3*np.clip((t - 50.0)/10.0, 0.0, 1.0)*np.clip((160.0 - t)/10.0, 0.0, 1.0)
+    a_linear = -1.0*(t > 180.0)
+    psi = np.concatenate([[0.0], np.cumsum(.5*(psi_dot[1:] + psi_dot[:-1])*np.diff(t))])
+
+    t0 = time.time()
+    comfort = ride_comfort(t, psi, 0.0, 0.0, psi_dot, 0.0, 0.0, v, a_linear)
+    elapsed = time.time() - t0
+
+    print('Samples                 %d' % n)
+    print('Max lateral accel       %f m/s**2' % np.abs(comfort['a_body'][:, 1]).max())
+    print('Max lateral jerk        %f m/s**3' % np.abs(comfort['jerk'][:, 1]).max())
+    print('Samples over a limit    %d' % comfort['exceed'].sum())
+    print('First one at            %f s' % t[np.argmax(comfort['exceed'])])
+    print('Evaluated in            %f s' % elapsed)
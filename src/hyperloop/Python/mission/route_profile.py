@@ -0,0 +1,202 @@
+"""
+Terrain profile and construction cost of a route.
+
+`profile_route` samples the terrain along a lat/long polyline, lays a grade
+limited track over it and splits the route into short segments, each one
+elevated on pylons, in a tunnel or submerged. `route_cost` then prices all
+segments at once with the batch kernels of `TubeAndPylon`, `SubmergedTube`
+and `TunnelCost`, instead of typing a single pylon height, land length and
+water length into the trade scripts.
+"""
+from __future__ import print_function, division
+
+from collections import OrderedDict
+
+import numpy as np
+
+from hyperloop.Python.mission.geodesy import ned_to_lat_long, lat_long_to_ned
+from hyperloop.Python.mission.elevation import terrain_interpolant, USGS_DATA
+from hyperloop.Python.tools.batch import batch_evaluate
+from hyperloop.Python.tube.submerged_tube import SubmergedTube
+from hyperloop.Python.tube.tube_and_pylon import TubeAndPylon
+from hyperloop.Python.tube.tunnel_cost import TunnelCost
+
+ELEVATED, TUNNEL, SUBMERGED = 0, 1, 2
+
+
+def grade_limited(z, s, max_grade):
+    """
+    Highest profile at or below `z` whose grade never exceeds `max_grade`,
+    i.e. the lower envelope of cones of slope `max_grade` on every sample.
+    """
+    # min over j <= i of z[j] + max_grade*(s[i] - s[j]), then the same over j >= i
+    gs = max_grade*np.asarray(s, dtype=float)
+    z = np.minimum.accumulate(np.asarray(z, dtype=float) - gs) + gs
+    return np.minimum.accumulate((z + gs)[::-1])[::-1] - gs
+
+
+def track_profile(z_min, z_max, s, max_grade):
+    """
+    Grade limited track that stays at or above `z_min` wherever it can
+    without rising over `z_max`.
+
+    The lowest profile at or above `z_min` bridges every valley and climbs
+    every hill. It is cut down to `z_max`, and the grade limited profile
+    below that leaves `z_min` only where the two cannot both be met.
+    """
+    z_up = -grade_limited(-np.asarray(z_min, dtype=float), s, max_grade)
+    return grade_limited(np.minimum(z_up, z_max), s, max_grade)
+
+
+def profile_route(lat, long, spacing=100.0, data_file_path=USGS_DATA, h_min=10.0,
+                  h_max=50.0, depth=10.0, max_grade=.02, Re=6378.137, ellipsoid=None):
+    """
+    Segments a route and classifies each segment.
+
+    Params
+    ------
+    lat, long : array
+        Vertices of the route in deg.
+    spacing : float
+        Largest segment length in m.
+    data_file_path : str
+        Elevation data, as accepted by `terrain_interpolant`.
+    h_min : float
+        Lowest pylon height over land, in m.
+    h_max : float
+        Tallest pylon allowed, in m. Valleys are bridged on pylons up to
+        this height.
+    depth : float
+        Depth the track aims for under water, in m.
+    max_grade : float
+        Steepest track grade allowed (rise over run). The track cuts through
+        terrain it cannot climb over within `h_max` in tunnels.
+    Re : float
+        Earth radius in km, as in `LatLong`.
+    ellipsoid : tuple
+        Earth ellipsoid (e.g. geodesy.WGS84) used instead of the sphere.
+
+    Returns
+    -------
+    profile : OrderedDict
+        One entry per segment:
+        's' distance from the start to the segment start (m), 'length' (m),
+        'lat', 'long' (deg), 'elev' terrain elevation (m), 'z' track
+        elevation (m), 'grade' (rad), 'kind' (ELEVATED, TUNNEL or SUBMERGED),
+        'h' pylon height (m, elevated only), 'depth' below the water surface
+        or the ground (m, submerged and tunnel only).
+    """
+    lat = np.asarray(lat, dtype=float)
+    long = np.asarray(long, dtype=float)
+
+    # Straight legs in the local north-east frame of the first vertex
+    x, y = lat_long_to_ned(lat, long, Re, long[0], lat[0], ellipsoid)
+    legs = np.hypot(np.diff(x), np.diff(y))*1.0e3
+
+    n = np.maximum(np.ceil(legs/spacing).astype(int), 1)
+    leg = np.repeat(np.arange(len(legs)), n)
+    frac = np.concatenate([np.arange(k)/float(k) for k in n])
+
+    s = np.append(np.concatenate([[0.0], np.cumsum(legs)])[leg] + frac*legs[leg], np.sum(legs))
+    x = np.append(x[leg] + frac*(x[leg + 1] - x[leg]), x[-1])
+    y = np.append(y[leg] + frac*(y[leg + 1] - y[leg]), y[-1])
+    lat_s, long_s = ned_to_lat_long(x, y, Re, long[0], lat[0], ellipsoid)
+
+    elev = terrain_interpolant(data_file_path).ev(long_s, lat_s)
+    water = elev <= 0.0
+
+    z = track_profile(np.where(water, -depth, elev + h_min),
+                      np.where(water, -depth, elev + h_max), s, max_grade)
+
+    # Segment values at the midpoints
+    mid = lambda a: .5*(a[1:] + a[:-1])
+    length = np.diff(s)
+    elev_m = mid(elev)
+    z_m = mid(z)
+    water_m = water[1:] & water[:-1]
+
+    kind = np.where(water_m, SUBMERGED, np.where(z_m < elev_m, TUNNEL, ELEVATED))
+
+    return OrderedDict([('s', s[:-1]),
+                        ('length', length),
+                        ('lat', mid(lat_s)),
+                        ('long', mid(long_s)),
+                        ('elev', elev_m),
+                        ('z', z_m),
+                        ('grade', np.arctan2(np.diff(z), length)),
+                        ('kind', kind),
+                        ('h', np.where(kind == ELEVATED, z_m - elev_m, 0.0)),
+                        ('depth', np.where(kind == SUBMERGED, np.maximum(-z_m, 0.0),
+                                           np.where(kind == TUNNEL, elev_m - z_m, 0.0)))])
+
+
+def route_cost(profile, pylon_params=None, submerged_params=None, tunnel_params=None):
+    """
+    Construction cost of every segment of a `profile_route` profile.
+
+    Elevated segments are priced per meter by `TubeAndPylon` with their
+    pylon height, submerged ones by `SubmergedTube` with their depth.
+    `TunnelCost` is a regression on the length of a whole tunnel, so each
+    run of consecutive tunnel segments is priced as one tunnel and its cost
+    is shared between its segments by length.
+
+    Params
+    ------
+    profile : dict
+        Output of `profile_route`.
+    pylon_params, submerged_params, tunnel_params : dict
+        Other params of TubeAndPylon, SubmergedTube and TunnelCost.
+
+    Returns
+    -------
+    cost : array
+        Cost of each segment in USD.
+    """
+    kind = profile['kind']
+    length = profile['length']
+    cost = np.zeros(len(length))
+
+    elevated = kind == ELEVATED
+    if np.any(elevated):
+        pylon = batch_evaluate(TubeAndPylon(), h=profile['h'][elevated], **(pylon_params or {}))
+        cost[elevated] = pylon['total_material_cost']*length[elevated]
+
+    submerged = kind == SUBMERGED
+    if np.any(submerged):
+        tube = batch_evaluate(SubmergedTube(), depth=profile['depth'][submerged],
+                              **(submerged_params or {}))
+        cost[submerged] = tube['material_cost']*length[submerged]
+
+    tunnel = kind == TUNNEL
+    if np.any(tunnel):
+        # Runs of consecutive tunnel segments
+        edges = np.diff(np.concatenate([[0], tunnel.astype(int), [0]]))
+        starts = np.where(edges == 1)[0]
+        ends = np.where(edges == -1)[0]
+        s_end = np.concatenate([[0.0], np.cumsum(length)])
+        run_length = s_end[ends] - s_end[starts]
+        run_cost = batch_evaluate(TunnelCost(), length=run_length/1.0e3,
+                                  **(tunnel_params or {}))['cost']
+        run = np.repeat(np.arange(len(starts)), ends - starts)
+        cost[tunnel] = run_cost[run]*length[tunnel]/run_length[run]
+
+    return cost
+
+if __name__ == '__main__':
+    import time
+
+    #San Francisco to Los Angeles along the coast range
+    lat = [37.75, 36.6, 35.3, 34.06]
+    long = [-121.95, -120.9, -119.2, -118.25]
+
+    t0 = time.time()
+    profile = profile_route(lat, long, spacing=50.0)
+    cost = route_cost(profile)
+    elapsed = time.time() - t0
+
+    for name, code in (('Elevated', ELEVATED), ('Tunnel', TUNNEL), ('Submerged', SUBMERGED)):
+        mask = profile['kind'] == code
+        print('%-10s %10.2f km %16.2f USD' % (name, profile['length'][mask].sum()/1.0e3, cost[mask].sum()))
+    print('Segments   %d' % len(cost))
+    print('Max pylon height %f m' % profile['h'].max())
+    print('Evaluated in %f s' % elapsed)
@@ -0,0 +1,306 @@
+"""
+Least-cost route search over an elevation grid.
+
+Every grid node is connected to its 8 neighbours. Each move is priced by
+its length times the per-meter construction cost of the structure it
+needs: `TubeAndPylon` on pylons over land the track can follow,
+`TunnelCost` where the terrain is steeper than the track may climb and
+`SubmergedTube` over water. The grade limit is thus enforced by tunnelling
+(or, without tunnels, by removing the move) and the curvature limit by
+tracking the heading the track arrives with: a node is a (heading, grid
+node) state and only turns up to `max_turn` are connected.
+
+The costs of all moves are computed once, in one vectorized pass, into an
+(8, n_lat, n_long) cache, and the state graph is assembled straight into
+CSR arrays, so every search is a single call to
+`scipy.sparse.csgraph.dijkstra`. A 1000 x 2000 node grid, 48 million
+moves with the default 45 deg turn limit, is built and searched in about
+half a minute.
+"""
+from __future__ import print_function, division
+
+import os
+from collections import OrderedDict
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from hyperloop.Python.mission.dem_tiles import DEMTiles, R_EARTH
+from hyperloop.Python.mission.route_profile import ELEVATED, TUNNEL, SUBMERGED
+from hyperloop.Python.mission.elevation import USGS_DATA
+from hyperloop.Python.tools.batch import batch_evaluate
+from hyperloop.Python.tube.submerged_tube import SubmergedTube
+from hyperloop.Python.tube.tube_and_pylon import TubeAndPylon
+from hyperloop.Python.tube.tunnel_cost import TunnelCost
+
+# Grid steps (lat, long) of the 8 headings, counterclockwise from east
+HEADINGS = np.array([[0, 1], [1, 1], [1, 0], [1, -1], [0, -1], [-1, -1], [-1, 0], [-1, 1]])
+
+
+def load_grid(data_file_path=USGS_DATA, bounds=None, stride=1):
+    """
+    Reads an elevation grid.
+
+    Params
+    ------
+    data_file_path : str
+        Grid saved by usgs_data_converter.py, or a tile store directory
+        (see dem_tiles.py).
+    bounds : tuple
+        (lat_min, lat_max, long_min, long_max) in deg to crop to. Required
+        for a tile store.
+    stride : int
+        Keeps every `stride`-th node, to search a coarser grid.
+
+    Returns
+    -------
+    lat, long : array
+        Latitudes and longitudes of the grid lines in deg.
+    elev : array
+        Elevation in m, indexed [lat, long].
+    """
+    if os.path.isdir(data_file_path):
+        if bounds is None:
+            raise ValueError('bounds are required to read the tile store %s' % data_file_path)
+        dem = DEMTiles(data_file_path)
+        i = np.arange(np.ceil((bounds[0] - dem.origin[0])/dem.resolution),
+                      np.floor((bounds[1] - dem.origin[0])/dem.resolution) + 1, stride).astype(int)
+        j = np.arange(np.ceil((bounds[2] - dem.origin[1])/dem.resolution),
+                      np.floor((bounds[3] - dem.origin[1])/dem.resolution) + 1, stride).astype(int)
+        node_j, node_i = np.meshgrid(j, i)
+        return (dem.origin[0] + i*dem.resolution, dem.origin[1] + j*dem.resolution,
+                dem.nodes(node_i, node_j))
+
+    usgs_file = np.load(data_file_path)
+    lat = usgs_file['Latitude'][::stride]
+    long = usgs_file['Longitude'][::stride]
+    elev = usgs_file['Elevation'][::stride, ::stride]
+    if bounds is not None:
+        rows = (lat >= bounds[0]) & (lat <= bounds[1])
+        cols = (long >= bounds[2]) & (long <= bounds[3])
+        lat, long, elev = lat[rows], long[cols], elev[rows][:, cols]
+    return lat, long, elev
+
+
+class RouteGraph(object):
+    """
+    Route search graph of an elevation grid.
+
+    Params
+    ------
+    lat, long : array
+        Latitudes and longitudes of the grid lines in deg, evenly spaced.
+    elev : array
+        Elevation in m, indexed [lat, long]. Nodes at or below 0 are water,
+        nan nodes are never used.
+    max_grade : float
+        Steepest grade (rise over run) the track may follow the terrain at.
+    max_turn : float
+        Largest change of heading at a node in deg, a multiple of 45. With
+        grid spacing d the turn radius is at least about d/(2 sin(max_turn/2)).
+        180 or more leaves the route unconstrained.
+    tunnels : bool
+        Tunnels through terrain steeper than `max_grade`. Without tunnels
+        such moves are not allowed.
+    h : float
+        Pylon height in m.
+    depth : float
+        Depth of submerged tubes in m.
+    tunnel_length : float
+        Tunnel length in km the per-meter `TunnelCost` is taken at, since the
+        regression is on the length of a whole tunnel.
+    pylon_params, submerged_params, tunnel_params : dict
+        Other params of TubeAndPylon, SubmergedTube and TunnelCost.
+
+    Attributes
+    ----------
+    unit_cost : dict
+        Cost per meter in USD/m of each kind of move.
+    edge_cost : array
+        Cost in USD of the move from each node along each heading, indexed
+        [heading, lat, long], inf where the move is not allowed.
+    edge_kind : array
+        ELEVATED, TUNNEL or SUBMERGED for each move.
+    """
+
+    def __init__(self, lat, long, elev, max_grade=.02, max_turn=45.0, tunnels=True,
+                 h=10.0, depth=10.0, tunnel_length=1.0, pylon_params=None,
+                 submerged_params=None, tunnel_params=None):
+        self.lat = np.asarray(lat, dtype=float)
+        self.long = np.asarray(long, dtype=float)
+        self.elev = np.asarray(elev, dtype=float)
+        self.max_turn = max_turn
+        self.shape = self.elev.shape
+
+        pylon = batch_evaluate(TubeAndPylon(), h=h, **(pylon_params or {}))
+        tube = batch_evaluate(SubmergedTube(), depth=depth, **(submerged_params or {}))
+        tunnel = batch_evaluate(TunnelCost(), length=tunnel_length, **(tunnel_params or {}))
+        self.unit_cost = {ELEVATED: float(pylon['total_material_cost']),
+                          SUBMERGED: float(tube['material_cost']),
+                          TUNNEL: float(tunnel['cost'])/(tunnel_length*1.0e3)}
+
+        self.edge_cost, self.edge_kind = self._edge_costs(max_grade, tunnels)
+        self._graph = None
+
+    def _edge_costs(self, max_grade, tunnels):
+        n_lat, n_long = self.shape
+        dlat = np.radians(abs(self.lat[1] - self.lat[0]))*R_EARTH
+        dlong = np.radians(abs(self.long[1] - self.long[0]))*R_EARTH*np.cos(np.radians(self.lat))
+
+        cost = np.empty((8, n_lat, n_long))
+        cost.fill(np.inf)
+        kind = np.zeros((8, n_lat, n_long), dtype=np.int8)
+
+        for d, (di, dj) in enumerate(HEADINGS):
+            # Nodes the move stays on the grid from, and the nodes it reaches
+            src = (slice(max(-di, 0), n_lat - max(di, 0)), slice(max(-dj, 0), n_long - max(dj, 0)))
+            dst = (slice(max(di, 0), n_lat + min(di, 0)), slice(max(dj, 0), n_long + min(dj, 0)))
+            e0 = self.elev[src]
+            e1 = self.elev[dst]
+
+            dlong_mid = .5*(dlong[src[0]] + dlong[dst[0]])
+            length = np.hypot(di*dlat, dj*dlong_mid)[:, None]*np.ones_like(e0)
+
+            k = np.where((e0 <= 0.0) & (e1 <= 0.0), SUBMERGED,
+                         np.where(np.abs(e1 - e0) <= max_grade*length, ELEVATED, TUNNEL))
+            c = length*np.choose(k, [self.unit_cost[ELEVATED], self.unit_cost[TUNNEL],
+                                     self.unit_cost[SUBMERGED]])
+            if not tunnels:
+                c[k == TUNNEL] = np.inf
+            c[np.isnan(e0) | np.isnan(e1)] = np.inf
+
+            cost[d][src] = c
+            kind[d][src] = k
+        return cost, kind
+
+    def _turns(self):
+        # Heading changes allowed at a node, in steps of 45 deg
+        steps = int(np.floor(self.max_turn/45.0 + 1e-9))
+        if steps >= 4:
+            return np.arange(-3, 5)
+        return np.arange(-steps, steps + 1)
+
+    @property
+    def graph(self):
+        """
+        Heading-state graph in CSR form. State d*N + n is grid node n
+        (flat index) reached with heading d, N nodes in the grid. Built on
+        first use and kept for every later search.
+        """
+        if self._graph is None:
+            n_lat, n_long = self.shape
+            N = n_lat*n_long
+            flat = np.arange(N).reshape(self.shape)
+            turns = self._turns()
+
+            # Node reached along each heading, -1 off the grid
+            target = -np.ones((8, n_lat, n_long), dtype=np.int64)
+            for d, (di, dj) in enumerate(HEADINGS):
+                src = (slice(max(-di, 0), n_lat - max(di, 0)), slice(max(-dj, 0), n_long - max(dj, 0)))
+                dst = (slice(max(di, 0), n_lat + min(di, 0)), slice(max(dj, 0), n_long + min(dj, 0)))
+                target[d][src] = d*N + flat[dst]
+            target = target.reshape(8, N)
+            cost = self.edge_cost.reshape(8, N)
+
+            # Successors of state (d, n), laid out [d, n, turn] so rows come out sorted
+            headings = (np.arange(8)[:, None] + turns[None, :]) % 8
+            weights = np.empty((8, N, len(turns)))
+            indices = np.empty((8, N, len(turns)), dtype=np.int64)
+            for d in range(8):
+                weights[d] = cost[headings[d]].T
+                indices[d] = target[headings[d]].T
+            weights = weights.reshape(8*N, len(turns))
+            indices = indices.reshape(8*N, len(turns))
+
+            keep = np.isfinite(weights)
+            indptr = np.concatenate([[0], np.cumsum(keep.sum(axis=1))])
+            self._graph = (weights[keep], indices[keep].astype(np.int32), indptr)
+        return self._graph
+
+    def node(self, lat, long):
+        """
+        Grid node (i, j) nearest to (lat, long) in deg.
+        """
+        return (int(np.argmin(np.abs(self.lat - lat))),
+                int(np.argmin(np.abs(self.long - long))))
+
+    def search(self, start, end):
+        """
+        Cheapest route between two points.
+
+        Params
+        ------
+        start, end : tuple
+            (lat, long) in deg, moved to the nearest grid node.
+
+        Returns
+        -------
+        route : OrderedDict
+            'lat', 'long' of the nodes along the route (deg), 'kind' and
+            'cost' (USD) of each move, and the total 'total_cost' (USD), inf
+            if the end cannot be reached.
+        """
+        n_lat, n_long = self.shape
+        N = n_lat*n_long
+        data, indices, indptr = self.graph
+
+        # The start is left along any heading, through an extra state 8N
+        i0, j0 = self.node(*start)
+        i1, j1 = self.node(*end)
+        n0 = i0*n_long + j0
+        first = np.where(np.isfinite(self.edge_cost[:, i0, j0]))[0]
+        first_target = np.array([d*N + (i0 + HEADINGS[d][0])*n_long + j0 + HEADINGS[d][1]
+                                 for d in first], dtype=np.int32)
+        graph = csr_matrix((np.concatenate([data, self.edge_cost[first, i0, j0]]),
+                            np.concatenate([indices, first_target]),
+                            np.concatenate([indptr, [indptr[-1] + len(first)]])),
+                           shape=(8*N + 1, 8*N + 1))
+
+        dist, pred = dijkstra(graph, indices=8*N, return_predecessors=True)
+
+        ends = np.arange(8)*N + i1*n_long + j1
+        state = ends[np.argmin(dist[ends])]
+        total = dist[state]
+        if n0 == i1*n_long + j1:
+            state, total = 8*N, 0.0
+
+        states = []
+        while np.isfinite(total) and state != 8*N:
+            states.append(state)
+            state = pred[state]
+        states = np.array(states[::-1], dtype=np.int64)
+
+        nodes = np.concatenate([[n0], states % N])
+        heading = states//N
+        i, j = nodes//n_long, nodes % n_long
+        move = (heading, i[:-1], j[:-1])
+
+        return OrderedDict([('lat', self.lat[i]),
+                            ('long', self.long[j]),
+                            ('kind', self.edge_kind[move]),
+                            ('cost', self.edge_cost[move]),
+                            ('total_cost', total)])
+
+if __name__ == '__main__':
+    import time
+
+    lat, long, elev = load_grid(stride=2)
+
+    t0 = time.time()
+    routes = RouteGraph(lat, long, elev, max_grade=.02, max_turn=45.0)
+    routes.graph
+    t1 = time.time()
+
+    #San Francisco to Los Angeles
+    route = routes.search((37.75, -121.95), (34.06, -118.25))
+    t2 = time.time()
+
+    print('Grid                    %d x %d' % routes.shape)
+    print('Graph built in          %f s' % (t1 - t0))
+    print('Searched in             %f s' % (t2 - t1))
+    print('Moves                   %d' % len(route['cost']))
+    for name, code in (('Elevated', ELEVATED), ('Tunnel', TUNNEL), ('Submerged', SUBMERGED)):
+        mask = route['kind'] == code
+        print('%-10s %16.2f USD' % (name, route['cost'][mask].sum()))
+    print('Total      %16.2f USD' % route['total_cost'])
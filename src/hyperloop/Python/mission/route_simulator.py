@@ -0,0 +1,315 @@
+"""
+Simulates a pod over a whole route.
+
+`SampleMission` treats a single boost/coast cycle on a flat track and
+extrapolates the number of boosters from it. `RouteSimulator` integrates the
+pod's speed along the entire route instead, section by section:
+
+* booster sections accelerate the pod at 1g up to cruise speed and then
+  hold it there, with the thrust of `MissionThrust`
+* coast sections only have the pod's own thrust against aero and magnetic
+  drag (`MissionDrag`) and the grade
+
+Every section has its own grade. Transitions between sections, reaching
+cruise speed in a booster and stalling in a coast section are located as
+events, and the time histories of v, x, thrust, drag and power are streamed
+out in chunks.
+"""
+from __future__ import print_function
+
+from collections import namedtuple, OrderedDict
+
+import numpy as np
+from scipy.optimize import brentq
+
+from hyperloop.Python.mission.mission_drag import mission_drag_kernel
+from hyperloop.Python.mission.mission_thrust import mission_thrust_kernel
+
+Section = namedtuple('Section', ['length', 'booster', 'theta'])
+Event = namedtuple('Event', ['t', 'x', 'v', 'kind', 'section'])
+
+COAST, ACCELERATE, HOLD = 0, 1, 2
+
+HISTORIES = ('t', 'x', 'v', 'thrust', 'drag', 'power')
+
+
+def periodic_route(track_length, dx_start, prop_period, dx_boost, theta=0.0):
+    """
+    Route laid out the way `SampleMission` sizes it: a start up booster of
+    `dx_start`, then coast sections of `prop_period` separated by boosters
+    of `dx_boost`, up to `track_length`.
+    """
+    sections = [Section(min(dx_start, track_length), True, theta)]
+    x = sections[0].length
+    booster = False
+    while x < track_length:
+        length = min(dx_boost if booster else prop_period, track_length - x)
+        sections.append(Section(length, booster, theta))
+        x += length
+        booster = not booster
+    return sections
+
+
+def split_grades(sections, grades):
+    """
+    Splits `sections` where the grade changes.
+
+    Params
+    ------
+    sections : list of Section
+        Route, in order from x = 0.
+    grades : list of (x, theta)
+        Grade `theta` in rad that applies from `x` onward, sorted by x.
+        Sections before the first entry keep their own grade.
+
+    Returns
+    -------
+    sections : list of Section
+    """
+    route = []
+    start = 0.0
+    for section in sections:
+        end = start + section.length
+        cuts = [start] + [x for x, theta in grades if start < x < end] + [end]
+        for x0, x1 in zip(cuts[:-1], cuts[1:]):
+            theta = section.theta
+            for x, grade in grades:
+                if x <= x0:
+                    theta = grade
+            route.append(Section(x1 - x0, section.booster, theta))
+        start = end
+    return route
+
+
+def _rk23(x, v, h, a0, k):
+    # Bogacki-Shampine step of dx/dt = v, dv/dt = a0 - k*v**2 with the
+    # embedded error estimate
+    a1 = a0 - k*v*v
+    v2 = v + .5*h*a1
+    a2 = a0 - k*v2*v2
+    v3 = v + .75*h*a2
+    a3 = a0 - k*v3*v3
+    x_new = x + h*(2.0*v + 3.0*v2 + 4.0*v3)/9.0
+    v_new = v + h*(2.0*a1 + 3.0*a2 + 4.0*a3)/9.0
+    a4 = a0 - k*v_new*v_new
+    ex = h*(-5.0*v/72.0 + v2/12.0 + v3/9.0 - v_new/8.0)
+    ev = h*(-5.0*a1/72.0 + a2/12.0 + a3/9.0 - a4/8.0)
+    return x_new, v_new, ex, ev
+
+
+class RouteSimulator(object):
+    """
+    Integrates a pod trip over a route of booster and coast sections.
+
+    Params
+    ------
+    sections : list of Section
+        Route, in order from x = 0. Each Section has a `length` in m, a
+        `booster` flag and a grade `theta` in rad.
+    v_cruise : float
+        Speed boosters accelerate the pod to, in m/s. Default value is 335 m/s.
+    v_start : float
+        Speed at x = 0 in m/s. Default value is 0.0.
+    Cd, S, p_tube, T_ambient, R, D_magnetic, Thrust_pod, m_pod, g : float
+        Pod and tube params, with the same meaning and defaults as in
+        `MissionThrust`.
+    rtol : float
+        Relative tolerance of the adaptive step. Default value is 1e-8.
+    max_step : float
+        Largest time step in s, which is also the coarsest spacing of the
+        time histories. Default value is 1.0 s.
+
+    Notes
+    -----
+    `events` holds the Events of the last run: 'booster' or 'coast' at the
+    start of every section, 'cruise' when a booster reaches cruise speed,
+    'stall' if the pod stops in a coast section (the run ends there) and
+    'arrive' at the end of the route.
+    """
+
+    def __init__(self, sections, v_cruise=335.0, v_start=0.0, Cd=.2, S=1.4,
+                 p_tube=850.0, T_ambient=298.0, R=287.0, D_magnetic=150.0,
+                 Thrust_pod=3500.0, m_pod=3100.0, g=9.81, rtol=1e-8, max_step=1.0):
+        self.sections = list(sections)
+        self.v_cruise = v_cruise
+        self.v_start = v_start
+        self.params = {'Cd' : Cd,
+                       'S' : S,
+                       'p_tube' : p_tube,
+                       'T_ambient' : T_ambient,
+                       'R' : R,
+                       'D_magnetic' : D_magnetic,
+                       'Thrust_pod' : Thrust_pod,
+                       'm_pod' : m_pod,
+                       'g' : g}
+        self.rtol = rtol
+        self.atol = 1e-6
+        self.max_step = max_step
+        self.events = []
+
+    def _coefficients(self, mode, theta):
+        # dv/dt = a0 - k*v**2
+        p = self.params
+        if mode == ACCELERATE:
+            #MissionThrust balances drag and grade, leaving 1g
+            return p['g'], 0.0
+        if mode == HOLD:
+            return 0.0, 0.0
+        rho = p['p_tube']/(p['R']*p['T_ambient'])
+        k = .5*p['Cd']*rho*p['S']/p['m_pod']
+        a0 = (p['Thrust_pod'] - p['D_magnetic'])/p['m_pod'] - p['g']*np.sin(theta)
+        return a0, k
+
+    def _forces(self, v, mode, theta):
+        p = dict(self.params)
+        p['V'] = v
+        p['theta'] = theta
+        # MissionDrag takes the drag area, Cd*S
+        drag = mission_drag_kernel(dict(p, S=p['Cd']*p['S']))['D']
+        grade = p['m_pod']*p['g']*np.sin(theta)
+        thrust = np.where(mode == ACCELERATE, mission_thrust_kernel(p)['Thrust'],
+                          np.where(mode == HOLD, drag + grade, p['Thrust_pod']))
+        return thrust, drag
+
+    def _chunk(self, t, x, v, mode, theta):
+        v = np.array(v)
+        mode = np.array(mode)
+        thrust, drag = self._forces(v, mode, np.array(theta))
+        return OrderedDict([('t', np.array(t)),
+                            ('x', np.array(x)),
+                            ('v', v),
+                            ('thrust', thrust),
+                            ('drag', drag),
+                            ('power', thrust*v)])
+
+    def histories(self, chunk_size=1000):
+        """
+        Runs the trip, yielding the time histories as OrderedDicts of
+        arrays ('t', 'x', 'v', 'thrust', 'drag', 'power') of at most
+        `chunk_size` points each.
+        """
+        self.events = []
+        buf = ([], [], [], [], [])
+        t = x = 0.0
+        v = self.v_start
+        h = self.max_step
+        x_start = 0.0
+        stalled = False
+
+        for i, section in enumerate(self.sections):
+            x_end = x_start + section.length
+            self.events.append(Event(t, x, v, 'booster' if section.booster else 'coast', i))
+
+            if section.booster:
+                mode = ACCELERATE if v < self.v_cruise else HOLD
+            else:
+                mode = COAST
+            a0, k = self._coefficients(mode, section.theta)
+
+            for values, value in zip(buf, (t, x, v, mode, section.theta)):
+                values.append(value)
+
+            while x < x_end:
+                x_new, v_new, ex, ev = _rk23(x, v, h, a0, k)
+                err = max(abs(ex)/(self.atol + self.rtol*abs(x_new)),
+                          abs(ev)/(self.atol + self.rtol*abs(v_new)))
+                if err > 1.0:
+                    h *= max(.2, .9*err**(-1.0/3.0))
+                    continue
+
+                # Event functions that cross zero from below
+                checks = [('section', lambda xs, vs: xs - x_end)]
+                if mode == ACCELERATE:
+                    checks.append(('cruise', lambda xs, vs: vs - self.v_cruise))
+                elif mode == COAST and a0 <= 0.0:
+                    checks.append(('stall', lambda xs, vs: -vs))
+
+                event = None
+                h_event = h
+                for kind, func in checks:
+                    if func(x_new, v_new) >= 0.0:
+                        root = brentq(lambda hs: func(*_rk23(x, v, hs, a0, k)[:2]), 0.0, h)
+                        if event is None or root < h_event:
+                            event, h_event = kind, root
+
+                if event is not None:
+                    x_new, v_new = _rk23(x, v, h_event, a0, k)[:2]
+                    t += h_event
+                    if event == 'section':
+                        x_new = x_end
+                    elif event == 'cruise':
+                        v_new = self.v_cruise
+                    else:
+                        v_new = 0.0
+                else:
+                    t += h
+                    h = min(self.max_step, h*min(5.0, .9*max(err, 1e-10)**(-1.0/3.0)))
+                x, v = x_new, v_new
+
+                for values, value in zip(buf, (t, x, v, mode, section.theta)):
+                    values.append(value)
+                if len(buf[0]) >= chunk_size:
+                    yield self._chunk(*buf)
+                    buf = ([], [], [], [], [])
+
+                if event == 'cruise':
+                    self.events.append(Event(t, x, v, 'cruise', i))
+                    mode = HOLD
+                    a0, k = self._coefficients(mode, section.theta)
+                elif event == 'stall':
+                    self.events.append(Event(t, x, v, 'stall', i))
+                    stalled = True
+                    break
+
+            if stalled:
+                break
+            x_start = x_end
+
+        if not stalled:
+            self.events.append(Event(t, x, v, 'arrive', len(self.sections) - 1))
+        if buf[0]:
+            yield self._chunk(*buf)
+
+    def run(self):
+        """
+        Runs the trip and returns the full time histories as an OrderedDict
+        of arrays.
+        """
+        chunks = list(self.histories())
+        return OrderedDict([(name, np.concatenate([chunk[name] for chunk in chunks]))
+                            for name in HISTORIES])
+
+if __name__ == '__main__':
+    import time
+
+    from openmdao.api import Group, Problem
+
+    from hyperloop.Python.sample_mission import SampleMission
+
+    #Size the boosters with SampleMission, then fly the whole route
+    top = Problem()
+    root = top.root = Group()
+    root.add('p', SampleMission())
+    top.setup()
+    top['p.nozzle_thrust'] = 3500.0
+    top.run()
+
+    v_cruise = top['p.M_pod']*np.sqrt(top['p.gam']*top['p.R']*top['p.T_tunnel'])
+    sections = periodic_route(top['p.track_length'], top['p.dx_start'],
+                              top['p.prop_period'], top['p.dx_boost'])
+
+    sim = RouteSimulator(sections, v_cruise=v_cruise, Cd=top['p.Cd'], S=top['p.S'],
+                         p_tube=top['p.p_tunnel'], T_ambient=top['p.T_tunnel'],
+                         R=top['p.R'], D_magnetic=top['p.D_mag'],
+                         Thrust_pod=top['p.nozzle_thrust'] - top['p.ram_drag'],
+                         m_pod=top['p.m_pod'], g=top['p.g'])
+
+    t0 = time.time()
+    hist = sim.run()
+    elapsed = time.time() - t0
+
+    print('Sections                  %d' % len(sections))
+    print('Trip time                 %f s' % hist['t'][-1])
+    print('Minimum cruise speed      %f m/s' % hist['v'][hist['x'] > top['p.dx_start']].min())
+    print('Energy                    %f MJ' % (np.trapz(hist['power'], hist['t'])/1.0e6))
+    print('Simulated in              %f s' % elapsed)
@@ -6,7 +6,8 @@ import numpy as np
 
 from openmdao.api import Group, Problem, Group, IndepVarComp, Component
 from pointer.components import Trajectory, RHS, EOMComp, CollocationPhase
-from scipy import interpolate
+
+from hyperloop.Python.mission.elevation import terrain_interpolant, USGS_DATA
 
 class TerrainElevationComp(EOMComp):
     '''
@@ -14,34 +15,20 @@ class TerrainElevationComp(EOMComp):
     look up the elevation of the local terrain.
     '''
 
-    def __init__(self, grid_data):
+    def __init__(self, grid_data, data_file_path=USGS_DATA):
         super(TerrainElevationComp, self).__init__(grid_data, time_units='s')
 
-        self.deriv_options['type'] = 'fd'
-
         nn = grid_data['num_nodes']
 
         self.add_param('lat', shape=(nn,), desc='latitude', units='deg', eom_state=False)
         self.add_param('long', shape=(nn,), desc='longitude', units='deg', eom_state=False)
         self.add_param('z', shape=(nn,), desc='vertical component of position, positive down', units='m', eom_state=False)
 
-        mydir = os.path.dirname(os.path.realpath(__file__))
-        data_file_path = os.path.join(mydir,'usgs_data.npz')
-
-        usgs_file = np.load(data_file_path)
-
-        self.add_output('elev', shape=(nn,), desc='terrain elevation at the given point', units='m/s/s')
+        self.add_output('elev', shape=(nn,), desc='terrain elevation at the given point', units='m')
         self.add_output('alt', shape=(nn,), desc='ground-relative altitude of the track', units='m')
 
-        self.interpolant = interpolate.RectBivariateSpline(usgs_file['Longitude'], usgs_file['Latitude'], usgs_file['Elevation'])
+        self.interpolant = terrain_interpolant(data_file_path)
 
-        import matplotlib.pyplot as plt
-
-        xx = usgs_file['XX']
-        yy = usgs_file['YY']
-        zz = usgs_file['Elevation']
-
-        plt.contourf(xx,yy,zz)
         #
         # min_lon, max_lon = usgs_file['YY'][0,0], usgs_file['YY'][479,479]
         # min_lat, max_lat = usgs_file['XX'][0,0], usgs_file['XX'][479,479]
@@ -74,12 +61,21 @@ class TerrainElevationComp(EOMComp):
 
     def solve_nonlinear(self, params, unknowns, resids):
         #convert x/y to lat/lon (see Component lat_long.py), then feed into interpolant
-        elev = unknowns['elev']
-
-        for i in range(self.num_nodes):
-            elev[i] = self.interpolant(params['long'][i],params['lat'][i])
-
-        #unknowns['alt'] = -params['z'] - unknowns['elev']
+        unknowns['elev'][:] = self.interpolant.ev(params['long'], params['lat'])
+        unknowns['alt'][:] = -params['z'] - unknowns['elev']
+
+    def linearize(self, params, unknowns, resids):
+        # The spline is built with longitude as x and latitude as y
+        delev_dlong = self.interpolant.ev(params['long'], params['lat'], dx=1)
+        delev_dlat = self.interpolant.ev(params['long'], params['lat'], dy=1)
+
+        J = {}
+        J['elev', 'long'] = np.diag(delev_dlong)
+        J['elev', 'lat'] = np.diag(delev_dlat)
+        J['alt', 'long'] = np.diag(-delev_dlong)
+        J['alt', 'lat'] = np.diag(-delev_dlat)
+        J['alt', 'z'] = -np.eye(self.num_nodes)
+        return J
 
 if __name__ == "__main__":
     root = Group()
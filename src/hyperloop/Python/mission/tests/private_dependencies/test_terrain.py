@@ -0,0 +1,51 @@
+import numpy as np
+from openmdao.api import Group, Problem
+
+from hyperloop.Python.mission.terrain import TerrainElevationComp
+
+def create_problem(component):
+    root = Group()
+    prob = Problem(root)
+    prob.root.add('comp', component)
+    return prob
+
+class TestTerrain(object):
+    def test_case1_vectorized(self):
+
+        nn = 20
+        component = TerrainElevationComp({'num_nodes': nn})
+        prob = create_problem(component)
+        prob.setup(check=False)
+
+        lat = np.linspace(34.1, 37.5, nn)
+        long = np.linspace(-121.9, -118.1, nn)
+        z = -100.0*np.ones(nn)
+        prob['comp.lat'] = lat
+        prob['comp.long'] = long
+        prob['comp.z'] = z
+        prob.run()
+
+        elev = np.array([component.interpolant(long[i], lat[i])[0, 0] for i in range(nn)])
+
+        assert np.allclose(prob['comp.elev'], elev)
+        assert np.allclose(prob['comp.alt'], -z - elev)
+
+    def test_case2_shared_interpolant(self):
+
+        comp1 = TerrainElevationComp({'num_nodes': 2})
+        comp2 = TerrainElevationComp({'num_nodes': 5})
+
+        assert comp1.interpolant is comp2.interpolant
+
+    def test_case3_partials(self):
+
+        nn = 5
+        prob = create_problem(TerrainElevationComp({'num_nodes': nn}))
+        prob.setup(check=False)
+        prob['comp.lat'] = np.linspace(34.1, 37.5, nn) + .0013
+        prob['comp.long'] = np.linspace(-121.9, -118.1, nn) + .0017
+        prob.run()
+
+        data = prob.check_partial_derivatives(out_stream=None)
+        for key, check in data['comp'].items():
+            assert check['abs error'][0] <= 1e-3*max(check['magnitude'][2], 1.0), key
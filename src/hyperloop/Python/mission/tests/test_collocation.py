@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from hyperloop.Python.mission import collocation
+from hyperloop.Python.mission.collocation import MagneplaneCollocation
+
+# trust-constr needs scipy 1.1 or later
+needs_trust_constr = pytest.mark.skipif(collocation.NonlinearConstraint is None,
+                                        reason='scipy without trust-constr')
+
+def fd_jacobian(func, z, step=1e-6):
+    f0 = func(z)
+    J = np.zeros((len(f0), len(z)))
+    for k in range(len(z)):
+        dz = np.zeros(len(z))
+        dz[k] = step
+        J[:, k] = (func(z + dz) - func(z - dz))/(2.0*step)
+    return J
+
+class TestCollocation(object):
+    def test_case1_derivatives(self):
+
+        prob = MagneplaneCollocation(6, controls=('theta', 'psi', 'F_thrust'), objective='energy',
+                                     initial={'x': 0.0, 'v': 1.0}, final={'x': 5.0, 'z': -1.0},
+                                     bounds={'t': (1.0, 10.0)},
+                                     ref={'x': 5.0, 'F_thrust': 100.0, 'objective': 10.0},
+                                     mass=50.0, F_drag=3.0, c_drag=.2)
+        rng = np.random.RandomState(0)
+        z = prob.guess(t_final=3.0) + .3*rng.rand(prob.size)
+        lmbda = rng.rand(prob.num_constraints)
+
+        assert np.allclose(prob.jacobian(z).toarray(), fd_jacobian(prob.constraints, z), atol=1e-6)
+        assert np.allclose(prob.objective_gradient(z),
+                           fd_jacobian(lambda u: np.atleast_1d(prob.objective_value(u)), z)[0], atol=1e-6)
+        assert np.allclose(prob.constraint_hessian(z, lmbda).toarray(),
+                           fd_jacobian(lambda u: prob.jacobian(u).T.dot(lmbda), z), atol=1e-6)
+        assert np.allclose(prob.objective_hessian(z).toarray(),
+                           fd_jacobian(prob.objective_gradient, z), atol=1e-6)
+
+    @needs_trust_constr
+    def test_case2_brachistochrone(self):
+
+        prob = MagneplaneCollocation(200, controls=('theta',), objective='time',
+                                     initial={'x': 0.0, 'y': 0.0, 'z': -10.0, 'v': 0.0},
+                                     final={'x': 10.0, 'z': -5.0},
+                                     bounds={'theta': (-1.57, 1.57), 'v': (0.0, np.inf),
+                                             't': (.5, 10.0)})
+        traj, result = prob.solve(prob.guess(t_final=2.0, theta=-.46), gtol=1e-8)
+
+        # Analytic brachistochrone time quoted in eom.py
+        assert result.constr_violation < 1e-8
+        assert np.isclose(traj['t'][-1], 1.8016, rtol=1e-3)
+        assert np.isclose(traj['x'][-1], 10.0)
+
+    @needs_trust_constr
+    def test_case3_min_energy(self):
+
+        prob = MagneplaneCollocation(200, controls=('F_thrust',), objective='energy', t_final=60.0,
+                                     initial={'x': 0.0, 'y': 0.0, 'z': 0.0, 'v': 0.0},
+                                     final={'x': 1000.0}, bounds={'F_thrust': (0.0, 2000.0)},
+                                     ref={'x': 1000.0, 'v': 10.0, 'F_thrust': 1000.0,
+                                          'objective': 1.0e5})
+        traj, result = prob.solve(prob.guess(v=1000.0/60.0, F_thrust=100.0), gtol=1e-8,
+                                  maxiter=5000)
+
+        # Full thrust, then coast: 60*v - v**2/4 = 1000 m gives the top speed
+        v_top = 120.0 - np.sqrt(120.0**2 - 4000.0)
+        work = np.trapz(traj['F_thrust']*traj['v'], traj['t'])
+        assert np.isclose(work, .5*1000.0*v_top**2, rtol=1e-2)
@@ -0,0 +1,62 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from hyperloop.Python.mission import dem_tiles
+
+USGS_DATA = os.path.join(os.path.dirname(dem_tiles.__file__), 'usgs_data.npz')
+
+def create_store(tile_size=128):
+    path = os.path.join(tempfile.mkdtemp(), 'tiles')
+    dem_tiles.convert_npz(USGS_DATA, path, tile_size=tile_size)
+    return path
+
+class TestDEMTiles(object):
+    def test_case1_nodes_vs_grid(self):
+
+        dem = dem_tiles.DEMTiles(create_store())
+        usgs_file = np.load(USGS_DATA)
+
+        i = np.arange(0, 480, 7)
+        j = np.arange(479, 0, -7)
+        elev = dem.elevation(usgs_file['Latitude'][i], usgs_file['Longitude'][j])
+
+        assert np.allclose(elev, usgs_file['Elevation'][i, j])
+        assert np.isnan(dem.elevation(50.0, 10.0))
+
+    def test_case2_chunked_write(self):
+
+        usgs_file = np.load(USGS_DATA)
+        long, lat = np.meshgrid(usgs_file['Longitude'], usgs_file['Latitude'])
+        lats = usgs_file['Latitude']
+        resolution = (lats[-1] - lats[0])/(len(lats) - 1)
+
+        path = os.path.join(tempfile.mkdtemp(), 'tiles')
+        for rows in np.array_split(np.arange(480), 3):
+            dem_tiles.write_tiles(path, lat[rows], long[rows], usgs_file['Elevation'][rows],
+                                  resolution, tile_size=128)
+
+        dem = dem_tiles.DEMTiles(path)
+        ref = dem_tiles.DEMTiles(create_store())
+        points = (np.linspace(34.1, 37.9, 50), np.linspace(-121.9, -118.1, 50))
+
+        assert dem.tiles == ref.tiles
+        assert np.allclose(dem.elevation(*points), ref.elevation(*points))
+
+        with pytest.raises(ValueError):
+            dem_tiles.write_tiles(path, lat[:2], long[:2], usgs_file['Elevation'][:2],
+                                  resolution, tile_size=64)
+
+    def test_case3_profile_lru(self):
+
+        dem = dem_tiles.DEMTiles(create_store(tile_size=64), cache_size=3)
+
+        s, lat, long, elev = dem.profile([37.7, 34.1], [-121.9, -118.2], spacing=1000.0)
+
+        assert lat[0] == 37.7 and long[-1] == -118.2
+        assert np.all(np.diff(s) <= 1000.0 + 1e-6)
+        assert len(dem._cache) <= 3
+        assert dem.loads < len(dem.tiles)
+        assert not np.any(np.isnan(elev))
@@ -0,0 +1,44 @@
+import numpy as np
+from scipy.integrate import quad
+
+from hyperloop.Python.mission import geodesy
+
+class TestGeodesy(object):
+    def test_case1_sphere(self):
+
+        x = np.array([-50.0, 0.0, 120.0])
+        y = np.array([30.0, 0.0, -80.0])
+        lat, long = geodesy.ned_to_lat_long(x, y, Re=6378.137, lon_origin=-121.0, lat_origin=35.0)
+
+        # Small offset approximation LatLong used before
+        lat_rad = 35.0*(np.pi/180.0) + x/6378.137
+        long_rad = -121.0*(np.pi/180.0) + y/(6378.137*np.cos(lat_rad))
+
+        assert np.allclose(lat, lat_rad*(180.0/np.pi))
+        assert np.allclose(long, long_rad*(180.0/np.pi))
+
+    def test_case2_wgs84_meridian(self):
+
+        a, f = geodesy.WGS84
+        e2 = f*(2.0 - f)
+        arc = quad(lambda phi: a*(1.0 - e2)/(1.0 - e2*np.sin(phi)**2)**1.5,
+                   np.radians(35.0), np.radians(37.3))[0]
+
+        lat, long = geodesy.ned_to_lat_long(arc, 0.0, lat_origin=35.0, ellipsoid=geodesy.WGS84)
+
+        assert np.isclose(geodesy.meridian_arc(90.0), 10001.965729, atol=1e-6)
+        assert np.isclose(lat, 37.3, rtol=0.0, atol=1e-9)
+        assert long == -121.0
+
+    def test_case3_round_trip(self):
+
+        x = np.linspace(-800.0, 800.0, 100000).reshape(100, 1000)
+        y = np.linspace(600.0, -600.0, 100000).reshape(100, 1000)
+
+        for ellipsoid in (None, geodesy.WGS84):
+            lat, long = geodesy.ned_to_lat_long(x, y, ellipsoid=ellipsoid)
+            x2, y2 = geodesy.lat_long_to_ned(lat, long, ellipsoid=ellipsoid)
+
+            assert lat.shape == x.shape
+            assert np.allclose(x2, x, rtol=0.0, atol=1e-9)
+            assert np.allclose(y2, y, rtol=0.0, atol=1e-9)
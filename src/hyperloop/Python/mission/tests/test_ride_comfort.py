@@ -0,0 +1,80 @@
+import numpy as np
+from scipy.linalg import expm
+
+from hyperloop.Python.mission.ride_comfort import ride_comfort, time_derivative
+
+def dcm321(psi, theta, phi):
+    # Inertial to body direction cosines, yaw then pitch then roll
+    def rotation(i, angle):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        R = np.eye(3)
+        R[j, j] = R[k, k] = np.cos(angle)
+        R[j, k] = np.sin(angle)
+        R[k, j] = -np.sin(angle)
+        return R
+    return rotation(0, phi).dot(rotation(1, theta)).dot(rotation(2, psi))
+
+def skew(w):
+    return np.array([[0.0, -w[2], w[1]], [w[2], 0.0, -w[0]], [-w[1], w[0], 0.0]])
+
+def body_rate(angles, rates, h=1e-6):
+    # dC/dt = -[omega x] C, with dC/dt by central differences
+    C = dcm321(*angles)
+    dC = (dcm321(*(angles + h*rates)) - dcm321(*(angles - h*rates)))/(2.0*h)
+    W = -dC.dot(C.T)
+    return np.array([W[2, 1], W[0, 2], W[1, 0]])
+
+def point_acceleration(C0, omega, v, a_linear, L_pod, h=1e-3):
+    # Body frame acceleration of the point -L_pod*b1 of a pod spinning at a
+    # constant body rate and moving along its own x axis, from central
+    # differences of its inertial velocity and position
+    b1 = np.array([1.0, 0.0, 0.0])
+    C = lambda t: expm(-skew(omega)*t).dot(C0)
+    velocity = lambda t: (v + a_linear*t)*C(t).T.dot(b1)
+    offset = lambda t: C(t).T.dot(-L_pod*b1)
+
+    a = (velocity(h) - velocity(-h))/(2.0*h) + (offset(h) - 2.0*offset(0.0) + offset(-h))/h**2
+    return C0.dot(a)
+
+class TestRideComfort(object):
+    def test_case1_vs_rigid_body(self):
+
+        n = 7
+        t = np.linspace(0.0, 6.0, n)
+        angles = np.random.RandomState(0).uniform(-.3, .3, (6, n))
+        v = np.linspace(100.0, 300.0, n)
+        a_linear = np.linspace(-1.0, 1.0, n)
+
+        comfort = ride_comfort(t, *angles, v=v, a_linear=a_linear)
+
+        for i in range(n):
+            omega = body_rate(angles[:3, i], angles[3:, i])
+            a_body = point_acceleration(dcm321(*angles[:3, i]), omega, v[i], a_linear[i], 20.5)
+
+            assert np.allclose(comfort['omega_b'][i], omega, atol=1e-8)
+            assert np.allclose(comfort['a_body'][i], a_body, atol=1e-6)
+
+    def test_case2_curve(self):
+
+        # Yawing at v/R gives the centripetal acceleration v**2/R to the right
+        t = np.linspace(0.0, 10.0, 1001)
+        v = 300.0
+        R = 40.0e3
+        comfort = ride_comfort(t, v/R*t, 0.0, 0.0, v/R, 0.0, 0.0, v, 0.0)
+
+        assert np.allclose(comfort['a_body'][:, 1], v**2/R)
+        assert np.all(comfort['a_exceed'][:, 1])
+        assert not np.any(comfort['jerk_exceed'])
+        assert np.all(comfort['exceed'])
+
+    def test_case3_derivative(self):
+
+        t = np.cumsum(np.random.RandomState(1).uniform(.5, 1.5, 200))*1e-2
+        y = np.sin(t)[:, None]*np.array([1.0, 2.0, 3.0])
+
+        dy = time_derivative(y, t)
+        assert np.allclose(dy[1:-1], np.cos(t[1:-1])[:, None]*np.array([1.0, 2.0, 3.0]), atol=1e-3)
+
+        # A repeated time is a jump, differentiated on each side
+        dy = time_derivative([0.0, 1.0, 2.0, 5.0, 6.0, 7.0], [0.0, 1.0, 2.0, 2.0, 3.0, 4.0])
+        assert np.allclose(dy, 1.0)
@@ -0,0 +1,102 @@
+import numpy as np
+from openmdao.api import Group, Problem
+
+from hyperloop.Python.mission import route_profile
+from hyperloop.Python.mission.geodesy import ned_to_lat_long, lat_long_to_ned
+from hyperloop.Python.tube.tunnel_cost import TunnelCost
+
+def create_problem(component):
+    root = Group()
+    prob = Problem(root)
+    prob.root.add('comp', component)
+    return prob
+
+def terrain(depth, width=1000.0):
+    # Flat ground at 100 m with a valley of `depth` and `width` at 5 km
+    s = np.linspace(0.0, 10000.0, 201)
+    elev = 100.0 - depth*np.clip(1.0 - 2.0*np.abs(s - 5000.0)/width, 0.0, 1.0)
+    return s, elev
+
+class TestRouteProfile(object):
+    def test_case1_ned_round_trip(self):
+
+        lat, long = ned_to_lat_long(np.array([-50.0, 0.0, 120.0]), np.array([30.0, 0.0, -80.0]))
+        x, y = lat_long_to_ned(lat, long)
+
+        assert np.allclose(x, [-50.0, 0.0, 120.0])
+        assert np.allclose(y, [30.0, 0.0, -80.0])
+
+    def test_case2_grade_limited(self):
+
+        s = np.linspace(0.0, 1000.0, 11)
+        z = np.zeros(11)
+        z[5] = 100.0
+
+        z_track = route_profile.grade_limited(z, s, .05)
+
+        assert np.all(z_track <= z)
+        assert np.all(np.abs(np.diff(z_track)) <= .05*100.0 + 1e-9)
+
+        z[5] = -100.0
+        z_track = route_profile.grade_limited(z, s, .05)
+        assert np.allclose(z_track, np.minimum(0.0, -100.0 + .05*np.abs(s - 500.0)))
+
+    def test_case3_profile_and_cost(self):
+
+        profile = route_profile.profile_route([37.75, 36.6, 35.3, 34.06],
+                                              [-121.95, -120.9, -119.2, -118.25],
+                                              spacing=200.0, max_grade=.02)
+        cost = route_profile.route_cost(profile)
+
+        tunnel = profile['kind'] == route_profile.TUNNEL
+        elevated = profile['kind'] == route_profile.ELEVATED
+
+        assert np.all(profile['length'] <= 200.0 + 1e-6)
+        assert np.all(np.abs(np.tan(profile['grade'])) <= .02 + 1e-9)
+        assert np.all(profile['h'][elevated] >= 0.0)
+        assert np.all(profile['depth'][tunnel] > 0.0)
+        assert np.all(cost > 0.0)
+
+        # Tunnel segments add up to the cost of the whole tunnels
+        edges = np.diff(np.concatenate([[0], tunnel.astype(int), [0]]))
+        starts = np.where(edges == 1)[0]
+        ends = np.where(edges == -1)[0]
+        prob = create_problem(TunnelCost())
+        prob.setup(check=False)
+        total = 0.0
+        for a, b in zip(starts, ends):
+            prob['comp.length'] = profile['length'][a:b].sum()/1.0e3
+            prob.run()
+            total += prob['comp.cost']
+
+        assert np.isclose(cost[tunnel].sum(), total)
+
+    def test_case4_valley_bridged(self):
+
+        s, elev = terrain(30.0)
+        z = route_profile.track_profile(elev + 10.0, elev + 50.0, s, .02)
+
+        # Bridged on pylons, where the lower envelope alone tunnels it
+        h = z - elev
+        assert np.all(h >= 10.0 - 1e-9)
+        assert np.all(h <= 50.0 + 1e-9)
+        assert np.isclose(h.max(), 30.0)
+        assert np.all(np.abs(np.diff(z)) <= .02*np.diff(s) + 1e-9)
+        assert np.any(route_profile.grade_limited(elev + 10.0, s, .02) < elev)
+
+    def test_case5_deep_valley_and_hill(self):
+
+        s, elev = terrain(200.0)
+        z = route_profile.track_profile(elev + 10.0, elev + 50.0, s, .02)
+
+        # Too deep to bridge, so the track dips under the pylon limit and
+        # tunnels into the valley sides where the grade cannot follow
+        assert np.all(z - elev <= 50.0 + 1e-9)
+        assert np.all(np.abs(np.diff(z)) <= .02*np.diff(s) + 1e-9)
+        assert np.any(z < elev)
+
+        # A hill is climbed on pylons up to the limit, then tunnelled
+        z = route_profile.track_profile(-elev + 210.0, -elev + 250.0, s, .02)
+        assert np.all(z - (-elev + 200.0) <= 50.0 + 1e-9)
+        assert np.any(z > -elev + 210.0 + 1e-9)
+        assert np.any(z < -elev + 200.0)
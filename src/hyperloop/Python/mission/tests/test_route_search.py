@@ -0,0 +1,56 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from hyperloop.Python.mission.route_search import RouteGraph, HEADINGS
+
+def create_grid():
+    lat = np.linspace(35.0, 35.2, 25)
+    long = np.linspace(-120.0, -119.7, 30)
+    elev = np.random.RandomState(0).rand(25, 30)*300.0
+    elev[:, :5] = -5.0
+    elev[10, 10] = np.nan
+    return lat, long, elev
+
+class TestRouteSearch(object):
+    def test_case1_vs_node_graph(self):
+
+        lat, long, elev = create_grid()
+        routes = RouteGraph(lat, long, elev, max_turn=180.0)
+        route = routes.search((35.01, -119.99), (35.19, -119.71))
+
+        # Without a turn limit the heading states reduce to the plain node graph
+        d, i, j = np.nonzero(np.isfinite(routes.edge_cost))
+        graph = csr_matrix((routes.edge_cost[d, i, j],
+                            (i*30 + j, (i + HEADINGS[d, 0])*30 + j + HEADINGS[d, 1])),
+                           shape=(elev.size, elev.size))
+        i0, j0 = routes.node(35.01, -119.99)
+        i1, j1 = routes.node(35.19, -119.71)
+        dist = dijkstra(graph, indices=i0*30 + j0)
+
+        assert np.isclose(route['total_cost'], dist[i1*30 + j1])
+        assert np.isclose(route['cost'].sum(), route['total_cost'])
+        assert (route['lat'][-1], route['long'][-1]) == (lat[i1], long[j1])
+
+    def test_case2_turn_limit(self):
+
+        lat, long, elev = create_grid()
+        route = RouteGraph(lat, long, elev, max_turn=180.0).search((35.01, -119.99), (35.19, -119.71))
+        limited = RouteGraph(lat, long, elev, max_turn=45.0).search((35.01, -119.99), (35.19, -119.71))
+
+        i = np.round((limited['lat'] - lat[0])/(lat[1] - lat[0])).astype(int)
+        j = np.round((limited['long'] - long[0])/(long[1] - long[0])).astype(int)
+        steps = [tuple(step) for step in HEADINGS]
+        heading = np.array([steps.index(step) for step in zip(np.diff(i), np.diff(j))])
+        turn = np.abs(np.diff(heading))
+
+        assert np.all(np.minimum(turn, 8 - turn) <= 1)
+        assert limited['total_cost'] >= route['total_cost']
+
+    def test_case3_grade_without_tunnels(self):
+
+        lat, long, elev = create_grid()
+        routes = RouteGraph(lat, long, elev, max_grade=1e-4, tunnels=False)
+
+        assert np.isinf(routes.search((35.01, -119.99), (35.19, -119.71))['total_cost'])
+        assert routes.search((35.01, -119.99), (35.01, -119.99))['total_cost'] == 0.0
@@ -0,0 +1,62 @@
+import numpy as np
+from openmdao.api import Group, Problem
+
+from hyperloop.Python.sample_mission import SampleMission
+from hyperloop.Python.mission.route_simulator import RouteSimulator, Section, periodic_route, split_grades
+
+def create_problem(component):
+    root = Group()
+    prob = Problem(root)
+    prob.root.add('comp', component)
+    return prob
+
+class TestRouteSimulator(object):
+    def test_case1_vs_sample_mission(self):
+
+        prob = create_problem(SampleMission())
+        prob.setup(check=False)
+        prob['comp.nozzle_thrust'] = 3500.0
+        prob.run()
+
+        v_cruise = prob['comp.M_pod']*np.sqrt(prob['comp.gam']*prob['comp.R']*prob['comp.T_tunnel'])
+        sections = periodic_route(prob['comp.track_length'], prob['comp.dx_start'],
+                                  prob['comp.prop_period'], prob['comp.dx_boost'])
+        sim = RouteSimulator(sections, v_cruise=v_cruise, Cd=prob['comp.Cd'], S=prob['comp.S'],
+                             p_tube=prob['comp.p_tunnel'], T_ambient=prob['comp.T_tunnel'],
+                             R=prob['comp.R'], D_magnetic=prob['comp.D_mag'],
+                             Thrust_pod=prob['comp.nozzle_thrust'] - prob['comp.ram_drag'],
+                             m_pod=prob['comp.m_pod'], g=prob['comp.g'])
+        hist = sim.run()
+
+        coasts = [event for event in sim.events if event.kind == 'coast']
+        boosters = [event for event in sim.events if event.kind == 'booster']
+
+        assert np.isclose(boosters[1].t - coasts[0].t, prob['comp.coast_time'], rtol=1e-6)
+        assert np.isclose(boosters[1].v, v_cruise - 15.0, rtol=1e-6)
+        assert sim.events[-1].kind == 'arrive'
+        assert np.isclose(hist['x'][-1], prob['comp.track_length'])
+        assert np.all(np.diff(hist['t']) >= 0.0)
+
+    def test_case2_chunks(self):
+
+        sim = RouteSimulator([Section(7000.0, True, 0.0), Section(20000.0, False, 0.0)])
+
+        chunks = list(sim.histories(chunk_size=100))
+        hist = sim.run()
+
+        assert all(len(chunk['t']) <= 100 for chunk in chunks)
+        assert sum(len(chunk['t']) for chunk in chunks) == len(hist['t'])
+        assert np.allclose(hist['power'], hist['thrust']*hist['v'])
+        assert [event.kind for event in sim.events] == ['booster', 'cruise', 'coast', 'arrive']
+
+    def test_case3_stall_on_grade(self):
+
+        sections = split_grades([Section(5000.0, True, 0.0), Section(100000.0, False, 0.0)],
+                                [(10000.0, .05)])
+        sim = RouteSimulator(sections, Thrust_pod=0.0)
+        hist = sim.run()
+
+        assert len(sections) == 3
+        assert sim.events[-1].kind == 'stall'
+        assert hist['v'][-1] == 0.0
+        assert hist['x'][-1] < 105000.0
@@ -0,0 +1,45 @@
+import numpy as np
+
+from hyperloop.Python.mission.route_simulator import periodic_route
+from hyperloop.Python.mission.traffic import TrafficSimulator
+
+def create_simulator(**kwargs):
+    sections = periodic_route(60.0e3, 5.0e3, 10.0e3, 1.0e3)
+    return TrafficSimulator(sections, sections, operating_time=2.0*3600.0, v_cruise=286.86,
+                            Thrust_pod=0.0, **kwargs)
+
+class TestTraffic(object):
+    def test_case1_free_fleet(self):
+
+        sim = create_simulator(pod_period=120.0, dwell_time=300.0)
+        report = sim.run()
+
+        trip_time = sim.profiles[0].trip_time
+        assert len(sim.trips) == 2*60
+        assert report['fleet_size'] == 2*np.ceil((trip_time + 300.0)/120.0)
+        assert all(np.all(delay == 0.0) for delay in report['delay'])
+        assert all(np.allclose(headway, 120.0) for headway in report['headway'])
+        assert all(np.all(conflicts == 0) for conflicts in report['conflicts'])
+        assert all(np.all(occupancy == 1) for occupancy in report['max_occupancy'])
+
+    def test_case2_fixed_fleet(self):
+
+        sim = create_simulator(pod_period=60.0, dwell_time=300.0, num_pods=10, min_headway=90.0)
+        report = sim.run()
+
+        assert report['fleet_size'] == 10
+        assert len(sim.trips) == 2*120
+        assert max(delay.max() for delay in report['delay']) > 0.0
+        assert min(headway.min() for headway in report['headway']) >= 90.0 - 1e-9
+        assert 0.0 < report['utilization'] <= 1.0
+
+    def test_case3_booster_power(self):
+
+        sim = create_simulator(pod_period=120.0, dwell_time=300.0, eta=.8)
+        report = sim.run()
+
+        # Every departure draws the boosters' work over eta once
+        work = [np.sum(profile.power)*profile.dt for profile in sim.profiles]
+        energy = np.sum(report['power'])*sim.dt
+        assert np.isclose(energy, 60*(work[0] + work[1])/.8, rtol=1e-12)
+        assert report['power'][-1] == 0.0
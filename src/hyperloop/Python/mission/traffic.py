@@ -0,0 +1,311 @@
+"""
+Simulates a day of pod traffic between two terminals.
+
+`TicketCost` sizes the fleet as ceil(trip time/pod_period) and `TubeWallTemp`
+takes `num_pods` as a given. `TrafficSimulator` dispatches pods from a heap
+of events instead:
+
+* every terminal schedules a departure every `pod_period` during
+  `operating_time`
+* a departure takes a pod that is ready at that terminal. With a free fleet a
+  new pod is added when none is, with a fixed `num_pods` the departure waits
+* pods fly the boost/coast profile of `RouteSimulator`, entering and leaving
+  every booster section at fixed offsets from their departure
+* after arriving a pod dwells for `dwell_time` before it is ready again at
+  the other terminal
+
+Each direction has its own tube. The way back is the route reversed, unless
+it is given separately, e.g. to start it with a launch booster as well. The
+pods' state is kept in flat arrays, and booster occupancy is counted as pods
+enter and leave.
+"""
+from __future__ import print_function
+
+import heapq
+from collections import deque, OrderedDict
+
+import numpy as np
+
+from hyperloop.Python.mission.route_simulator import RouteSimulator, Section
+
+# Event kinds, in the order they are handled at equal times
+EXIT, ARRIVE, READY, ENTER, SLOT, DISPATCH = range(6)
+
+
+class TripProfile(object):
+    """
+    Booster occupancy and power of one trip, from a `RouteSimulator` run.
+
+    Params
+    ------
+    sim : RouteSimulator
+        Simulator of the route in the direction of travel.
+    dt : float
+        Spacing of the sampled booster power in s.
+
+    Notes
+    -----
+    `boosters` is the index of every booster section, and `enter` and `exit`
+    the times after departure the pod enters and leaves it. `power` is the
+    power the boosters put into the pod, sampled every `dt` from departure.
+    """
+
+    def __init__(self, sim, dt=1.0):
+        hist = sim.run()
+        starts = [event for event in sim.events if event.kind in ('booster', 'coast')]
+        if sim.events[-1].kind != 'arrive':
+            raise ValueError('pod stalls at x = %f m' % sim.events[-1].x)
+
+        bounds = [event.t for event in starts] + [sim.events[-1].t]
+        self.boosters = np.array([i for i, section in enumerate(sim.sections) if section.booster],
+                                 dtype=int)
+        self.enter = np.array([bounds[i] for i in self.boosters])
+        self.exit = np.array([bounds[i + 1] for i in self.boosters])
+        self.trip_time = bounds[-1]
+
+        # A point belongs to the section its x falls in, so the points shared
+        # by two sections count as coast when either of them is one
+        edges = np.cumsum([section.length for section in sim.sections])
+        section = np.minimum(np.searchsorted(edges, hist['x'], side='left'), len(edges) - 1)
+        booster = np.array([s.booster for s in sim.sections])[section]
+        self.dt = dt
+        self.power = np.interp(np.arange(0.0, self.trip_time + dt, dt), hist['t'],
+                               np.where(booster, hist['power'], 0.0))
+
+
+class TrafficSimulator(object):
+    """
+    Discrete event simulation of pods shuttling between two terminals.
+
+    Params
+    ------
+    sections : list of Section
+        Route from terminal 0 to terminal 1, as for `RouteSimulator`.
+    return_sections : list of Section
+        Route from terminal 1 to terminal 0, or None for `sections` reversed.
+        Default value is None.
+    pod_period : float
+        Time between scheduled departures from each terminal. Default value
+        is 120.0 s
+    operating_time : float
+        Time departures are scheduled over. Default value is 16.0*3600 s
+    dwell_time : float
+        Time from arrival until the pod can leave again. Default value is
+        300.0 s
+    num_pods : int
+        Fleet size, split evenly between the terminals at t = 0, or None to
+        add pods whenever a departure finds none ready. Default value is None.
+    min_headway : float
+        Least time between departures from a terminal. Default value is
+        `pod_period`.
+    eta : float
+        Efficiency of the boosters, as in `TicketCost`. Default value is .8
+    dt : float
+        Spacing of the power and traffic time series in s. Default value
+        is 1.0 s
+    **kwargs
+        Pod and tube params passed on to `RouteSimulator`.
+
+    Notes
+    -----
+    Pods that follow each other in the same tube keep their departure
+    headway at every section, so the headways reported are those at
+    departure. Departures are rounded to `dt` in the power series.
+    """
+
+    def __init__(self, sections, return_sections=None, pod_period=120.0,
+                 operating_time=16.0*3600.0, dwell_time=300.0, num_pods=None, min_headway=None,
+                 eta=.8, dt=1.0, **kwargs):
+        self.pod_period = pod_period
+        self.operating_time = operating_time
+        self.dwell_time = dwell_time
+        self.num_pods = num_pods
+        self.min_headway = pod_period if min_headway is None else min_headway
+        self.eta = eta
+        self.dt = dt
+
+        self.sections = list(sections)
+        if return_sections is None:
+            return_sections = [Section(s.length, s.booster, -s.theta)
+                               for s in reversed(self.sections)]
+        self.return_sections = list(return_sections)
+        routes = [self.sections, self.return_sections]
+        self.profiles = [TripProfile(RouteSimulator(route, **kwargs), dt) for route in routes]
+
+    def _add_pod(self, terminal, t):
+        # Grows the pod arrays by doubling
+        n = self.fleet_size
+        if n == len(self.pod_terminal):
+            size = max(2*n, 16)
+            self.pod_terminal = np.resize(self.pod_terminal, size)
+            self.pod_trips = np.resize(self.pod_trips, size)
+            self.pod_busy = np.resize(self.pod_busy, size)
+        self.pod_terminal[n] = terminal
+        self.pod_trips[n] = 0
+        self.pod_busy[n] = 0.0
+        self.fleet_size += 1
+        return n
+
+    def _push(self, t, kind, *data):
+        self._seq += 1
+        heapq.heappush(self._queue, (t, kind, self._seq) + data)
+
+    def _dispatch(self, terminal, t):
+        waiting = self._waiting[terminal]
+        ready = self._ready[terminal]
+        while waiting and (ready or self.num_pods is None):
+            t_next = self._last[terminal] + self.min_headway
+            if t < t_next:
+                # Late departures push the ones after them back
+                if not self._held[terminal]:
+                    self._held[terminal] = True
+                    self._push(t_next, DISPATCH, terminal)
+                return
+            slot = waiting.popleft()
+            pod = ready.popleft() if ready else self._add_pod(terminal, t)
+            self._depart(pod, terminal, slot, t)
+
+    def _depart(self, pod, terminal, slot, t):
+        profile = self.profiles[terminal]
+        self._last[terminal] = t
+        self.trips.append((pod, terminal, slot, t))
+        self.pod_terminal[pod] = -1
+        self.pod_trips[pod] += 1
+        self.pod_busy[pod] += profile.trip_time
+        for k in range(len(profile.boosters)):
+            self._push(t + profile.enter[k], ENTER, terminal, k)
+            self._push(t + profile.exit[k], EXIT, terminal, k)
+        self._push(t + profile.trip_time, ARRIVE, pod, 1 - terminal)
+
+    def run(self):
+        """
+        Runs the day.
+
+        Returns
+        -------
+        report : OrderedDict
+            'fleet_size', the pods used, 'utilization', the fraction of the
+            fleet's time from first departure to last arrival spent moving,
+            'delay' and 'headway' of every departure per terminal, per
+            booster and direction 'booster_utilization', 'max_occupancy'
+            and 'conflicts' (entries into an occupied booster), and the time
+            series 't', 'power' drawn by the boosters and 'pods_moving'.
+        """
+        self._queue = []
+        self._seq = 0
+        self._waiting = [deque() for profile in self.profiles]
+        self._ready = [deque() for profile in self.profiles]
+        self._last = [-np.inf for profile in self.profiles]
+        self._held = [False for profile in self.profiles]
+        self.trips = []
+        self.fleet_size = 0
+        self.pod_terminal = np.zeros(0, dtype=int)
+        self.pod_trips = np.zeros(0, dtype=int)
+        self.pod_busy = np.zeros(0)
+
+        if self.num_pods is not None:
+            for i in range(self.num_pods):
+                terminal = i % 2
+                self._ready[terminal].append(self._add_pod(terminal, 0.0))
+
+        num_boosters = [len(profile.boosters) for profile in self.profiles]
+        occupancy = [np.zeros(n, dtype=int) for n in num_boosters]
+        max_occupancy = [np.zeros(n, dtype=int) for n in num_boosters]
+        conflicts = [np.zeros(n, dtype=int) for n in num_boosters]
+        busy = [np.zeros(n) for n in num_boosters]
+        busy_since = [np.zeros(n) for n in num_boosters]
+
+        for terminal in range(len(self.profiles)):
+            self._push(0.0, SLOT, terminal)
+
+        t_end = 0.0
+        while self._queue:
+            event = heapq.heappop(self._queue)
+            t, kind = event[0], event[1]
+            if kind == ENTER:
+                d, k = event[3:]
+                if occupancy[d][k]:
+                    conflicts[d][k] += 1
+                else:
+                    busy_since[d][k] = t
+                occupancy[d][k] += 1
+                max_occupancy[d][k] = max(max_occupancy[d][k], occupancy[d][k])
+            elif kind == EXIT:
+                d, k = event[3:]
+                occupancy[d][k] -= 1
+                if not occupancy[d][k]:
+                    busy[d][k] += t - busy_since[d][k]
+            elif kind == ARRIVE:
+                pod, terminal = event[3:]
+                t_end = t
+                self._push(t + self.dwell_time, READY, pod, terminal)
+            elif kind == READY:
+                pod, terminal = event[3:]
+                self.pod_terminal[pod] = terminal
+                self._ready[terminal].append(pod)
+                self._dispatch(terminal, t)
+            elif kind == SLOT:
+                terminal = event[3]
+                self._waiting[terminal].append(t)
+                if t + self.pod_period < self.operating_time:
+                    self._push(t + self.pod_period, SLOT, terminal)
+                self._dispatch(terminal, t)
+            else:
+                terminal = event[3]
+                self._held[terminal] = False
+                self._dispatch(terminal, t)
+
+        trips = np.array(self.trips, dtype=float).reshape(-1, 4)
+        terminal = trips[:, 1].astype(int)
+        t_start = trips[:, 3].min()
+        n = self.fleet_size
+
+        # Superpose every departure's booster power and time in the tube
+        steps = np.arange(0, int(np.ceil(t_end/self.dt)) + 2)
+        power = np.zeros(len(steps))
+        moving = np.zeros(len(steps))
+        for d, profile in enumerate(self.profiles):
+            starts = np.bincount(np.round(trips[terminal == d, 3]/self.dt).astype(int),
+                                 minlength=len(steps))
+            power += np.convolve(starts, profile.power)[:len(steps)]/self.eta
+            moving += np.convolve(starts, np.ones(len(profile.power) - 1))[:len(steps)]
+
+        span = t_end - t_start
+        report = OrderedDict()
+        report['fleet_size'] = n
+        report['utilization'] = np.sum(self.pod_busy[:n])/(n*span)
+        report['delay'] = [trips[terminal == d, 3] - trips[terminal == d, 2]
+                           for d in range(len(self.profiles))]
+        report['headway'] = [np.diff(trips[terminal == d, 3]) for d in range(len(self.profiles))]
+        report['booster_utilization'] = [b/span for b in busy]
+        report['max_occupancy'] = max_occupancy
+        report['conflicts'] = conflicts
+        report['t'] = steps*self.dt
+        report['power'] = power
+        report['pods_moving'] = moving
+        return report
+
+if __name__ == '__main__':
+    import time
+
+    from hyperloop.Python.mission.route_simulator import periodic_route
+
+    #A day of departures every 30 s each way on a flat 600 km route with a
+    #booster every 25 km, coasting in between
+    sections = periodic_route(600.0e3, 11.0e3, 25.0e3, 1.0e3)
+
+    t0 = time.time()
+    sim = TrafficSimulator(sections, sections, pod_period=30.0, dwell_time=300.0,
+                           v_cruise=286.86, Thrust_pod=0.0)
+    report = sim.run()
+    elapsed = time.time() - t0
+
+    trip_time = sim.profiles[0].trip_time
+    print('Departures                %d' % len(sim.trips))
+    print('Trip time                 %f s' % trip_time)
+    print('Fleet size                %d (TicketCost estimate %d per direction)'
+          % (report['fleet_size'], np.ceil(trip_time/sim.pod_period)))
+    print('Fleet utilization         %f' % report['utilization'])
+    print('Peak booster power        %f MW' % (report['power'].max()/1.0e6))
+    print('Booster conflicts         %d' % sum(c.sum() for c in report['conflicts']))
+    print('Simulated in              %f s' % elapsed)
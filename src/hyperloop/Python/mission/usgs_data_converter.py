@@ -4,43 +4,20 @@ import matplotlib.pylab as plt
 
 data = np.loadtxt('SF_LA_usgs_data.txt', skiprows=1, delimiter=",")
 
-old_lon = None
-old_lat = None
+# Rows of the grid are latitudes, columns longitudes
+unique_long, i_lon = np.unique(data[:, 0], return_inverse=True)
+unique_lat, i_lat = np.unique(data[:, 1], return_inverse=True)
 
-lons = set(data[:, 0])
-lats = set(data[:, 1])
+Elevation = np.empty((len(unique_lat), len(unique_long)))
+Elevation[i_lat, i_lon] = data[:, 2]
+Longitude, Latitude = np.meshgrid(unique_long, unique_lat)
 
-n_lons = len(lons)
-n_lats = len(lats)
-
-Longitude = np.empty((n_lons, n_lats))
-Latitude = np.empty((n_lons, n_lats))
-Elevation = np.empty((n_lons, n_lats))
-
-i_lon = -1
-i_lat = -1
-
-old_lon = None
-old_lat = None
-
-for i, (lon, lat, z) in enumerate(data):
-    if old_lon != lon:
-        old_lon = lon
-        i_lon += 1
-
-    if old_lat != lat:
-        old_lat = lat
-        i_lon = 0 # need to reset the column counter
-        i_lat += 1  # move to the next row
-
-    Longitude[i_lat, i_lon] = lon
-    Latitude[i_lat, i_lon] = lat
-    Elevation[i_lat, i_lon] = z
-
-unique_long = Longitude[0, :]
-unique_lat = Latitude[:, 0]
 np.savez('usgs_data', Longitude = unique_long, Latitude = unique_lat, Elevation = Elevation)
 
+# Routes outside this grid, or too large to hold in memory, use a tile store
+# instead, see dem_tiles.py:
+# dem_tiles.convert_usgs_text('SF_LA_usgs_data.txt', 'usgs_tiles', resolution=1/120.)
+
 fig, ax = plt.subplots()
 contour_data = ax.contourf(Longitude, Latitude, Elevation)
 ax.set_xlabel("Longitude")
@@ -2,6 +2,24 @@ from __future__ import print_function
 import numpy as np
 from openmdao.api import Component, Problem, Group
 
+def comp_len_kernel(p):
+    """
+    Vectorized CompressorLen. Takes a dict of params by name, as scalars or
+    arrays of design points, and returns a dict of outputs.
+    """
+    comp_inletArea = p['comp_inletArea']
+    h_out = p['h_out']
+    h_in = p['h_in']
+    h_stage = p['h_stage']
+
+    #Calculating Length of Compressor.
+    comp_r = np.sqrt(comp_inletArea/np.pi)
+    hub_tip_ratio = (np.sqrt(comp_r**2 - (comp_inletArea / 3.1416))) / comp_r
+    no_stages = ((h_out - h_in)/ h_stage) + 1
+
+    return {'comp_len' : 0.2 + (0.234 - 0.218*hub_tip_ratio)*(no_stages)*comp_r*2}
+
+
 class CompressorLen(Component):
     """
     The CompressorLen class represents a compressor length component
@@ -57,19 +75,11 @@ class CompressorLen(Component):
                     desc='Length of Compressor',
                     units='m')
 
-    def solve_nonlinear(self, params, unknowns, resids):
-        comp_inletArea = params['comp_inletArea']
-        h_out = params['h_out']
-        h_in = params['h_in']
-        h_stage = params['h_stage']
-
-        #Calculating Length of Compressor.
-        comp_r = np.sqrt(comp_inletArea/np.pi)
-        hub_tip_ratio = (np.sqrt(comp_r**2 - (comp_inletArea / 3.1416))) / comp_r
-        no_stages = ((h_out - h_in)/ h_stage) + 1
+    kernel = staticmethod(comp_len_kernel)
 
-
-        unknowns['comp_len'] = 0.2 + (0.234 - 0.218*hub_tip_ratio)*(no_stages)*comp_r*2
+    def solve_nonlinear(self, params, unknowns, resids):
+        for name, val in comp_len_kernel(params).items():
+            unknowns[name] = val
 
 if __name__ == "__main__":
     top = Problem()
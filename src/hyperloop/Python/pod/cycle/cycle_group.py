@@ -14,21 +14,54 @@ from openmdao.solvers.scipy_gmres import ScipyGMRES
 from openmdao.units.units import convert_units as cu
 from openmdao.api import Problem, LinearGaussSeidel
 
-from pycycle.components import Compressor, Shaft, FlowStart, Inlet, Nozzle, Duct, Splitter, FlightConditions
-from pycycle.species_data import janaf
-from pycycle.connect_flow import connect_flow
-from pycycle.constants import AIR_FUEL_MIX, AIR_MIX
-from pycycle.constants import R_UNIVERSAL_ENG, R_UNIVERSAL_SI
-
 from openmdao.solvers.ln_gauss_seidel import LinearGaussSeidel
 from openmdao.solvers.ln_direct import DirectSolver
 from openmdao.api import SqliteRecorder
 
-from hyperloop.Python.pod.cycle.flow_path import FlowPath
+from hyperloop.Python.pod.cycle.lite_flow_path import LiteFlowPath
 from hyperloop.Python.pod.cycle.compressor_mass import CompressorMass
 from hyperloop.Python.pod.cycle.comp_len import CompressorLen
 from hyperloop.Python.pod.cycle.flow_path_inputs import FlowPathInputs
 
+# FlowPath variables Cycle promotes to its own level
+FLOW_PATH_PROMOTES = ['comp.trq', 'comp.power', 'nozzle.Fg', 'inlet.F_ram', 'nozzle.Fl_O:stat:W',
+                      'comp.Fl_O:stat:area', 'comp.map.PRdes', 'nozzle.Ps_exhaust', 'nozzle.Fl_O:tot:T']
+
+def flow_path_variable(name, cycle='Cycle'):
+    """
+    Problem level name of FlowPath variable `name` in the Cycle at path
+    `cycle`, which differs for the variables Cycle promotes.
+    """
+    if name in FLOW_PATH_PROMOTES:
+        return '%s.%s' % (cycle, name)
+    return '%s.FlowPath.%s' % (cycle, name)
+
+def create_flow_path(surrogate=None, table=None, fidelity='pycycle', input_vars=True):
+    """
+    FlowPath, FlowPathSurrogate or FlowPathTable, depending on which data
+    file is given, or LiteFlowPath for the 'lite' fidelity. `input_vars` is
+    passed on to FlowPath and LiteFlowPath.
+
+    The pycycle backed flow paths are imported here, so the lite fidelity
+    runs where pycycle is not installed.
+    """
+    if fidelity not in ('pycycle', 'lite'):
+        raise ValueError("fidelity must be 'pycycle' or 'lite', not %r" % (fidelity,))
+    if surrogate is not None and table is not None:
+        raise ValueError('Cycle takes either a surrogate or a table, not both')
+    if fidelity == 'lite':
+        if surrogate is not None or table is not None:
+            raise ValueError('The lite fidelity takes no surrogate or table')
+        return LiteFlowPath(input_vars=input_vars)
+    if surrogate is not None:
+        from hyperloop.Python.pod.cycle.flow_path_surrogate import FlowPathSurrogate
+        return FlowPathSurrogate(surrogate)
+    if table is not None:
+        from hyperloop.Python.pod.cycle.flow_path_table import FlowPathTable
+        return FlowPathTable(table)
+    from hyperloop.Python.pod.cycle.flow_path import FlowPath
+    return FlowPath(input_vars=input_vars)
+
 class Cycle(Group):
     """
 	Params
@@ -66,6 +99,16 @@ class Cycle(Group):
         Total temperature at nozzle exit (degR)
     nozzle.Fl_O:stat:W : float
         Total mass flow rate at nozzle exit (lbm/s)
+
+    Notes
+    -----
+    Passing `surrogate`, the training data file written by
+    flow_path_surrogate.generate_training_data, replaces the pycycle
+    FlowPath with a FlowPathSurrogate that falls back to pycycle outside
+    its training envelope. Passing `table`, a file written by
+    flow_path_table.generate_table, uses a FlowPathTable the same way.
+    `fidelity='lite'` replaces it with the perfect-gas LiteFlowPath, for
+    screening studies that do not need the janaf thermodynamics.
 	
     References
     ----------
@@ -73,15 +116,15 @@ class Cycle(Group):
 	.. [2] NASA-Glenn NPSS compressor cycle model.
     """
 
-    def __init__(self):
+    def __init__(self, surrogate=None, table=None, fidelity='pycycle'):
         super(Cycle, self).__init__()
 
+        flow_path = create_flow_path(surrogate, table, fidelity)
+
         self.add('CompressorLen', CompressorLen(), promotes=['comp_len'])
         self.add('CompressorMass', CompressorMass(), promotes=['comp_mass'])
         self.add('FlowPathInputs', FlowPathInputs(), promotes=['pod_mach', 'tube_pressure', 'tube_temp', 'comp_inlet_area'])
-        self.add('FlowPath', FlowPath(), promotes=['comp.trq', 'comp.power', 'nozzle.Fg', 'inlet.F_ram',
-                                                    'nozzle.Fl_O:stat:W', 'comp.Fl_O:stat:area', 'comp.map.PRdes', 
-                                                    'nozzle.Ps_exhaust', 'nozzle.Fl_O:tot:T'])
+        self.add('FlowPath', flow_path, promotes=FLOW_PATH_PROMOTES)
         
         # Connects cycle group level variables to downstream components
         self.connect('pod_mach', 'FlowPath.fl_start.MN_target')
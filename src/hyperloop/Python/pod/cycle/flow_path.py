@@ -20,6 +20,7 @@ from pycycle.species_data import janaf
 from pycycle.connect_flow import connect_flow
 from pycycle.constants import AIR_FUEL_MIX, AIR_MIX
 from pycycle.constants import R_UNIVERSAL_ENG, R_UNIVERSAL_SI
+from hyperloop.Python.tools.thermo_cache import MemoizedFlowStart
 
 from openmdao.solvers.ln_gauss_seidel import LinearGaussSeidel
 from openmdao.solvers.ln_direct import DirectSolver
@@ -71,9 +72,14 @@ class FlowPath(Group):
     Notes
     -----
     [1] see https://github.com/jcchin/pycycle2/wiki
+
+    With `input_vars` False the design inputs (efficiency, shaft speed,
+    duct and nozzle losses, element Mach numbers) get no IndepVarComp and
+    the params in `des_var_targets` are left to be connected, e.g. to the
+    input_vars of the design point FlowPath.
     """
 
-    def __init__(self):
+    def __init__(self, input_vars=True):
         super(FlowPath, self).__init__()
 
         des_vars = (('ram_recovery', 0.99),
@@ -86,9 +92,22 @@ class FlowPath(Group):
                     ('inlet_MN', 0.6),
                     ('comp_MN', 0.65))
 
-        self.add('input_vars',IndepVarComp(des_vars))
-
-        self.add('fl_start', FlowStart(thermo_data=janaf, elements=AIR_MIX))
+        # Params set by input_vars, or by another FlowPath's input_vars when
+        # this one has none
+        self.des_var_targets = (('ram_recovery', 'inlet.ram_recovery'),
+                                ('effDes', 'comp.map.effDes'),
+                                ('duct_MN', 'duct.MN_target'),
+                                ('duct_dPqP', 'duct.dPqP'),
+                                ('nozzle_Cfg', 'nozzle.Cfg'),
+                                ('nozzle_dPqP', 'nozzle.dPqP'),
+                                ('shaft_Nmech', 'shaft.Nmech'),
+                                ('inlet_MN', 'inlet.MN_target'),
+                                ('comp_MN', 'comp.MN_target'))
+
+        if input_vars:
+            self.add('input_vars',IndepVarComp(des_vars))
+
+        self.add('fl_start', MemoizedFlowStart(thermo_data=janaf, elements=AIR_MIX))
         # internal flow
         self.add('inlet', Inlet(thermo_data=janaf, elements=AIR_MIX))
         self.add('comp', Compressor(thermo_data=janaf, elements=AIR_MIX))
@@ -102,15 +121,9 @@ class FlowPath(Group):
         connect_flow(self, 'comp.Fl_O', 'duct.Fl_I')
         connect_flow(self, 'duct.Fl_O', 'nozzle.Fl_I')
 
-        self.connect('input_vars.ram_recovery', 'inlet.ram_recovery')
-        self.connect('input_vars.effDes', 'comp.map.effDes')
-        self.connect('input_vars.duct_MN', 'duct.MN_target')
-        self.connect('input_vars.duct_dPqP', 'duct.dPqP')
-        self.connect('input_vars.nozzle_Cfg', 'nozzle.Cfg')
-        self.connect('input_vars.nozzle_dPqP', 'nozzle.dPqP')
-        self.connect('input_vars.shaft_Nmech', 'shaft.Nmech')
-        self.connect('input_vars.inlet_MN', 'inlet.MN_target')
-        self.connect('input_vars.comp_MN', 'comp.MN_target')
+        if input_vars:
+            for name, target in self.des_var_targets:
+                self.connect('input_vars.' + name, target)
 
         self.connect('comp.trq', 'shaft.trq_0')
         self.connect('shaft.Nmech', 'comp.Nmech')
@@ -6,6 +6,33 @@ import numpy as np
 
 from openmdao.api import Group, Component, IndepVarComp, Problem
 
+def flow_path_inputs_kernel(p):
+    """
+    Vectorized FlowPathInputs. Takes a dict of params by name, as scalars or
+    arrays of design points, and returns a dict of outputs.
+    """
+    tube_pressure = p['tube_pressure']
+    pod_mach = p['pod_mach']
+    comp_inlet_area = p['comp_inlet_area']
+    tube_temp = p['tube_temp']
+    gamma = p['gamma']
+    comp_mach = p['comp_mach']
+    R = p['R']
+
+    Tt = tube_temp*(1+((gamma-1)/2)*(pod_mach**2))
+    Pt = tube_pressure*((1+((gamma-1)/2)*(pod_mach**2))**(gamma/(gamma-1.0)))
+    rho = tube_pressure/(R*tube_temp)
+    rho_t = rho*((1+((gamma-1)/2))**(1/(gamma-1)))
+
+    rho_comp = rho_t/((1+((gamma-1)/2)*(comp_mach**2))**(1/(gamma-1)))
+    T_comp = Tt/(1+((gamma-1)/2)*(comp_mach**2))
+    m_dot = rho_comp*comp_inlet_area*comp_mach*np.sqrt(gamma*R*T_comp)
+
+    return {'Pt' : Pt,
+            'Tt' : Tt,
+            'm_dot' : m_dot}
+
+
 class FlowPathInputs(Component):
     """
 	Params
@@ -86,31 +113,11 @@ class FlowPathInputs(Component):
                          desc='mass flow rate',
                          units='kg/s')
 
+    kernel = staticmethod(flow_path_inputs_kernel)
+
     def solve_nonlinear(self, params, unknowns, resids):
-        tube_pressure = params['tube_pressure']
-        pod_mach = params['pod_mach']
-        comp_inlet_area = params['comp_inlet_area']
-        tube_temp = params['tube_temp']
-        gamma = params['gamma']
-        comp_mach = params['comp_mach']
-        R = params['R']
-        eta = params['eta']
-
-        Tt = tube_temp*(1+((gamma-1)/2)*(pod_mach**2))
-        Pt = tube_pressure*((1+((gamma-1)/2)*(pod_mach**2))**(gamma/(gamma-1.0)))
-        rho = tube_pressure/(R*tube_temp)
-        rho_t = rho*((1+((gamma-1)/2))**(1/(gamma-1)))
-
-        p02 = tube_pressure*((1 + eta*((Tt/tube_temp)-1))**(gamma/(gamma-1)))
-        rho_2 = rho_t*((p02/Pt)**(1/gamma))
-
-        rho_comp = rho_t/((1+((gamma-1)/2)*(comp_mach**2))**(1/(gamma-1)))
-        T_comp = Tt/(1+((gamma-1)/2)*(comp_mach**2))
-        m_dot = rho_comp*comp_inlet_area*comp_mach*np.sqrt(gamma*R*T_comp)
-
-        unknowns['Pt'] = Pt
-        unknowns['Tt'] = Tt
-        unknowns['m_dot'] = m_dot
+        for name, val in flow_path_inputs_kernel(params).items():
+            unknowns[name] = val
 
 if __name__ == "__main__":
     top = Problem()
@@ -0,0 +1,247 @@
+"""
+Surrogate backed FlowPath for wide trade studies.
+
+The pycycle FlowPath is the most expensive part of a PodGroup evaluation,
+but its outputs are smooth functions of the flow start conditions and the
+compressor pressure ratio. `FlowPathSurrogate` is a FlowPath that answers
+from Kriging models trained offline on the full Cycle, and only runs the
+pycycle elements when a point falls outside the training envelope or the
+Kriging error estimate is larger than the requested tolerance.
+"""
+from __future__ import print_function
+import functools
+
+import numpy as np
+
+from openmdao.api import Group, Problem, IndepVarComp
+from openmdao.surrogate_models.kriging import KrigingSurrogate
+
+from hyperloop.Python.pod.cycle.flow_path import FlowPath
+from hyperloop.Python.tools.sweep import Sweep
+
+# FlowPath level inputs the surrogate is fit on, in FlowPath units
+SURROGATE_INPUTS = ('fl_start.MN_target', 'fl_start.P', 'fl_start.T', 'fl_start.W', 'comp.map.PRdes')
+
+SURROGATE_OUTPUTS = ('comp.trq', 'comp.power', 'comp.Fl_O:stat:area', 'comp.Fl_O:tot:h',
+                     'inlet.F_ram', 'inlet.Fl_O:tot:h',
+                     'nozzle.Fg', 'nozzle.Fl_O:stat:W', 'nozzle.Fl_O:tot:T')
+
+# Outputs that scale with mass flow, and the duct area which also scales
+# inversely with pressure. They are fit per unit W (and per unit W/P) so
+# the Kriging models only see the weak remaining dependence.
+EXTENSIVE_OUTPUTS = ('comp.trq', 'comp.power', 'comp.Fl_O:stat:area',
+                     'inlet.F_ram', 'nozzle.Fg', 'nozzle.Fl_O:stat:W')
+
+# Cycle level training envelope
+CYCLE_BOUNDS = (('pod_mach', .5, .9),
+                ('tube_pressure', 40., 4000.),
+                ('tube_temp', 280., 340.),
+                ('comp_PR', 2., 15.),
+                ('comp_inlet_area', 1., 4.))
+
+
+def create_problem(surrogate=None, table=None, fidelity='pycycle'):
+    """
+    Cycle with its inputs on a des_vars IndepVarComp. Used to generate
+    training data and to compare the surrogate, table or lite fidelity
+    against pycycle.
+    """
+    from hyperloop.Python.pod.cycle.cycle_group import Cycle
+
+    prob = Problem()
+    root = prob.root = Group()
+
+    root.add('Cycle', Cycle(surrogate=surrogate, table=table, fidelity=fidelity))
+
+    params = (('comp_PR', 6.0, {'units': 'unitless'}),
+              ('PsE', 0.05588, {'units': 'psi'}),
+              ('pod_mach', .8, {'units': 'unitless'}),
+              ('tube_pressure', 850., {'units': 'Pa'}),
+              ('tube_temp', 320., {'units': 'K'}),
+              ('comp_inlet_area', 2.3884, {'units': 'm**2'}))
+
+    root.add('des_vars', IndepVarComp(params))
+
+    root.connect('des_vars.comp_PR', 'Cycle.comp.map.PRdes')
+    root.connect('des_vars.PsE', 'Cycle.nozzle.Ps_exhaust')
+    root.connect('des_vars.pod_mach', 'Cycle.pod_mach')
+    root.connect('des_vars.tube_pressure', 'Cycle.tube_pressure')
+    root.connect('des_vars.tube_temp', 'Cycle.tube_temp')
+    root.connect('des_vars.comp_inlet_area', 'Cycle.comp_inlet_area')
+
+    return prob
+
+
+def latin_hypercube(num_samples, num_dims, seed=0):
+    """
+    Latin hypercube sample on the unit cube.
+    """
+    rng = np.random.RandomState(seed)
+    u = (np.arange(num_samples)[:, None] + rng.rand(num_samples, num_dims))/num_samples
+    for j in range(num_dims):
+        u[:, j] = u[rng.permutation(num_samples), j]
+    return u
+
+
+def generate_training_data(filename, num_samples=300, bounds=CYCLE_BOUNDS, num_procs=None, seed=0,
+                           fidelity='pycycle'):
+    """
+    Runs the full Cycle, at `fidelity`, over a Latin hypercube of Cycle level
+    inputs and saves the FlowPath inputs and outputs it saw to `filename`
+    (.npz).
+    """
+    from hyperloop.Python.pod.cycle.cycle_group import flow_path_variable
+
+    u = latin_hypercube(num_samples, len(bounds), seed)
+    cases = []
+    for row in u:
+        cases.append(dict(('des_vars.' + name, lower + x*(upper - lower))
+                          for x, (name, lower, upper) in zip(row, bounds)))
+
+    inputs = [flow_path_variable(name) for name in SURROGATE_INPUTS]
+    outputs = [flow_path_variable(name) for name in SURROGATE_OUTPUTS]
+
+    sweep = Sweep(functools.partial(create_problem, fidelity=fidelity),
+                  inputs + outputs + ['Cycle.nozzle.Ps_exhaust'], num_procs=num_procs)
+    results = sweep.run(cases)
+
+    np.savez(filename,
+             X=np.column_stack([results[name] for name in inputs]),
+             Y=np.column_stack([results[name] for name in outputs]),
+             Ps_exhaust=results['Cycle.nozzle.Ps_exhaust'][0])
+
+
+def scale_outputs(X, Y, inverse=False):
+    """
+    Divides the EXTENSIVE_OUTPUTS of the rows of `Y` by W, and the duct area
+    by W/P, at the SURROGATE_INPUTS rows of `X`, or multiplies them back with
+    `inverse`.
+    """
+    W = X[:, SURROGATE_INPUTS.index('fl_start.W')]
+    P = X[:, SURROGATE_INPUTS.index('fl_start.P')]
+    Y = np.array(Y, dtype=float)
+    for name in EXTENSIVE_OUTPUTS:
+        j = SURROGATE_OUTPUTS.index(name)
+        factor = W/P if name == 'comp.Fl_O:stat:area' else W
+        Y[:, j] = Y[:, j]*factor if inverse else Y[:, j]/factor
+    return Y
+
+
+class FlowPathSurrogate(FlowPath):
+    """
+    FlowPath that evaluates trained Kriging models in place of pycycle.
+
+    Params
+    ------
+    training_data : str
+        .npz file written by `generate_training_data`.
+    tolerance : float
+        Largest Kriging error estimate, as a fraction of each output's
+        training range, accepted before falling back to pycycle.
+
+    Returns
+    -------
+    Same variables as FlowPath.
+
+    Notes
+    -----
+    `error_estimate` holds the relative error estimate of each output at
+    the last point, inf when it was outside the envelope, and
+    `num_surrogate` / `num_fallback` count how many evaluations were
+    answered by the surrogate and by pycycle. Points are
+    only answered by the surrogate when every input lies within the range
+    seen in training and `nozzle.Ps_exhaust` matches the training value.
+    Derivatives of the surrogate are not provided, so models using it
+    should finite difference this group.
+    """
+
+    def __init__(self, training_data, tolerance=.01):
+        super(FlowPathSurrogate, self).__init__()
+
+        data = np.load(training_data)
+        X = data['X']
+        Y = scale_outputs(X, data['Y'])
+
+        self.Ps_exhaust = float(data['Ps_exhaust'])
+        self.lower = X.min(axis=0)
+        self.upper = X.max(axis=0)
+        self.output_range = Y.max(axis=0) - Y.min(axis=0)
+        self.output_range[self.output_range == 0.0] = 1.0
+        self.tolerance = tolerance
+
+        self.models = []
+        for j in range(len(SURROGATE_OUTPUTS)):
+            model = KrigingSurrogate(eval_rmse=True)
+            model.train(X, Y[:, [j]])
+            self.models.append(model)
+
+        self.error_estimate = {}
+        self.num_surrogate = 0
+        self.num_fallback = 0
+        self._use_surrogate = False
+
+    def in_envelope(self, x, Ps_exhaust):
+        return (np.all(x >= self.lower) and np.all(x <= self.upper) and
+                np.isclose(Ps_exhaust, self.Ps_exhaust))
+
+    def predict(self, x):
+        """
+        Returns the predicted FlowPath outputs at `x` and their relative
+        error estimates.
+        """
+        y = np.zeros(len(SURROGATE_OUTPUTS))
+        error = np.zeros(len(SURROGATE_OUTPUTS))
+        for j, model in enumerate(self.models):
+            mean, rmse = model.predict(x)
+            y[j] = np.ravel(mean)[0]
+            error[j] = np.ravel(rmse)[0]/self.output_range[j]
+        return scale_outputs(x[None, :], y[None, :], inverse=True)[0], error
+
+    def solve_nonlinear(self, params, unknowns, resids, metadata=None):
+        x = np.array([params[name] for name in SURROGATE_INPUTS], dtype=float)
+
+        self._use_surrogate = False
+        if self.in_envelope(x, params['nozzle.Ps_exhaust']):
+            y, error = self.predict(x)
+            self.error_estimate = dict(zip(SURROGATE_OUTPUTS, error))
+            self._use_surrogate = np.max(error) <= self.tolerance
+        else:
+            # No estimate outside the training range
+            self.error_estimate = dict((name, np.inf) for name in SURROGATE_OUTPUTS)
+
+        if self._use_surrogate:
+            self.num_surrogate += 1
+            for name, val in zip(SURROGATE_OUTPUTS, y):
+                unknowns[name] = val
+        else:
+            self.num_fallback += 1
+            super(FlowPathSurrogate, self).solve_nonlinear(params, unknowns, resids, metadata)
+
+    def apply_nonlinear(self, params, unknowns, resids, metadata=None):
+        # The pycycle states are not updated when the surrogate answers, so
+        # their residuals are meaningless and must not stall outer solvers.
+        if self._use_surrogate:
+            resids.vec[:] = 0.0
+        else:
+            super(FlowPathSurrogate, self).apply_nonlinear(params, unknowns, resids, metadata)
+
+if __name__ == "__main__":
+    import time
+    from openmdao.units.units import convert_units as cu
+
+    generate_training_data('flow_path_surrogate.npz', num_samples=200)
+
+    for surrogate in (None, 'flow_path_surrogate.npz'):
+        prob = create_problem(surrogate)
+        prob.setup(check=False)
+
+        t0 = time.time()
+        prob.run()
+
+        print('surrogate        %s' % surrogate)
+        print('run time         %f s' % (time.time() - t0))
+        print('Power            %f W' % (cu(prob['Cycle.comp.power'], 'hp', 'W')))
+        print('nozzle.Fg        %f N' % (cu(prob['Cycle.nozzle.Fg'], 'lbf', 'N')))
+        print('inlet.F_ram      %f N' % (cu(prob['Cycle.inlet.F_ram'], 'lbf', 'N')))
+
+    print('error estimate   %s' % prob.root.Cycle.FlowPath.error_estimate)
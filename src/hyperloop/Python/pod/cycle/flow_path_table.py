@@ -0,0 +1,281 @@
+"""
+Table backed FlowPath for sweeps over a known envelope.
+
+Every FlowPath run solves the janaf equilibrium thermodynamics of the inlet,
+compressor, duct and nozzle from scratch, although a sweep only visits a
+bounded box of flow start conditions, compressor pressure ratio and exhaust
+pressure. `generate_table` runs FlowPath once over a grid of that box on a
+`Sweep` and saves the outputs as a compressed .npz, and `FlowPathTable`
+answers from the table by multilinear interpolation.
+
+At fixed Mach number, pressure and temperature the flow path scales with
+mass flow, so the extensive outputs are tabulated per unit W and W is not an
+axis of the table.
+"""
+from __future__ import print_function
+import itertools
+
+import numpy as np
+
+from openmdao.api import Group, Problem, IndepVarComp
+
+from hyperloop.Python.pod.cycle.flow_path import FlowPath
+from hyperloop.Python.pod.cycle.flow_path_surrogate import SURROGATE_OUTPUTS, EXTENSIVE_OUTPUTS
+from hyperloop.Python.tools.sweep import Sweep, grid
+
+# FlowPath level inputs, in FlowPath units (psi, degR, lbm/s)
+TABLE_INPUTS = ('fl_start.MN_target', 'fl_start.P', 'fl_start.T', 'fl_start.W', 'comp.map.PRdes',
+                'nozzle.Ps_exhaust')
+
+TABLE_OUTPUTS = SURROGATE_OUTPUTS + ('nozzle.Fl_O:tot:P', 'nozzle.Fl_O:stat:P', 'nozzle.Fl_O:stat:T',
+                                     'nozzle.Fl_O:stat:V', 'nozzle.Fl_O:stat:MN')
+
+# Default grid, covering the Cycle envelope of the surrogate: pod Mach .5 to
+# .9, tube pressure 40 to 4000 Pa and tube temperature 280 to 340 K, i.e.
+# total temperatures of 529 to 711 degR
+TABLE_AXES = (('fl_start.MN_target', np.linspace(.5, .9, 5)),
+              ('fl_start.P', np.logspace(np.log10(.005), np.log10(1.0), 9)),
+              ('fl_start.T', np.linspace(500., 720., 3)),
+              ('comp.map.PRdes', np.linspace(2., 15., 7)),
+              ('nozzle.Ps_exhaust', np.array([0.05588])))
+
+
+def create_problem():
+    """
+    FlowPath with its inputs on a des_vars IndepVarComp, used to generate
+    the table.
+    """
+    prob = Problem()
+    root = prob.root = Group()
+
+    root.add('FlowPath', FlowPath())
+
+    params = (('MN_target', .8),
+              ('P', .1879, {'units': 'psi'}),
+              ('T', 605.06, {'units': 'degR'}),
+              ('W', 1.0, {'units': 'lbm/s'}),
+              ('PRdes', 6.0),
+              ('PsE', 0.05588, {'units': 'psi'}))
+
+    root.add('des_vars', IndepVarComp(params))
+
+    root.connect('des_vars.MN_target', 'FlowPath.fl_start.MN_target')
+    root.connect('des_vars.P', 'FlowPath.fl_start.P')
+    root.connect('des_vars.T', 'FlowPath.fl_start.T')
+    root.connect('des_vars.W', 'FlowPath.fl_start.W')
+    root.connect('des_vars.PRdes', 'FlowPath.comp.map.PRdes')
+    root.connect('des_vars.PsE', 'FlowPath.nozzle.Ps_exhaust')
+
+    return prob
+
+
+def generate_table(filename, axes=TABLE_AXES, num_procs=None, cache=None):
+    """
+    Runs FlowPath at W = 1 lbm/s over the full grid of `axes`, (name,
+    values) pairs of every TABLE_INPUTS entry but fl_start.W, and saves the
+    table to `filename` (.npz).
+    """
+    axes = [(name, np.sort(np.asarray(values, dtype=float))) for name, values in axes]
+    names = [name for name, values in axes]
+    if sorted(names) != sorted(name for name in TABLE_INPUTS if name != 'fl_start.W'):
+        raise ValueError('axes must cover %s' % ', '.join(TABLE_INPUTS))
+
+    des_vars = {'fl_start.MN_target': 'des_vars.MN_target',
+                'fl_start.P': 'des_vars.P',
+                'fl_start.T': 'des_vars.T',
+                'comp.map.PRdes': 'des_vars.PRdes',
+                'nozzle.Ps_exhaust': 'des_vars.PsE'}
+    cases = grid(*[(des_vars[name], values) for name, values in axes])
+
+    outputs = ['FlowPath.' + name for name in TABLE_OUTPUTS]
+    results = Sweep(create_problem, outputs, num_procs=num_procs, cache=cache).run(cases)
+
+    shape = tuple(len(values) for name, values in axes) + (len(TABLE_OUTPUTS),)
+    values = np.column_stack([np.ravel(results[name]) for name in outputs]).reshape(shape)
+
+    arrays = dict(('axis_%d' % i, axis[1]) for i, axis in enumerate(axes))
+    np.savez_compressed(filename, names=np.array(names), outputs=np.array(TABLE_OUTPUTS),
+                        values=values, **arrays)
+
+
+class PerformanceTable(object):
+    """
+    FlowPath outputs interpolated from a table written by `generate_table`.
+
+    Params
+    ------
+    filename : str
+        .npz table.
+
+    Notes
+    -----
+    Axes with a single value are not interpolated over, points have to
+    match that value to be in the envelope.
+    """
+
+    def __init__(self, filename):
+        data = np.load(filename)
+        names = [str(name) for name in data['names']]
+        if tuple(str(name) for name in data['outputs']) != TABLE_OUTPUTS:
+            raise ValueError('%s was written for other FlowPath outputs' % filename)
+
+        # Reorder the axes to follow TABLE_INPUTS
+        order = [names.index(name) for name in TABLE_INPUTS if name != 'fl_start.W']
+        self.axes = [data['axis_%d' % i] for i in order]
+        self.values = np.transpose(data['values'], order + [len(order)])
+        self.columns = [TABLE_INPUTS.index(name) for name in TABLE_INPUTS if name != 'fl_start.W']
+        self.active = [k for k, axis in enumerate(self.axes) if len(axis) > 1]
+        self.extensive = np.array([name in EXTENSIVE_OUTPUTS for name in TABLE_OUTPUTS])
+
+    def in_envelope(self, x):
+        """
+        True if every input of `x`, in TABLE_INPUTS order, is inside the
+        table.
+        """
+        x = np.asarray(x, dtype=float)
+        for k, axis in enumerate(self.axes):
+            xk = x[..., self.columns[k]]
+            if len(axis) > 1:
+                if np.any(xk < axis[0]) or np.any(xk > axis[-1]):
+                    return False
+            elif not np.all(np.isclose(xk, axis[0])):
+                return False
+        return bool(np.all(x[..., TABLE_INPUTS.index('fl_start.W')] > 0.0))
+
+    def evaluate(self, x):
+        """
+        Interpolates the table at `x`, one point or an array of points with
+        the inputs in TABLE_INPUTS order along the last axis.
+
+        Returns
+        -------
+        y : ndarray
+            TABLE_OUTPUTS at every point.
+        dy_dx : ndarray
+            Partials of y with respect to the inputs, shaped
+            y.shape + (len(TABLE_INPUTS),).
+        """
+        x = np.asarray(x, dtype=float)
+        X = x.reshape(-1, len(TABLE_INPUTS))
+        m = len(X)
+
+        # Cell and local coordinate of every point along each active axis,
+        # extrapolating linearly from the end cells
+        index = [np.zeros(m, dtype=int) for axis in self.axes]
+        frac = {}
+        width = {}
+        for k in self.active:
+            axis = self.axes[k]
+            xk = X[:, self.columns[k]]
+            i = np.clip(np.searchsorted(axis, xk, side='right') - 1, 0, len(axis) - 2)
+            index[k] = i
+            width[k] = axis[i + 1] - axis[i]
+            frac[k] = (xk - axis[i])/width[k]
+
+        g = np.zeros((m, len(TABLE_OUTPUTS)))
+        dg = np.zeros((m, len(TABLE_OUTPUTS), len(TABLE_INPUTS)))
+        for corner in itertools.product((0, 1), repeat=len(self.active)):
+            idx = list(index)
+            weight = np.ones(m)
+            factors = []
+            for k, c in zip(self.active, corner):
+                idx[k] = index[k] + c
+                factor = frac[k] if c else 1.0 - frac[k]
+                factors.append(factor)
+                weight = weight*factor
+            corner_values = self.values[tuple(idx)]
+            g += weight[:, None]*corner_values
+            for j, (k, c) in enumerate(zip(self.active, corner)):
+                dweight = (1.0 if c else -1.0)/width[k]
+                for jj, factor in enumerate(factors):
+                    if jj != j:
+                        dweight = dweight*factor
+                dg[:, :, self.columns[k]] += dweight[:, None]*corner_values
+
+        # Extensive outputs are per unit W
+        w = TABLE_INPUTS.index('fl_start.W')
+        W = X[:, w]
+        scale = np.where(self.extensive, W[:, None], 1.0)
+        y = g*scale
+        dy = dg*scale[:, :, None]
+        dy[:, self.extensive, w] = g[:, self.extensive]
+
+        return y.reshape(x.shape[:-1] + (len(TABLE_OUTPUTS),)), \
+            dy.reshape(x.shape[:-1] + (len(TABLE_OUTPUTS), len(TABLE_INPUTS)))
+
+
+class FlowPathTable(FlowPath):
+    """
+    FlowPath that interpolates a `PerformanceTable` in place of pycycle.
+
+    Params
+    ------
+    table : str
+        .npz file written by `generate_table`.
+
+    Returns
+    -------
+    Same variables as FlowPath.
+
+    Notes
+    -----
+    Points outside the table fall back to the pycycle solve.
+    `num_table` and `num_fallback` count how many evaluations were answered
+    each way. OpenMDAO takes no partials from a Group, so the group finite
+    differences itself, which only costs table lookups inside the table. The
+    analytic partials are available from `table.evaluate`.
+    """
+
+    def __init__(self, table):
+        super(FlowPathTable, self).__init__()
+
+        self.table = PerformanceTable(table)
+        self.deriv_options['type'] = 'fd'
+
+        self.num_table = 0
+        self.num_fallback = 0
+        self._use_table = False
+
+    def solve_nonlinear(self, params, unknowns, resids, metadata=None):
+        x = np.array([params[name] for name in TABLE_INPUTS], dtype=float)
+
+        self._use_table = self.table.in_envelope(x)
+        if self._use_table:
+            self.num_table += 1
+            y, dy_dx = self.table.evaluate(x)
+            for name, val in zip(TABLE_OUTPUTS, y):
+                unknowns[name] = val
+        else:
+            self.num_fallback += 1
+            super(FlowPathTable, self).solve_nonlinear(params, unknowns, resids, metadata)
+
+    def apply_nonlinear(self, params, unknowns, resids, metadata=None):
+        # As in FlowPathSurrogate, the pycycle states are stale when the
+        # table answers
+        if self._use_table:
+            resids.vec[:] = 0.0
+        else:
+            super(FlowPathTable, self).apply_nonlinear(params, unknowns, resids, metadata)
+
+if __name__ == "__main__":
+    import time
+    from openmdao.units.units import convert_units as cu
+
+    from hyperloop.Python.pod.cycle.flow_path_surrogate import create_problem as create_cycle
+
+    t0 = time.time()
+    generate_table('flow_path_table.npz')
+    print('table built in   %f s' % (time.time() - t0))
+
+    for table in (None, 'flow_path_table.npz'):
+        prob = create_cycle(table=table)
+        prob.setup(check=False)
+
+        t0 = time.time()
+        prob.run()
+
+        print('table            %s' % table)
+        print('run time         %f s' % (time.time() - t0))
+        print('Power            %f W' % (cu(prob['Cycle.comp.power'], 'hp', 'W')))
+        print('nozzle.Fg        %f N' % (cu(prob['Cycle.nozzle.Fg'], 'lbf', 'N')))
+        print('inlet.F_ram      %f N' % (cu(prob['Cycle.inlet.F_ram'], 'lbf', 'N')))
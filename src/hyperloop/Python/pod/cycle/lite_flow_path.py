@@ -0,0 +1,592 @@
+"""
+Perfect-gas inlet->compressor->duct->nozzle for early screening.
+
+`FlowPath` solves the janaf equilibrium chemistry of every element, which is
+more than a screening study needs. `LiteFlowPath` models the same elements
+with constant gamma isentropic relations, the way `FlowPathInputs` and
+`PodMach` already do, and has the same variables as `FlowPath` so `Cycle`
+can use either one through its `fidelity` switch.
+
+Every element is a NumPy kernel taking and returning dicts of flow station
+variables in the pycycle units (psi, degR, Btu/lbm, lbm/s), so
+`lite_flow_path_kernel` also evaluates whole arrays of conditions at once.
+`accuracy` compares it against pycycle over the Cycle envelope of the trade
+studies.
+"""
+from __future__ import print_function
+from collections import OrderedDict
+
+import numpy as np
+
+from openmdao.api import Group, Component, Problem, IndepVarComp
+
+GAMMA = 1.4
+R_AIR = 53.3533  # ft*lbf/(lbm*degR), 287.05 J/(kg*K)
+G_C = 32.174  # lbm*ft/(lbf*s**2)
+BTU = 778.169  # ft*lbf
+HP = 550.  # ft*lbf/s
+CP = GAMMA*R_AIR/(GAMMA - 1.)/BTU  # Btu/(lbm*degR)
+
+# Flow station variables passed from element to element
+FLOW_VARS = (('tot:P', 'psi'),
+             ('tot:T', 'degR'),
+             ('tot:h', 'Btu/lbm'),
+             ('stat:W', 'lbm/s'))
+
+# Same defaults as the input_vars of FlowPath
+DES_VARS = (('ram_recovery', 0.99),
+            ('effDes', 0.9),
+            ('duct_MN', 0.65),
+            ('duct_dPqP', 0.),
+            ('nozzle_Cfg', 1.0),
+            ('nozzle_dPqP', 0.),
+            ('shaft_Nmech', 10000.),
+            ('inlet_MN', 0.6),
+            ('comp_MN', 0.65))
+
+# FlowPath level inputs and outputs of lite_flow_path_kernel, in FlowPath units
+LITE_INPUTS = ('fl_start.MN_target', 'fl_start.P', 'fl_start.T', 'fl_start.W', 'comp.map.PRdes',
+               'nozzle.Ps_exhaust')
+
+LITE_OUTPUTS = ('comp.trq', 'comp.power', 'comp.Fl_O:stat:area', 'comp.Fl_O:tot:h',
+                'inlet.F_ram', 'inlet.Fl_O:tot:h',
+                'nozzle.Fg', 'nozzle.Fl_O:stat:W', 'nozzle.Fl_O:tot:T',
+                'nozzle.Fl_O:tot:P', 'nozzle.Fl_O:stat:P', 'nozzle.Fl_O:stat:T',
+                'nozzle.Fl_O:stat:V', 'nozzle.Fl_O:stat:MN', 'nozzle.Fl_O:stat:area')
+
+
+def static_state(Pt, Tt, MN):
+    """
+    Static pressure (psi), temperature (degR) and velocity (ft/s) at Mach
+    number MN.
+    """
+    f = 1. + (GAMMA - 1.)/2.*MN**2
+    Ts = Tt/f
+    Ps = Pt/f**(GAMMA/(GAMMA - 1.))
+    V = MN*np.sqrt(GAMMA*R_AIR*G_C*Ts)
+    return Ps, Ts, V
+
+
+def flow_area(W, Ps, Ts, V):
+    """
+    Flow area (inch**2) of W lbm/s at a static state.
+    """
+    rho = Ps*144./(R_AIR*Ts)
+    return W/(rho*V)*144.
+
+
+def flow_start_kernel(p):
+    """
+    Vectorized LiteFlowStart. Flow station of the tube air at the pod Mach
+    number.
+    """
+    Ps, Ts, V = static_state(p['P'], p['T'], p['MN_target'])
+    W = p['W']*np.ones_like(Ps)
+
+    return {'Fl_O:tot:P' : p['P']*np.ones_like(Ps),
+            'Fl_O:tot:T' : p['T']*np.ones_like(Ps),
+            'Fl_O:tot:h' : CP*p['T']*np.ones_like(Ps),
+            'Fl_O:stat:W' : W,
+            'Fl_O:stat:P' : Ps,
+            'Fl_O:stat:T' : Ts,
+            'Fl_O:stat:V' : V,
+            'Fl_O:stat:MN' : p['MN_target']*np.ones_like(Ps)}
+
+
+def inlet_kernel(p):
+    """
+    Vectorized LiteInlet. Total pressure loss and ram drag.
+    """
+    W = p['Fl_I:stat:W']
+
+    return {'Fl_O:tot:P' : p['Fl_I:tot:P']*p['ram_recovery'],
+            'Fl_O:tot:T' : p['Fl_I:tot:T'],
+            'Fl_O:tot:h' : p['Fl_I:tot:h'],
+            'Fl_O:stat:W' : W,
+            'F_ram' : W*p['Fl_I:stat:V']/G_C}
+
+
+def compressor_kernel(p):
+    """
+    Vectorized LiteCompressor. Adiabatic efficiency compressor, with the
+    power and torque drawn from the shaft negative as in pycycle.
+    """
+    Tt_in = p['Fl_I:tot:T']
+    W = p['Fl_I:stat:W']
+
+    Pt = p['Fl_I:tot:P']*p['PR']
+    Tt = Tt_in*(1. + (p['PR']**((GAMMA - 1.)/GAMMA) - 1.)/p['eff'])
+    h = p['Fl_I:tot:h'] + CP*(Tt - Tt_in)
+
+    power = -W*(h - p['Fl_I:tot:h'])*BTU/HP
+    Ps, Ts, V = static_state(Pt, Tt, p['MN_target'])
+
+    return {'Fl_O:tot:P' : Pt,
+            'Fl_O:tot:T' : Tt,
+            'Fl_O:tot:h' : h,
+            'Fl_O:stat:W' : W,
+            'Fl_O:stat:area' : flow_area(W, Ps, Ts, V),
+            'power' : power,
+            'trq' : power*HP*60./(2.*np.pi*p['Nmech'])}
+
+
+def duct_kernel(p):
+    """
+    Vectorized LiteDuct. Total pressure loss as a fraction of the inlet
+    total pressure.
+    """
+    Pt = p['Fl_I:tot:P']*(1. - p['dPqP'])
+    Ps, Ts, V = static_state(Pt, p['Fl_I:tot:T'], p['MN_target'])
+
+    return {'Fl_O:tot:P' : Pt,
+            'Fl_O:tot:T' : p['Fl_I:tot:T'],
+            'Fl_O:tot:h' : p['Fl_I:tot:h'],
+            'Fl_O:stat:W' : p['Fl_I:stat:W'],
+            'Fl_O:stat:area' : flow_area(p['Fl_I:stat:W'], Ps, Ts, V)}
+
+
+def nozzle_kernel(p):
+    """
+    Vectorized LiteNozzle. Convergent-divergent nozzle expanding fully to
+    the exhaust pressure.
+    """
+    Pt = p['Fl_I:tot:P']*(1. - p['dPqP'])
+    Tt = p['Fl_I:tot:T']
+    W = p['Fl_I:stat:W']
+
+    # No flow is expanded below the exhaust pressure
+    PR = np.maximum(Pt/p['Ps_exhaust'], 1.)
+    MN = np.sqrt(2./(GAMMA - 1.)*(PR**((GAMMA - 1.)/GAMMA) - 1.))
+    Ps, Ts, V = static_state(Pt, Tt, MN)
+
+    return {'Fl_O:tot:P' : Pt,
+            'Fl_O:tot:T' : Tt,
+            'Fl_O:tot:h' : p['Fl_I:tot:h'],
+            'Fl_O:stat:W' : W,
+            'Fl_O:stat:P' : Ps,
+            'Fl_O:stat:T' : Ts,
+            'Fl_O:stat:V' : V,
+            'Fl_O:stat:MN' : MN,
+            'Fl_O:stat:area' : flow_area(W, Ps, Ts, V),
+            'Fg' : p['Cfg']*W*V/G_C}
+
+
+def lite_flow_path_kernel(p):
+    """
+    Vectorized LiteFlowPath. Takes a dict of LITE_INPUTS, and optionally
+    DES_VARS, by name as scalars or arrays of conditions, and returns a dict
+    of LITE_OUTPUTS.
+    """
+    p = dict(DES_VARS, **p)
+
+    fl_start = flow_start_kernel({'P' : p['fl_start.P'],
+                                  'T' : p['fl_start.T'],
+                                  'W' : p['fl_start.W'],
+                                  'MN_target' : p['fl_start.MN_target']})
+
+    inlet = inlet_kernel(dict(_flow_in(fl_start), ram_recovery=p['ram_recovery'],
+                              **{'Fl_I:stat:V' : fl_start['Fl_O:stat:V']}))
+
+    comp = compressor_kernel(dict(_flow_in(inlet), PR=p['comp.map.PRdes'], eff=p['effDes'],
+                                  Nmech=p['shaft_Nmech'], MN_target=p['comp_MN']))
+
+    duct = duct_kernel(dict(_flow_in(comp), dPqP=p['duct_dPqP'], MN_target=p['duct_MN']))
+
+    nozzle = nozzle_kernel(dict(_flow_in(duct), Ps_exhaust=p['nozzle.Ps_exhaust'], Cfg=p['nozzle_Cfg'],
+                                dPqP=p['nozzle_dPqP']))
+
+    elements = {'inlet' : inlet, 'comp' : comp, 'nozzle' : nozzle}
+    outputs = OrderedDict()
+    for name in LITE_OUTPUTS:
+        element, var = name.split('.')
+        outputs[name] = elements[element][var]
+    return outputs
+
+
+def _flow_in(station):
+    """
+    Fl_O variables of an element kernel's outputs, renamed to the Fl_I
+    params of the next one.
+    """
+    return dict(('Fl_I:' + var, station['Fl_O:' + var]) for var, units in FLOW_VARS)
+
+
+def _units(units):
+    return {} if units is None else {'units' : units}
+
+
+class LiteElement(Component):
+    """
+    Component evaluating one element kernel.
+
+    Subclasses list their kernel, params and outputs as `kernel`, `PARAMS`
+    and `OUTPUTS`, (name, default, units) tuples. `flow_in` and `flow_out`
+    add the FLOW_VARS of the Fl_I and Fl_O flow stations.
+
+    Notes
+    -----
+    The elements are a handful of closed form expressions, so their
+    partials are taken by finite difference.
+    """
+
+    kernel = None
+    flow_in = True
+    flow_out = True
+    PARAMS = ()
+    OUTPUTS = ()
+
+    def __init__(self):
+        super(LiteElement, self).__init__()
+
+        params = list(self.PARAMS)
+        outputs = list(self.OUTPUTS)
+        if self.flow_in:
+            params = [('Fl_I:' + var, 1.0, units) for var, units in FLOW_VARS] + params
+        if self.flow_out:
+            outputs = [('Fl_O:' + var, 1.0, units) for var, units in FLOW_VARS] + outputs
+
+        for name, val, units in params:
+            self.add_param(name, val=val, **_units(units))
+        for name, val, units in outputs:
+            self.add_output(name, val=val, **_units(units))
+
+        self._param_names = [name for name, val, units in params]
+        self._output_names = [name for name, val, units in outputs]
+        self.deriv_options['type'] = 'fd'
+
+    def solve_nonlinear(self, params, unknowns, resids):
+        outputs = type(self).kernel(dict((name, params[name]) for name in self._param_names))
+        for name in self._output_names:
+            unknowns[name] = outputs[name]
+
+
+class LiteFlowStart(LiteElement):
+    """
+    Params
+    ------
+    P : float
+        Total pressure (psi)
+    T : float
+        Total temperature (degR)
+    W : float
+        Mass flow (lbm/s)
+    MN_target : float
+        Mach number (unitless)
+
+    Returns
+    -------
+    Fl_O:stat:P, Fl_O:stat:T, Fl_O:stat:V, Fl_O:stat:MN : float
+        Static state of the flow (psi, degR, ft/s, unitless)
+    """
+
+    kernel = staticmethod(flow_start_kernel)
+    flow_in = False
+    PARAMS = (('P', .1879, 'psi'),
+              ('T', 605.06, 'degR'),
+              ('W', 16., 'lbm/s'),
+              ('MN_target', .8, None))
+    OUTPUTS = (('Fl_O:stat:P', 1.0, 'psi'),
+               ('Fl_O:stat:T', 1.0, 'degR'),
+               ('Fl_O:stat:V', 1.0, 'ft/s'),
+               ('Fl_O:stat:MN', 1.0, None))
+
+
+class LiteInlet(LiteElement):
+    """
+    Params
+    ------
+    Fl_I:stat:V : float
+        Velocity of the captured flow (ft/s)
+    ram_recovery : float
+        Ratio of exit to inlet total pressure (unitless)
+
+    Returns
+    -------
+    F_ram : float
+        Ram drag (lbf)
+    """
+
+    kernel = staticmethod(inlet_kernel)
+    PARAMS = (('Fl_I:stat:V', 1.0, 'ft/s'),
+              ('ram_recovery', .99, None))
+    OUTPUTS = (('F_ram', 1.0, 'lbf'),)
+
+
+class LiteCompressorMap(Component):
+    """
+    Design point map of LiteCompressor. The perfect-gas compressor runs at
+    its design pressure ratio and efficiency.
+
+    Params
+    ------
+    PRdes : float
+        Design pressure ratio (unitless)
+    effDes : float
+        Design adiabatic efficiency (unitless)
+
+    Returns
+    -------
+    PR : float
+        Pressure ratio (unitless)
+    eff : float
+        Adiabatic efficiency (unitless)
+    """
+
+    def __init__(self):
+        super(LiteCompressorMap, self).__init__()
+
+        self.add_param('PRdes', val=6.0, desc='design pressure ratio')
+        self.add_param('effDes', val=.9, desc='design adiabatic efficiency')
+        self.add_output('PR', val=6.0, desc='pressure ratio')
+        self.add_output('eff', val=.9, desc='adiabatic efficiency')
+
+    def solve_nonlinear(self, params, unknowns, resids):
+        unknowns['PR'] = params['PRdes']
+        unknowns['eff'] = params['effDes']
+
+    def linearize(self, params, unknowns, resids):
+        J = {}
+        J['PR', 'PRdes'] = 1.0
+        J['eff', 'effDes'] = 1.0
+        return J
+
+
+class LiteCompressorWork(LiteElement):
+    """
+    Params
+    ------
+    PR : float
+        Pressure ratio (unitless)
+    eff : float
+        Adiabatic efficiency (unitless)
+    Nmech : float
+        Shaft speed (rpm)
+    MN_target : float
+        Exit Mach number (unitless)
+
+    Returns
+    -------
+    power : float
+        Shaft power, negative when absorbed (hp)
+    trq : float
+        Shaft torque, negative when absorbed (ft*lbf)
+    Fl_O:stat:area : float
+        Exit flow area (inch**2)
+    """
+
+    kernel = staticmethod(compressor_kernel)
+    PARAMS = (('PR', 6.0, None),
+              ('eff', .9, None),
+              ('Nmech', 10000., 'rpm'),
+              ('MN_target', .65, None))
+    OUTPUTS = (('power', -1.0, 'hp'),
+               ('trq', -1.0, 'ft*lbf'),
+               ('Fl_O:stat:area', 1.0, 'inch**2'))
+
+
+class LiteCompressor(Group):
+    """
+    LiteCompressorWork behind a LiteCompressorMap, laid out like the pycycle
+    Compressor so the design pressure ratio is map.PRdes.
+    """
+
+    def __init__(self):
+        super(LiteCompressor, self).__init__()
+
+        self.add('map', LiteCompressorMap())
+        self.add('work', LiteCompressorWork(), promotes=['*'])
+
+        self.connect('map.PR', 'PR')
+        self.connect('map.eff', 'eff')
+
+
+class LiteDuct(LiteElement):
+    """
+    Params
+    ------
+    dPqP : float
+        Total pressure loss as a fraction of inlet total pressure (unitless)
+    MN_target : float
+        Exit Mach number (unitless)
+
+    Returns
+    -------
+    Fl_O:stat:area : float
+        Exit flow area (inch**2)
+    """
+
+    kernel = staticmethod(duct_kernel)
+    PARAMS = (('dPqP', 0., None),
+              ('MN_target', .65, None))
+    OUTPUTS = (('Fl_O:stat:area', 1.0, 'inch**2'),)
+
+
+class LiteNozzle(LiteElement):
+    """
+    Params
+    ------
+    Ps_exhaust : float
+        Exhaust static pressure (psi)
+    Cfg : float
+        Gross thrust coefficient (unitless)
+    dPqP : float
+        Total pressure loss as a fraction of inlet total pressure (unitless)
+
+    Returns
+    -------
+    Fg : float
+        Gross thrust (lbf)
+    Fl_O:stat:P, Fl_O:stat:T, Fl_O:stat:V, Fl_O:stat:MN : float
+        Static state of the exhaust (psi, degR, ft/s, unitless)
+    Fl_O:stat:area : float
+        Exit area (inch**2)
+    """
+
+    kernel = staticmethod(nozzle_kernel)
+    PARAMS = (('Ps_exhaust', 0.05588, 'psi'),
+              ('Cfg', 1.0, None),
+              ('dPqP', 0., None))
+    OUTPUTS = (('Fg', 1.0, 'lbf'),
+               ('Fl_O:stat:P', 1.0, 'psi'),
+               ('Fl_O:stat:T', 1.0, 'degR'),
+               ('Fl_O:stat:V', 1.0, 'ft/s'),
+               ('Fl_O:stat:MN', 1.0, None),
+               ('Fl_O:stat:area', 1.0, 'inch**2'))
+
+
+def connect_lite_flow(group, fl_out, fl_in):
+    """
+    Connects the FLOW_VARS of flow station `fl_out` to `fl_in`.
+    """
+    for var, units in FLOW_VARS:
+        group.connect('%s:%s' % (fl_out, var), '%s:%s' % (fl_in, var))
+
+
+class LiteFlowPath(Group):
+    """
+    Perfect-gas FlowPath.
+
+    Params
+    ------
+    Same params as FlowPath.
+
+    Returns
+    -------
+    Same variables as FlowPath, in the same units.
+
+    Notes
+    -----
+    Air is a perfect gas with gamma of 1.4, and the nozzle is a
+    convergent-divergent nozzle expanding fully to the exhaust pressure.
+    Across the Cycle envelope of the trade studies this stays within a few
+    percent of pycycle, the largest differences being in the compressor
+    exit temperature at high pressure ratios, where the janaf gamma drops.
+    Run `accuracy` for the numbers. There is no shaft element, the
+    compressor torque is computed from the shaft speed directly.
+    `input_vars` works as for FlowPath.
+    """
+
+    def __init__(self, input_vars=True):
+        super(LiteFlowPath, self).__init__()
+
+        # Params set by input_vars, as in FlowPath
+        self.des_var_targets = (('ram_recovery', 'inlet.ram_recovery'),
+                                ('effDes', 'comp.map.effDes'),
+                                ('duct_MN', 'duct.MN_target'),
+                                ('duct_dPqP', 'duct.dPqP'),
+                                ('nozzle_Cfg', 'nozzle.Cfg'),
+                                ('nozzle_dPqP', 'nozzle.dPqP'),
+                                ('shaft_Nmech', 'comp.Nmech'),
+                                ('comp_MN', 'comp.MN_target'))
+
+        if input_vars:
+            self.add('input_vars', IndepVarComp(DES_VARS))
+
+        self.add('fl_start', LiteFlowStart())
+        self.add('inlet', LiteInlet())
+        self.add('comp', LiteCompressor())
+        self.add('duct', LiteDuct())
+        self.add('nozzle', LiteNozzle())
+
+        connect_lite_flow(self, 'fl_start.Fl_O', 'inlet.Fl_I')
+        connect_lite_flow(self, 'inlet.Fl_O', 'comp.Fl_I')
+        connect_lite_flow(self, 'comp.Fl_O', 'duct.Fl_I')
+        connect_lite_flow(self, 'duct.Fl_O', 'nozzle.Fl_I')
+        self.connect('fl_start.Fl_O:stat:V', 'inlet.Fl_I:stat:V')
+
+        if input_vars:
+            for name, target in self.des_var_targets:
+                self.connect('input_vars.' + name, target)
+
+
+def accuracy(num_samples=50, bounds=None, num_procs=None, seed=0, reference='pycycle'):
+    """
+    Runs the reference Cycle over a Latin hypercube of the Cycle envelope and
+    evaluates lite_flow_path_kernel at the same FlowPath inputs, all at once.
+
+    Params
+    ------
+    num_samples : int
+        Number of Cycle points.
+    bounds : tuple
+        (name, lower, upper) of every des_vars entry of
+        flow_path_surrogate.create_problem sampled, CYCLE_BOUNDS by default.
+    num_procs : int
+        Worker processes of the reference `Sweep`.
+    reference : str
+        Fidelity of the reference Cycle. 'lite' checks the kernel against
+        LiteFlowPath itself.
+
+    Returns
+    -------
+    errors : OrderedDict
+        Relative error of the lite model against the reference at every
+        point, by LITE_OUTPUTS name.
+    """
+    import functools
+
+    from hyperloop.Python.pod.cycle import flow_path_surrogate
+    from hyperloop.Python.pod.cycle.cycle_group import flow_path_variable
+    from hyperloop.Python.tools.sweep import Sweep
+
+    if bounds is None:
+        bounds = flow_path_surrogate.CYCLE_BOUNDS
+
+    u = flow_path_surrogate.latin_hypercube(num_samples, len(bounds), seed)
+    cases = []
+    for row in u:
+        cases.append(dict(('des_vars.' + name, lower + x*(upper - lower))
+                          for x, (name, lower, upper) in zip(row, bounds)))
+
+    problem_factory = functools.partial(flow_path_surrogate.create_problem, fidelity=reference)
+    names = [flow_path_variable(name) for name in LITE_INPUTS + LITE_OUTPUTS]
+    results = Sweep(problem_factory, names, num_procs=num_procs).run(cases)
+
+    lite = lite_flow_path_kernel(dict((name, np.ravel(results[flow_path_variable(name)]))
+                                      for name in LITE_INPUTS))
+
+    errors = OrderedDict()
+    for name in LITE_OUTPUTS:
+        full = np.ravel(results[flow_path_variable(name)])
+        errors[name] = (lite[name] - full)/np.abs(full)
+    return errors
+
+if __name__ == "__main__":
+    import time
+
+    errors = accuracy()
+
+    print('%-22s %12s %12s' % ('output', 'max |err| %', 'mean err %'))
+    for name, error in errors.items():
+        print('%-22s %12.3f %12.3f' % (name, 100.*np.max(np.abs(error)), 100.*np.mean(error)))
+
+    # Vectorized over a grid of pod Mach number and compressor pressure ratio
+    MN, PR = np.meshgrid(np.linspace(.5, .9, 100), np.linspace(2., 15., 100))
+    t0 = time.time()
+    out = lite_flow_path_kernel({'fl_start.MN_target' : MN,
+                                 'fl_start.P' : .1879,
+                                 'fl_start.T' : 605.06,
+                                 'fl_start.W' : 14.26,
+                                 'comp.map.PRdes' : PR,
+                                 'nozzle.Ps_exhaust' : 0.05588})
+    print('%d points in      %f s' % (MN.size, time.time() - t0))
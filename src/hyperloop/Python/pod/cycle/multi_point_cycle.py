@@ -0,0 +1,223 @@
+"""
+Cycle evaluated at a design point and a set of off-design points at once.
+
+`Cycle` sizes the compressor and nozzle at a single pod Mach number and tube
+state. `MultiPointCycle` adds `num_points` operating points to it, e.g. the
+booster entry speed v0 or other tube pressures, that run that hardware
+off-design, so a whole operating envelope is one model and one solve.
+
+Every point keeps the design compressor inlet area and nozzle exit area, and
+takes its efficiency, shaft speed, duct and nozzle losses and element Mach
+numbers from the input_vars of the design point FlowPath. Its compressor
+pressure ratio is not an input but is solved for so that the nozzle passes
+the point's mass flow through the design exit area, which is how the
+operating line of a fixed geometry compressor and nozzle responds to
+changes in corrected flow.
+"""
+from __future__ import print_function
+
+from openmdao.api import Group, Component, Problem, IndepVarComp, Newton, LinearGaussSeidel
+from openmdao.solvers.ln_direct import DirectSolver
+from openmdao.solvers.backtracking import BackTracking
+from openmdao.units.units import convert_units as cu
+
+from hyperloop.Python.pod.cycle.cycle_group import Cycle, create_flow_path
+from hyperloop.Python.pod.cycle.flow_path_inputs import FlowPathInputs
+
+# Variables every point shares with the design point
+SHARED = ['comp_inlet_area', 'nozzle.Ps_exhaust']
+
+# FlowPath outputs promoted the same way in Cycle and in every point
+OUTPUTS = ['comp.trq', 'comp.power', 'nozzle.Fg', 'inlet.F_ram', 'nozzle.Fl_O:stat:W',
+           'comp.Fl_O:stat:area', 'nozzle.Fl_O:tot:T']
+
+
+class NozzleAreaBalance(Component):
+    """
+    Params
+    ------
+    area : float
+        Nozzle exit area of the point (inch**2)
+    area_des : float
+        Nozzle exit area at the design point (inch**2)
+
+    Unknowns
+    --------
+    PR : float
+        Compressor pressure ratio of the point (unitless)
+    """
+
+    def __init__(self):
+        super(NozzleAreaBalance, self).__init__()
+
+        self.add_state('PR', val=6.0, lower=1.0, desc='compressor pressure ratio')
+        self.add_param('area', val=100.0, desc='nozzle exit area', units='inch**2')
+        self.add_param('area_des', val=100.0, desc='design nozzle exit area', units='inch**2')
+
+    def solve_nonlinear(self, params, unknowns, resids):
+        pass
+
+    def apply_nonlinear(self, params, unknowns, resids):
+        resids['PR'] = params['area']/params['area_des'] - 1.0
+
+    def linearize(self, params, unknowns, resids):
+        J = {}
+        J['PR', 'PR'] = 0.0
+        J['PR', 'area'] = 1.0/params['area_des']
+        J['PR', 'area_des'] = -params['area']/params['area_des']**2
+        return J
+
+
+class OffDesignPoint(Group):
+    """
+    FlowPathInputs and FlowPath of one operating point, with the compressor
+    pressure ratio balanced against the design nozzle exit area.
+
+    Params
+    ------
+    pod_mach : float
+        Vehicle mach number (unitless)
+    tube_pressure : float
+        Tube total pressure (Pa)
+    tube_temp : float
+        Tube total temperature (K)
+    comp_inlet_area : float
+        Inlet area of compressor. (m**2)
+    nozzle.Ps_exhaust : float
+        Exit pressure of nozzle (psi)
+    balance.area_des : float
+        Nozzle exit area at the design point (inch**2)
+    FlowPath.<des_var_targets> : float
+        Design inputs of the FlowPath, which has no input_vars of its own
+
+    Returns
+    -------
+    Same FlowPath outputs as Cycle, and the pressure ratio the compressor
+    runs at as balance.PR.
+    """
+
+    def __init__(self, fidelity='pycycle'):
+        super(OffDesignPoint, self).__init__()
+
+        inputs = self.add('FlowPathInputs', FlowPathInputs(),
+                          promotes=['pod_mach', 'tube_pressure', 'tube_temp', 'comp_inlet_area'])
+        # Linearized by the points Newton solve, which FlowPathInputs has no derivatives for
+        inputs.deriv_options['type'] = 'fd'
+        self.add('FlowPath', create_flow_path(fidelity=fidelity, input_vars=False),
+                 promotes=OUTPUTS + SHARED[1:])
+        self.add('balance', NozzleAreaBalance())
+
+        self.connect('pod_mach', 'FlowPath.fl_start.MN_target')
+        self.connect('FlowPathInputs.Pt', 'FlowPath.fl_start.P')
+        self.connect('FlowPathInputs.Tt', 'FlowPath.fl_start.T')
+        self.connect('FlowPathInputs.m_dot', 'FlowPath.fl_start.W')
+
+        self.connect('balance.PR', 'FlowPath.comp.map.PRdes')
+        self.connect('FlowPath.nozzle.Fl_O:stat:area', 'balance.area')
+
+        self.ln_solver = DirectSolver()
+
+
+class MultiPointCycle(Group):
+    """
+    Cycle with off-design points running its compressor and nozzle.
+
+    Params
+    ------
+    num_points : int
+        Number of off-design points, named points.point0, points.point1, ...
+        Their `pod_mach`, `tube_pressure` and `tube_temp` are params of their
+        own, to be connected or set.
+    fidelity : str
+        'pycycle' or 'lite', as for `Cycle`. Used at every point.
+
+    Returns
+    -------
+    Same variables as Cycle at the design point, and the FlowPath outputs
+    and compressor pressure ratio (balance.PR) of every point under
+    points.point<i>.
+
+    Notes
+    -----
+    The design inputs of every point's FlowPath are connected to the
+    input_vars of the design FlowPath, so setting the design efficiency,
+    shaft speed or duct and nozzle design variables there changes every
+    point along with the design. Points need the nozzle exit area, which
+    FlowPathSurrogate and FlowPathTable do not provide, so they are not
+    available here.
+
+    The points only share params, so their Jacobian is block diagonal.
+    They are converged together by one Newton solve whose linear systems
+    are solved with a single block Gauss-Seidel sweep, factoring each
+    point's block on its own.
+    """
+
+    def __init__(self, num_points=1, fidelity='pycycle'):
+        super(MultiPointCycle, self).__init__()
+
+        self.num_points = num_points
+
+        self.add('design', Cycle(fidelity=fidelity),
+                 promotes=['pod_mach', 'tube_pressure', 'tube_temp', 'comp_len', 'comp_mass',
+                           'comp.map.PRdes'] + SHARED + OUTPUTS)
+
+        points = self.add('points', Group(), promotes=SHARED)
+        for i in range(num_points):
+            point = points.add('point%d' % i, OffDesignPoint(fidelity=fidelity), promotes=SHARED)
+            self.connect('design.FlowPath.nozzle.Fl_O:stat:area', 'points.point%d.balance.area_des' % i)
+            for name, target in point.FlowPath.des_var_targets:
+                self.connect('design.FlowPath.input_vars.' + name,
+                             'points.point%d.FlowPath.%s' % (i, target))
+
+        points.nl_solver = Newton()
+        points.nl_solver.options['maxiter'] = 20
+        points.nl_solver.options['atol'] = 1e-8
+        # Nozzle area falls off convexly with PR, so full steps overshoot below PR = 1
+        points.nl_solver.line_search = BackTracking()
+        points.nl_solver.line_search.options['maxiter'] = 10
+        points.ln_solver = LinearGaussSeidel()
+        points.ln_solver.options['maxiter'] = 1
+
+if __name__ == "__main__":
+    #Compressor and nozzle sized at M .8 and 850 Pa, run at the booster entry
+    #speed and over a range of tube pressures
+    conditions = [(.75, 850.), (.8, 500.), (.8, 1200.)]
+
+    prob = Problem()
+    root = prob.root = Group()
+    root.add('Cycle', MultiPointCycle(num_points=len(conditions)))
+
+    params = (('comp_PR', 6.0, {'units': 'unitless'}),
+              ('PsE', 0.05588, {'units': 'psi'}),
+              ('pod_mach', .8, {'units': 'unitless'}),
+              ('tube_pressure', 850., {'units': 'Pa'}),
+              ('tube_temp', 320., {'units': 'K'}),
+              ('comp_inlet_area', 2.3884, {'units': 'm**2'}))
+    root.add('des_vars', IndepVarComp(params))
+
+    root.connect('des_vars.comp_PR', 'Cycle.comp.map.PRdes')
+    root.connect('des_vars.PsE', 'Cycle.nozzle.Ps_exhaust')
+    root.connect('des_vars.pod_mach', 'Cycle.pod_mach')
+    root.connect('des_vars.tube_pressure', 'Cycle.tube_pressure')
+    root.connect('des_vars.tube_temp', 'Cycle.tube_temp')
+    root.connect('des_vars.comp_inlet_area', 'Cycle.comp_inlet_area')
+
+    for i, (mach, pressure) in enumerate(conditions):
+        point_params = (('pod_mach', mach, {'units': 'unitless'}),
+                        ('tube_pressure', pressure, {'units': 'Pa'}),
+                        ('tube_temp', 320., {'units': 'K'}))
+        root.add('point%d_vars' % i, IndepVarComp(point_params))
+        for name in ('pod_mach', 'tube_pressure', 'tube_temp'):
+            root.connect('point%d_vars.%s' % (i, name), 'Cycle.points.point%d.%s' % (i, name))
+
+    prob.setup(check=False)
+    prob.run()
+
+    print('design           PR %f, Power %f W, Fg %f N' % (prob['des_vars.comp_PR'],
+                                                          cu(prob['Cycle.comp.power'], 'hp', 'W'),
+                                                          cu(prob['Cycle.nozzle.Fg'], 'lbf', 'N')))
+    for i, (mach, pressure) in enumerate(conditions):
+        point = 'Cycle.points.point%d.' % i
+        print('M %.2f, %6.1f Pa PR %f, Power %f W, Fg %f N' % (mach, pressure, prob[point + 'balance.PR'],
+                                                             cu(prob[point + 'comp.power'], 'hp', 'W'),
+                                                             cu(prob[point + 'nozzle.Fg'], 'lbf', 'N')))
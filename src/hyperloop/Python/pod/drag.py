@@ -3,7 +3,6 @@ from __future__ import print_function
 import numpy as np
 from scipy import interpolate as interp
 from openmdao.api import IndepVarComp, Component, Group, Problem
-import matplotlib.pylab as plt
 
 class Drag(Component):
 	'''
@@ -1,12 +1,10 @@
 from openmdao.api import Group, Problem
-from sqlitedict import SqliteDict
 
 from hyperloop.Python.pod.drivetrain.battery import Battery
 from hyperloop.Python.pod.drivetrain.electric_motor import MotorGroup
 from hyperloop.Python.pod.drivetrain.inverter import Inverter
 
 import numpy as np
-import matplotlib.pylab as plt
 
 class Drivetrain(Group):
 
@@ -1,13 +1,7 @@
 import numpy as np
-from openmdao.api import Group, Problem
 
-from hyperloop.Python.pod.drivetrain.electric_motor import MotorGroup
-
-
-def create_problem():
-    prob = Problem()
-    prob.root = MotorGroup()
-    return prob
+from hyperloop.Python.tests import cases
+from hyperloop.Python.tests.cases import motor_problem as create_problem
 
 
 class TestMotor(object):
@@ -45,17 +39,8 @@ class TestMotor(object):
 
         prob.setup()
 
-        prob['motor_max_current'] = 450.0
-        # prob['speed'] = 1900.0
-        prob['motor_LD_ratio'] = 0.83
-        # prob['max_rpm'] = 2500.0
-        prob['design_power'] = -110000
-        prob['design_torque'] = -420.169
-        prob['idp1.n_phases'] = 3.0
-        prob['motor_size.kappa'] = 0.5
-        prob['idp2.pole_pairs'] = 6.0
-        prob['motor_size.core_radius_ratio'] = 0.7
-        prob['motor_oversize_factor'] = 1.0
+        for name, value in cases.MOTOR_VALUES.items():
+            prob[name] = value
 
         prob.run()
         #
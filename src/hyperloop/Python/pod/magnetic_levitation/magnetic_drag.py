@@ -6,6 +6,29 @@ Calculates Magnetic Drag at set velocity desired with given parameters.
 from math import pi
 from openmdao.api import Group, Component, Problem, IndepVarComp
 
+def mag_drag_kernel(p):
+    """
+    Vectorized MagDrag. Takes a dict of params by name, as scalars or arrays
+    of design points, and returns a dict of outputs.
+    """
+
+    vel = p['vel']  # Desired Velocity for Drag Value
+    track_res = p['track_res']  # Track Resistance
+    track_ind = p['track_ind']  # Track Inductance
+    pod_weight = p['pod_weight']  # Levitation Force Required
+    lam = p['lam']  # Halbach Array Wavelength
+
+    omega = 2 * pi * vel / lam  # Frequency of Induced Current
+    mag_drag_lev = track_res * pod_weight / (omega * track_ind)  # Magnetic Drag from Levitation
+    mag_drag_prop = 0 * omega  # Magnetic Drag from Propulsion (TBD)
+    mag_drag = mag_drag_lev + mag_drag_prop  # Total Magnetic Drag
+
+    return {'omega' : omega,
+            'mag_drag_lev' : mag_drag_lev,
+            'mag_drag_prop' : mag_drag_prop,
+            'mag_drag' : mag_drag}
+
+
 class MagDrag(Component):
     """
     Params
@@ -69,23 +92,12 @@ class MagDrag(Component):
                         units='N',
                         desc='Total Magnetic Drag')
 
+    kernel = staticmethod(mag_drag_kernel)
+
     def solve_nonlinear(self, params, unknowns, resids):
 
-        vel = params['vel']  # Desired Velocity for Drag Value
-        track_res = params['track_res']  # Track Resistance
-        track_ind = params['track_ind']  # Track Inductance
-        pod_weight = params['pod_weight']  # Levitation Force Required
-        lam = params['lam']  # Halbach Array Wavelength
-
-        omega = 2 * pi * vel / lam  # Frequency of Induced Current
-        mag_drag_lev = track_res * pod_weight / (omega * track_ind)  # Magnetic Drag from Levitation
-        mag_drag_prop = 0  # Magnetic Drag from Propulsion (TBD)
-        mag_drag = mag_drag_lev + mag_drag_prop  # Total Magnetic Drag
-
-        unknowns['omega'] = omega
-        unknowns['mag_drag_lev'] = mag_drag_lev
-        unknowns['mag_drag_prop'] = mag_drag_prop
-        unknowns['mag_drag'] = mag_drag
+        for name, val in mag_drag_kernel(params).items():
+            unknowns[name] = val
 
 if __name__ == "__main__":
 
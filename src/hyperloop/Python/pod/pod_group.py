@@ -14,7 +14,6 @@ from openmdao.api import Newton, ScipyGMRES
 from openmdao.units.units import convert_units as cu
 
 import numpy as np
-import matplotlib.pylab as plt
 
 class PodGroup(Group):
     """TODOs
@@ -82,13 +81,14 @@ class PodGroup(Group):
     .. [1] Friend, Paul. Magnetic Levitation Train Technology 1. Thesis.
        Bradley University, 2004. N.p.: n.p., n.d. Print.
     """
-    def __init__(self):
+    def __init__(self, cycle_surrogate=None, cycle_table=None, cycle_fidelity='pycycle'):
         super(PodGroup, self).__init__()
 
         self.add('drag', Drag(), promotes = ['pod_mach', 'Cd'])
-        self.add('cycle', Cycle(), promotes=['comp.map.PRdes', 'nozzle.Ps_exhaust', 'comp_inlet_area',
-                                             'nozzle.Fg', 'inlet.F_ram', 'nozzle.Fl_O:tot:T', 'nozzle.Fl_O:stat:W',
-                                             'tube_pressure', 'tube_temp'])
+        cycle = Cycle(surrogate=cycle_surrogate, table=cycle_table, fidelity=cycle_fidelity)
+        self.add('cycle', cycle, promotes=['comp.map.PRdes', 'nozzle.Ps_exhaust', 'comp_inlet_area',
+                                           'nozzle.Fg', 'inlet.F_ram', 'nozzle.Fl_O:tot:T',
+                                           'nozzle.Fl_O:stat:W', 'tube_pressure', 'tube_temp'])
         self.add('pod_mach', PodMach(), promotes=['A_tube'])
         self.add('drivetrain', Drivetrain(), promotes=['des_time', 'time_of_flight', 'motor_max_current', 'motor_LD_ratio',
                                                        'inverter_efficiency', 'motor_oversize_factor', 'battery_cross_section_area'])
@@ -127,8 +127,11 @@ class PodGroup(Group):
         # Connects Pod Mass outputs to downstream components
         self.connect('pod_mass.pod_mass', 'levitation_group.m_pod')
 
-if __name__ == "__main__":
-
+def create_problem():
+    """
+    PodGroup with the inputs of its baseline design on a des_vars
+    IndepVarComp, used by the demo below and tools/benchmark.py.
+    """
     prob = Problem()
     root = prob.root = Group()
     root.add('Pod', PodGroup())
@@ -152,26 +155,31 @@ if __name__ == "__main__":
               ('h_lev', 0.01, {'unit': 'm'}),
               ('vel', 350.0, {'units': 'm/s'}))
 
-    prob.root.add('des_vars', IndepVarComp(params))
-    prob.root.connect('des_vars.comp_inlet_area', 'Pod.comp_inlet_area')
-    prob.root.connect('des_vars.comp_PR', 'Pod.comp.map.PRdes')
-    prob.root.connect('des_vars.PsE', 'Pod.nozzle.Ps_exhaust')
-    prob.root.connect('des_vars.des_time', 'Pod.des_time')
-    prob.root.connect('des_vars.time_of_flight', 'Pod.time_of_flight')
-    prob.root.connect('des_vars.motor_max_current', 'Pod.motor_max_current')
-    prob.root.connect('des_vars.motor_LD_ratio', 'Pod.motor_LD_ratio')
-    prob.root.connect('des_vars.motor_oversize_factor', 'Pod.motor_oversize_factor')
-    prob.root.connect('des_vars.inverter_efficiency', 'Pod.inverter_efficiency')
-    prob.root.connect('des_vars.battery_cross_section_area', 'Pod.battery_cross_section_area')
-    prob.root.connect('des_vars.n_passengers', 'Pod.n_passengers')
-    prob.root.connect('des_vars.A_payload', 'Pod.A_payload')
-    prob.root.connect('des_vars.pod_mach_number', 'Pod.pod_mach')
-    prob.root.connect('des_vars.tube_pressure', 'Pod.tube_pressure')
-    prob.root.connect('des_vars.tube_temp', 'Pod.tube_temp')
-    prob.root.connect('des_vars.vel_b', 'Pod.vel_b')
-    prob.root.connect('des_vars.h_lev', 'Pod.h_lev')
-    prob.root.connect('des_vars.vel', 'Pod.vel')
+    root.add('des_vars', IndepVarComp(params))
+    root.connect('des_vars.comp_inlet_area', 'Pod.comp_inlet_area')
+    root.connect('des_vars.comp_PR', 'Pod.comp.map.PRdes')
+    root.connect('des_vars.PsE', 'Pod.nozzle.Ps_exhaust')
+    root.connect('des_vars.des_time', 'Pod.des_time')
+    root.connect('des_vars.time_of_flight', 'Pod.time_of_flight')
+    root.connect('des_vars.motor_max_current', 'Pod.motor_max_current')
+    root.connect('des_vars.motor_LD_ratio', 'Pod.motor_LD_ratio')
+    root.connect('des_vars.motor_oversize_factor', 'Pod.motor_oversize_factor')
+    root.connect('des_vars.inverter_efficiency', 'Pod.inverter_efficiency')
+    root.connect('des_vars.battery_cross_section_area', 'Pod.battery_cross_section_area')
+    root.connect('des_vars.n_passengers', 'Pod.n_passengers')
+    root.connect('des_vars.A_payload', 'Pod.A_payload')
+    root.connect('des_vars.pod_mach_number', 'Pod.pod_mach')
+    root.connect('des_vars.tube_pressure', 'Pod.tube_pressure')
+    root.connect('des_vars.tube_temp', 'Pod.tube_temp')
+    root.connect('des_vars.vel_b', 'Pod.vel_b')
+    root.connect('des_vars.h_lev', 'Pod.h_lev')
+    root.connect('des_vars.vel', 'Pod.vel')
+
+    return prob
+
+if __name__ == "__main__":
 
+    prob = create_problem()
     prob.setup()
     prob.root.list_connections()
 
@@ -9,6 +9,101 @@ from __future__ import print_function
 import numpy as np
 from openmdao.api import IndepVarComp, Component, Group, Problem, ExecComp
 
+def mach_to_area(M1, M2, gam):
+    '''(A2/A1) = f(M2)/f(M1) where f(M) = (1/M)*((2/(gam+1))*(1+((gam-1)/2)*M**2))**((gam+1)/(2*(gam-1)))'''
+    A_ratio = (M1 / M2) * (((1.0 + ((gam - 1.0) / 2.0) * (M2**2.0)) /
+                            (1.0 + ((gam - 1.0) / 2.0) * (M1**2.0)))**(
+                                (gam + 1.0) / (2.0 * (gam - 1.0))))
+    return A_ratio
+
+def mach_to_area_partials(M1, M2, gam):
+    """
+    Partials of `mach_to_area` with respect to M1, M2 and gam.
+
+    Returns
+    -------
+    dA_dM1, dA_dM2, dA_dgam : float or array
+        Same shape as the broadcast inputs.
+    """
+    A_ratio = mach_to_area(M1, M2, gam)
+    k = (gam - 1.0) / 2.0
+    e = (gam + 1.0) / (2.0 * (gam - 1.0))
+    f1 = 1.0 + k * M1**2.0
+    f2 = 1.0 + k * M2**2.0
+
+    #log derivative of A_ratio = ln(M1) - ln(M2) + e*(ln(f2) - ln(f1))
+    dA_dM1 = A_ratio * (1.0 / M1 - e * 2.0 * k * M1 / f1)
+    dA_dM2 = A_ratio * (-1.0 / M2 + e * 2.0 * k * M2 / f2)
+    dA_dgam = A_ratio * (-(np.log(f2) - np.log(f1)) / (gam - 1.0)**2.0 +
+                         e * (0.5 * M2**2.0 / f2 - 0.5 * M1**2.0 / f1))
+    return dA_dM1, dA_dM2, dA_dgam
+
+def pod_mach_kernel(p):
+    """
+    Vectorized PodMach.
+
+    Params
+    ------
+    p : dict
+        PodMach params by name. Values may be scalars or arrays of design
+        points and are broadcast against each other.
+
+    Returns
+    -------
+    unknowns : dict
+        PodMach outputs by name, as arrays of the broadcast shape.
+    """
+    gam = p['gam']
+    comp_inlet_area = p['comp_inlet_area']
+    A_pod = p['A_pod']
+    L = p['L']
+    prc = p['prc']
+    p_tube = p['p_tube']
+    R = p['R']
+    T_ambient = p['T_ambient']
+    mu = p['mu']
+    M_duct = p['M_duct']
+    M_diff = p['M_diff']
+    cp = p['cp']
+    M_pod = p['M_pod']
+
+    #Define intermediate variables
+    rho_inf = p_tube / (R *
+                        T_ambient)  #Calculate density of free stream flow
+    U_inf = M_pod * (np.sqrt((gam * R * T_ambient)))        #Calculate velocity of free stream flow
+    r_pod = np.sqrt((A_pod / np.pi))  #Calculate pod radius
+
+    Re = (rho_inf * U_inf *
+          L) / mu  #Calculate length based Reynolds Number
+    delta_star = (.04775*L)/(Re**.2)    #Calculate displacement boundary layer thickness
+
+    BF = comp_inlet_area/A_pod           #Calculate diffuser based blockage factor
+    A_diff = BF * A_pod  #Calculate diffuser output area based on blockage factor input
+
+    #Calculate inlet area. Inlet is necessary if free stream Mach number is greater than max compressore mach number M_diff
+    A_inlet = np.where(np.real(M_pod) > np.real(M_diff),
+                       A_diff * mach_to_area(M_diff, M_pod, gam),
+                       A_diff)
+
+    eps = mach_to_area(M_pod, M_duct, gam)
+
+    A_tube = (A_pod + np.pi * (((r_pod + delta_star)**2.0) - (r_pod**2.0)) -
+              (eps * A_inlet)) / ((1.0 + (np.sqrt(eps))) * (1.0 - (np.sqrt(eps))))
+    pwr_comp = (rho_inf * U_inf * A_inlet) * cp * T_ambient * (1.0 + (
+        (gam - 1) / 2.0) * (M_pod**2)) * ((prc**((gam - 1) / gam)) - 1)
+    A_bypass = A_tube - A_inlet
+    A_duct_eff = A_tube - A_pod - np.pi * ((
+        (r_pod + delta_star)**2) - (r_pod**2))
+
+    return {'pwr_comp' : pwr_comp,
+            'A_inlet' : A_inlet,
+            'A_tube' : A_tube,
+            'A_bypass' : A_bypass,
+            'A_duct_eff' : A_duct_eff,
+            'A_diff' : A_diff,
+            'Re' : Re}
+
+
 class PodMach(Component):
     """
     Notes
@@ -126,66 +221,102 @@ class PodMach(Component):
                         desc='Area after diffuser')
         self.add_output('Re', val=0.0, desc='Reynolds Number')
 
+    kernel = staticmethod(pod_mach_kernel)
+
     def solve_nonlinear(self, params, unknowns, resids):
 
+        for name, val in pod_mach_kernel(params).items():
+            unknowns[name] = val
+
+    def linearize(self, params, unknowns, resids):
+        """
+        Analytic partials, carried forward as gradients over all params in
+        the same order as `pod_mach_kernel`.
+        """
+        names = ('gam', 'R', 'comp_inlet_area', 'A_pod', 'L', 'prc', 'p_tube',
+                 'T_ambient', 'mu', 'M_duct', 'M_diff', 'cp', 'M_pod')
+        n = len(names)
+        d = dict((name, np.eye(n)[i]) for i, name in enumerate(names))
+
         gam = params['gam']
-        comp_inlet_area = params['comp_inlet_area']
+        R = params['R']
         A_pod = params['A_pod']
         L = params['L']
         prc = params['prc']
         p_tube = params['p_tube']
-        R = params['R']
         T_ambient = params['T_ambient']
         mu = params['mu']
         M_duct = params['M_duct']
         M_diff = params['M_diff']
         cp = params['cp']
-        #delta_star = params['delta_star']
         M_pod = params['M_pod']
 
-        def mach_to_area(M1, M2, gam):
-            '''(A2/A1) = f(M2)/f(M1) where f(M) = (1/M)*((2/(gam+1))*(1+((gam-1)/2)*M**2))**((gam+1)/(2*(gam-1)))'''
-            A_ratio = (M1 / M2) * (((1.0 + ((gam - 1.0) / 2.0) * (M2**2.0)) /
-                                    (1.0 + ((gam - 1.0) / 2.0) * (M1**2.0)))**(
-                                        (gam + 1.0) / (2.0 * (gam - 1.0))))
-            return A_ratio
+        rho_inf = p_tube / (R * T_ambient)
+        drho_inf = rho_inf * (d['p_tube'] / p_tube - d['R'] / R - d['T_ambient'] / T_ambient)
+        U_inf = M_pod * np.sqrt(gam * R * T_ambient)
+        dU_inf = U_inf * (d['M_pod'] / M_pod +
+                          0.5 * (d['gam'] / gam + d['R'] / R + d['T_ambient'] / T_ambient))
+        r_pod = np.sqrt(A_pod / np.pi)
+        dr_pod = 0.5 * r_pod / A_pod * d['A_pod']
 
-        #Define intermediate variables
-        rho_inf = p_tube / (R *
-                            T_ambient)  #Calculate density of free stream flow
-        U_inf = M_pod * (np.sqrt((gam * R * T_ambient)))        #Calculate velocity of free stream flow
-        r_pod = np.sqrt((A_pod / np.pi))  #Calculate pod radius
+        Re = (rho_inf * U_inf * L) / mu
+        dRe = Re * (drho_inf / rho_inf + dU_inf / U_inf + d['L'] / L - d['mu'] / mu)
+        delta_star = (.04775 * L) / (Re**.2)
+        ddelta_star = delta_star * (d['L'] / L - .2 * dRe / Re)
 
-        Re = (rho_inf * U_inf *
-              L) / mu  #Calculate length based Reynolds Number
-        delta_star = (.04775*L)/(Re**.2)    #Calculate displacement boundary layer thickness
+        #A_diff = (comp_inlet_area/A_pod)*A_pod
+        A_diff = params['comp_inlet_area']
+        dA_diff = d['comp_inlet_area']
 
-        BF = comp_inlet_area/A_pod           #Calculate diffuser based blockage factor
-        A_diff = BF * A_pod  #Calculate diffuser output area based on blockage factor input
-
-        #Calculate inlet area. Inlet is necessary if free stream Mach number is greater than max compressore mach number M_diff
         if M_pod > M_diff:
-            A_inlet = A_diff * mach_to_area(M_diff, M_pod, gam)
+            ratio = mach_to_area(M_diff, M_pod, gam)
+            dr_dM1, dr_dM2, dr_dgam = mach_to_area_partials(M_diff, M_pod, gam)
+            A_inlet = A_diff * ratio
+            dA_inlet = dA_diff * ratio + A_diff * (dr_dM1 * d['M_diff'] +
+                                                   dr_dM2 * d['M_pod'] +
+                                                   dr_dgam * d['gam'])
         else:
             A_inlet = A_diff
+            dA_inlet = dA_diff
 
         eps = mach_to_area(M_pod, M_duct, gam)
+        de_dM1, de_dM2, de_dgam = mach_to_area_partials(M_pod, M_duct, gam)
+        deps = de_dM1 * d['M_pod'] + de_dM2 * d['M_duct'] + de_dgam * d['gam']
+
+        #displacement thickness area, pi*((r_pod + delta_star)**2 - r_pod**2)
+        A_bl = np.pi * (2.0 * r_pod * delta_star + delta_star**2.0)
+        dA_bl = 2.0 * np.pi * (dr_pod * delta_star + (r_pod + delta_star) * ddelta_star)
 
-        A_tube = (A_pod + np.pi * (((r_pod + delta_star)**2.0) - (r_pod**2.0)) -
-                  (eps * A_inlet)) / ((1.0 + (np.sqrt(eps))) * (1.0 - (np.sqrt(eps))))
-        pwr_comp = (rho_inf * U_inf * A_inlet) * cp * T_ambient * (1.0 + (
-            (gam - 1) / 2.0) * (M_pod**2)) * ((prc**((gam - 1) / gam)) - 1)
-        A_bypass = A_tube - A_inlet
-        A_duct_eff = A_tube - A_pod - np.pi * ((
-            (r_pod + delta_star)**2) - (r_pod**2))
-
-        unknowns['pwr_comp'] = pwr_comp
-        unknowns['A_inlet'] = A_inlet
-        unknowns['A_tube'] = A_tube
-        unknowns['A_bypass'] = A_bypass
-        unknowns['A_duct_eff'] = A_duct_eff
-        unknowns['A_diff'] = A_diff
-        unknowns['Re'] = Re
+        num = A_pod + A_bl - eps * A_inlet
+        dnum = d['A_pod'] + dA_bl - deps * A_inlet - eps * dA_inlet
+        dA_tube = dnum / (1.0 - eps) + num / (1.0 - eps)**2.0 * deps
+
+        mdot = rho_inf * U_inf * A_inlet
+        dmdot = drho_inf * U_inf * A_inlet + rho_inf * dU_inf * A_inlet + rho_inf * U_inf * dA_inlet
+        Tt_ratio = 1.0 + ((gam - 1) / 2.0) * (M_pod**2)
+        dTt_ratio = 0.5 * M_pod**2 * d['gam'] + (gam - 1) * M_pod * d['M_pod']
+        work = (prc**((gam - 1) / gam)) - 1
+        dwork = (prc**((gam - 1) / gam)) * (((gam - 1) / gam) / prc * d['prc'] +
+                                             np.log(prc) / gam**2 * d['gam'])
+        dpwr_comp = (dmdot * cp * T_ambient * Tt_ratio * work +
+                     mdot * d['cp'] * T_ambient * Tt_ratio * work +
+                     mdot * cp * d['T_ambient'] * Tt_ratio * work +
+                     mdot * cp * T_ambient * dTt_ratio * work +
+                     mdot * cp * T_ambient * Tt_ratio * dwork)
+
+        grads = {'pwr_comp' : dpwr_comp,
+                 'A_inlet' : dA_inlet,
+                 'A_tube' : dA_tube,
+                 'A_bypass' : dA_tube - dA_inlet,
+                 'A_duct_eff' : dA_tube - d['A_pod'] - dA_bl,
+                 'A_diff' : dA_diff,
+                 'Re' : dRe}
+
+        J = {}
+        for out, grad in grads.items():
+            for i, name in enumerate(names):
+                J[out, name] = grad[i]
+        return J
 
 if __name__ == '__main__':
     top = Problem()
@@ -199,10 +330,6 @@ if __name__ == '__main__':
     root.connect('input_vars.M_pod', 'p.M_pod')
     root.connect('input_vars.gam', 'p.gam')
 
-    root.deriv_options['type'] = 'fd'
-    root.deriv_options['form'] = 'central'
-    root.deriv_options['step_size'] = 1.0e-8
-
     top.setup()
 
     top.run()
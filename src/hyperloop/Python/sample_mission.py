@@ -1,8 +1,48 @@
 from __future__ import print_function
 
 import numpy as np
+from scipy.integrate import quad
 from openmdao.api import IndepVarComp, Component, Group, Problem
 
+def coast(vf, v0, F, c, m_pod):
+	'''
+	Distance and time for the pod to slow from vf to v0 between boosters.
+
+	Solves m*dv/dt = F - c*v**2 in closed form, where F is the constant net
+	force (thrust less grade and magnetic drag) and c*v**2 the aerodynamic
+	drag. Assumes the pod is decelerating, i.e. c*v**2 > F for v0 <= v <= vf.
+
+	Returns
+	-------
+	x : float
+		Coast distance in m. nan if the closed form is singular (c == 0 or
+		F == 0).
+	t : float
+		Coast time in s. nan if the closed form is singular.
+	'''
+	if c == 0.0 or F == 0.0:
+		return np.nan, np.nan
+
+	x = (m_pod/(2.0*c))*np.log((c*vf**2 - F)/(c*v0**2 - F))
+	if F > 0.0:
+		#terminal velocity a, v(t) = a*coth(...)
+		a = np.sqrt(F/c)
+		t = (m_pod/(2.0*c*a))*(np.log((vf - a)/(vf + a)) - np.log((v0 - a)/(v0 + a)))
+	else:
+		b = np.sqrt(-F/c)
+		t = (m_pod/(c*b))*(np.arctan(vf/b) - np.arctan(v0/b))
+	return x, t
+
+def coast_adaptive(vf, v0, F, c, m_pod):
+	'''
+	Same as `coast`, integrating dt/dv and dx/dv with adaptive quadrature.
+	Used where the closed form is singular.
+	'''
+	t = quad(lambda v: m_pod/(c*v**2 - F), v0, vf)[0]
+	x = quad(lambda v: m_pod*v/(c*v**2 - F), v0, vf)[0]
+	return x, t
+
+
 class SampleMission(Component):
 	'''
 	Notes
@@ -98,47 +138,35 @@ class SampleMission(Component):
 
 		vf = M_pod * np.sqrt(gam*R*T_tunnel)
 		v0 = vf - 15.0
-		
+
 		dx_start = (vf**2)/(2*g)
 		dx_boost = ((vf**2) - (v0**2))/(2*g)
 		thrust_time = (vf - v0)/g
 
 		rho = p_tunnel/(R*T_tunnel)
-		
-		#Initialize numerical integration
-		i = x = 0.0
-		v = vf
-		dt = .01
-		net_thrust = nozzle_thrust - ram_drag
-
-		print(net_thrust - (.5*Cd*rho*S*(v**2.0)) - (m_pod*g*np.sin(theta)) - D_mag)
-		
-		while v > v0:
-			#Integrate numerically using predictor-corrector method for velocity
-			v_old = v
-			v_init = ((dt/m_pod)*(net_thrust - (.5*Cd*rho*S*(v**2.0)) - (m_pod*g*np.sin(theta)) - D_mag)) + v
-			v = v + ((dt/m_pod)*(net_thrust - (.5*Cd*rho*S*(v_init**2.0)) - (m_pod*g*np.sin(theta)) - D_mag) + \
-				((dt/m_pod)*(net_thrust - (.5*Cd*rho*S*(v**2.0)) - (m_pod*g*np.sin(theta)) - D_mag)))/2.0
-			x = x + ((v_old+v)/2.0)*dt
-			if v > v_old:
-				print('thrust greater than drag')
-				u['num_thrust'] = 0.0
-				u['prop_period'] = track_length
-				u['coast_time'] = track_length/vf
-				break
-
-			i = i + 1.0
-
-			if i>100000:
-				break
+
+		#Constant net force and aerodynamic drag coefficient, m*dv/dt = F - c*v**2
+		F = nozzle_thrust - ram_drag - (m_pod*g*np.sin(theta)) - D_mag
+		c = .5*Cd*rho*S
 
 		u['dx_start'] = dx_start
 		u['dx_boost'] = dx_boost
 		u['thrust_time'] = thrust_time
-		if u['prop_period'] == 1.0 and u['num_thrust'] == 1.0 and u['coast_time'] ==1.0:
-			u['prop_period'] = x
-			u['num_thrust'] = np.ceil(track_length/x)
-			u['coast_time'] = i*dt
+
+		if F - c*(v0**2) >= 0.0:
+			#Pod never slows down to v0, no boosters needed after start up
+			u['num_thrust'] = 0.0
+			u['prop_period'] = track_length
+			u['coast_time'] = track_length/vf
+			return
+
+		x, t = coast(vf, v0, F, c, m_pod)
+		if not (np.isfinite(x) and np.isfinite(t)):
+			x, t = coast_adaptive(vf, v0, F, c, m_pod)
+
+		u['prop_period'] = x
+		u['num_thrust'] = np.ceil(track_length/x)
+		u['coast_time'] = t
 
 if __name__ == '__main__':
 	top = Problem()
@@ -31,6 +31,6 @@ class TestMissionDrag(object):
 
         prob.run()
 
-        assert np.isclose(prob['comp.omega_b'][0], .1, rtol = 0.01)
+        assert np.isclose(prob['comp.omega_b'][0], 0.0, rtol = 0.01)
         assert np.isclose(prob['comp.omega_b'][1], 0.1, rtol = 0.01)
-        assert np.isclose(prob['comp.omega_b'][2], 0.0, rtol = 0.01)
\ No newline at end of file
+        assert np.isclose(prob['comp.omega_b'][2], .1, rtol = 0.01)
\ No newline at end of file
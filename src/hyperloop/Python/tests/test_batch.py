@@ -0,0 +1,38 @@
+import numpy as np
+
+from hyperloop.Python.pod.pod_mach import PodMach
+from hyperloop.Python.pod.magnetic_levitation.magnetic_drag import MagDrag
+from hyperloop.Python.tube.submerged_tube import SubmergedTube
+from hyperloop.Python.tools.batch import batch_evaluate
+
+class TestBatch(object):
+    def test_case1_matches_pointwise(self):
+
+        component = PodMach()
+        M_pod = np.linspace(.4, .9, 11)
+        p_tube = np.array([100., 850., 2000.])[:, None]
+
+        results = batch_evaluate(component, M_pod=M_pod, p_tube=p_tube)
+
+        assert results['A_tube'].shape == (3, 11)
+        for i in range(3):
+            for j in range(11):
+                point = batch_evaluate(component, M_pod=M_pod[j], p_tube=p_tube[i, 0])
+                for name, val in results.items():
+                    assert np.isclose(val[i, j], point[name])
+
+    def test_case2_vs_breakpoint(self):
+
+        results = batch_evaluate(MagDrag(), vel=[23., 23.], track_res=0.019269,
+                                 track_ind=3.59023e-6, pod_weight=29430.0, lam=0.125658)
+
+        assert np.allclose(results['mag_drag'], 137342.0, rtol=.001)
+        assert np.all(results['mag_drag_prop'] == 0.0)
+
+    def test_case3_thickness_branch(self):
+
+        depth = np.array([0., 20., 60.])
+        results = batch_evaluate(SubmergedTube(), depth=depth, A_tube=30.)
+
+        assert np.all(results['t'] >= results['t_crit'])
+        assert np.all(np.diff(results['t']) > 0.0)
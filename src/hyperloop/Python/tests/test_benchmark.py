@@ -0,0 +1,41 @@
+import os
+import tempfile
+
+from openmdao.api import Group, Problem, IndepVarComp, ExecComp
+
+from hyperloop.Python.tools import benchmark
+
+def create_case():
+    prob = Problem(Group())
+    prob.root.add('des_vars', IndepVarComp('x', 1.0), promotes=['x'])
+    prob.root.add('comp', ExecComp('f = x**2'), promotes=['x', 'f'])
+    return prob, {'x' : 3.0}, [{}, {'x' : 4.0}]
+
+class TestBenchmark(object):
+    def test_case1_measure(self):
+
+        result = benchmark.measure(create_case, repeat=2)
+
+        assert set(result.keys()) == set(benchmark.METRICS)
+        assert result['setup_time'] >= 0.0
+        assert result['run_time'] >= 0.0
+        assert result['iterations'] >= 0
+
+    def test_case2_regressions(self):
+
+        baseline = {'Cycle' : {'setup_time' : 1.0, 'run_time' : 2.0, 'iterations' : 10, 'peak_memory' : None}}
+        results = {'Cycle' : {'setup_time' : 1.1, 'run_time' : 3.0, 'iterations' : 11, 'peak_memory' : 5},
+                   'TubeTemp' : {'setup_time' : 1.0, 'run_time' : 1.0, 'iterations' : 1, 'peak_memory' : 1}}
+
+        regressions = benchmark.compare(results, baseline, threshold=.25)
+
+        assert regressions == [('Cycle', 'run_time', 2.0, 3.0), ('Cycle', 'iterations', 10, 11)]
+
+    def test_case3_baseline_round_trip(self):
+
+        filename = os.path.join(tempfile.mkdtemp(), 'baseline.json')
+        results = {'Cycle' : {'setup_time' : 1.0, 'run_time' : 2.0, 'iterations' : 10, 'peak_memory' : 100}}
+
+        benchmark.save_baseline(results, filename)
+
+        assert benchmark.load_baseline(filename) == results
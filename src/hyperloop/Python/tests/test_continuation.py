@@ -0,0 +1,30 @@
+import numpy as np
+from openmdao.api import Group, Problem, IndepVarComp, ExecComp
+
+from hyperloop.Python.tools.continuation import Continuation, path_order
+
+def create_problem():
+    root = Group()
+    prob = Problem(root)
+    prob.root.add('des_vars', IndepVarComp((('x', 1.0),)))
+    prob.root.add('comp', ExecComp('f = x**2'))
+    prob.root.connect('des_vars.x', 'comp.x')
+    return prob
+
+class TestContinuation(object):
+    def test_case1_path_order(self):
+
+        x = [0.5, 0.1, 0.9, 0.3, 0.7]
+        order = path_order([{'x' : val} for val in x])
+
+        assert order == [0, 3, 1, 4, 2] or order == [0, 4, 2, 3, 1]
+
+    def test_case2_results_in_case_order(self):
+
+        x = np.array([3.0, 1.0, 2.0, 0.0, 4.0])
+        sweep = Continuation(create_problem, ['comp.f'], compare_cold=True)
+        results = sweep.run([{'des_vars.x' : val} for val in x])
+
+        assert np.allclose(results['comp.f'], x**2)
+        assert sweep.report['iterations_saved'] == (sweep.report['total_cold_iterations'] -
+                                                    sweep.report['total_warm_iterations'])
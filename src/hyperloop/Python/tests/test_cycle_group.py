@@ -21,49 +21,14 @@ from pycycle.connect_flow import connect_flow
 from pycycle.constants import AIR_FUEL_MIX, AIR_MIX
 from pycycle.constants import R_UNIVERSAL_ENG, R_UNIVERSAL_SI
 
-from hyperloop.Python.pod.cycle import cycle_group
-
-def create_problem(GroupName):
-    root = Group()
-    prob = Problem(root)
-    prob.root.add('Cycle', GroupName)
-    return prob
+from hyperloop.Python.tests import cases
 
 class TestCycle(object):
     def test_case1_vs_inductrack(self):
 
-        CycleGroup = cycle_group.Cycle()
-
-        prob = create_problem(CycleGroup)
-
-        params = (('comp_PR', 12.6, {'units': 'unitless'}),
-              ('PsE', 0.05588, {'units': 'psi'}),
-              ('pod_mach_number', .8, {'units': 'unitless'}),
-              ('tube_pressure', 850., {'units': 'Pa'}),
-              ('tube_temp', 320., {'units': 'K'}),
-              ('comp_inlet_area', 2.3884, {'units': 'm**2'}))
-
-        prob.root.add('des_vars', IndepVarComp(params))
-
-        prob.root.connect('des_vars.comp_PR', 'Cycle.comp.map.PRdes')
-        prob.root.connect('des_vars.PsE', 'Cycle.nozzle.Ps_exhaust')
-        prob.root.connect('des_vars.pod_mach_number', 'Cycle.pod_mach')
-        prob.root.connect('des_vars.tube_pressure', 'Cycle.tube_pressure')
-        prob.root.connect('des_vars.tube_temp', 'Cycle.tube_temp')
-        prob.root.connect('des_vars.comp_inlet_area', 'Cycle.comp_inlet_area')
-
-        prob.setup()
+        prob = cases.checkout(cases.cycle_problem, cases.CYCLE_VALUES)
         #prob.root.list_connections()
 
-        prob['Cycle.CompressorMass.comp_eff'] = 91.0
-
-        prob['Cycle.CompressorLen.h_stage'] = 58.2
-
-        prob['Cycle.FlowPathInputs.gamma'] = 1.4
-        prob['Cycle.FlowPathInputs.R'] = 287.
-        prob['Cycle.FlowPathInputs.eta'] = 0.99
-        prob['Cycle.FlowPathInputs.comp_mach'] = 0.6
-
         prob.run()
 
         # Test Values
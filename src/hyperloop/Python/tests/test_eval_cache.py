@@ -0,0 +1,51 @@
+import os
+import tempfile
+
+import numpy as np
+
+from hyperloop.Python.tools.eval_cache import EvalCache
+
+def create_cache(**kwargs):
+    path = os.path.join(tempfile.mkdtemp(), 'cache.db')
+    return path, EvalCache(path, fingerprint='model', **kwargs)
+
+class TestEvalCache(object):
+    def test_case1_hit_and_miss(self):
+
+        path, cache = create_cache()
+        key = cache.key({'des_vars.tube_pressure' : 850})
+
+        assert cache.get(key, ['A_tube']) is None
+
+        cache.put(key, {'A_tube' : np.array(20.0)})
+        cache.commit()
+
+        assert cache.key({'des_vars.tube_pressure' : 850.0}) == key
+        assert np.isclose(cache.get(key, ['A_tube'])[0], 20.0)
+        assert cache.get(key, ['A_tube', 'L_pod']) is None
+        assert cache.hits == 1 and cache.misses == 2
+
+    def test_case2_lru_eviction(self):
+
+        path, cache = create_cache(max_entries=2)
+        keys = [cache.key({'x' : float(i)}) for i in range(3)]
+
+        cache.put(keys[0], {'f' : 0.0})
+        cache.put(keys[1], {'f' : 1.0})
+        cache.commit()
+        cache.get(keys[0], ['f'])
+        cache.put(keys[2], {'f' : 2.0})
+        cache.commit()
+
+        assert len(cache) == 2
+        assert cache.get(keys[1], ['f']) is None
+        assert cache.get(keys[0], ['f']) is not None
+
+    def test_case3_fingerprint_invalidation(self):
+
+        path, cache = create_cache()
+        cache.put(cache.key({'x' : 1.0}), {'f' : 1.0})
+        cache.close()
+
+        assert len(EvalCache(path, fingerprint='model')) == 1
+        assert len(EvalCache(path, fingerprint='edited model')) == 0
@@ -0,0 +1,83 @@
+import os
+import tempfile
+
+import numpy as np
+
+from hyperloop.Python.pod.cycle import flow_path_surrogate
+
+def create_training_data():
+    X = flow_path_surrogate.latin_hypercube(40, 5, seed=1)
+    X = np.array([.5, .05, 500., 5., 2.]) + X*np.array([.4, .5, 100., 10., 10.])
+    W = X[:, 3]
+    Y = np.column_stack([W*(1.0 + .1*X[:, 4])]*len(flow_path_surrogate.SURROGATE_OUTPUTS))
+
+    filename = os.path.join(tempfile.mkdtemp(), 'flow_path.npz')
+    np.savez(filename, X=X, Y=Y, Ps_exhaust=0.05588)
+    return filename, X, Y
+
+class TestFlowPathSurrogate(object):
+    def test_case1_training_points(self):
+
+        filename, X, Y = create_training_data()
+        surrogate = flow_path_surrogate.FlowPathSurrogate(filename)
+
+        y, error = surrogate.predict(X[3])
+
+        assert np.allclose(y, Y[3], rtol=1e-3)
+        assert np.all(error < .01)
+
+    def test_case2_envelope(self):
+
+        filename, X, Y = create_training_data()
+        surrogate = flow_path_surrogate.FlowPathSurrogate(filename)
+
+        assert surrogate.in_envelope(X.mean(axis=0), 0.05588)
+        assert not surrogate.in_envelope(X.mean(axis=0), 0.1)
+        assert not surrogate.in_envelope(X.max(axis=0)*1.1, 0.05588)
+
+    def test_case3_area_scaling(self):
+
+        # The duct area goes as W/P, so its scaled value does not change
+        x = np.array([[.8, .1, 600., 10., 6.], [.8, .2, 600., 5., 6.]])
+        y = np.ones((2, len(flow_path_surrogate.SURROGATE_OUTPUTS)))
+        y[1] = .25
+        scaled = flow_path_surrogate.scale_outputs(x, y)
+
+        j = flow_path_surrogate.SURROGATE_OUTPUTS.index('comp.Fl_O:stat:area')
+        assert np.isclose(scaled[0, j], scaled[1, j])
+        assert np.allclose(flow_path_surrogate.scale_outputs(x, scaled, inverse=True), y)
+
+    def test_case4_generate_training_data(self):
+
+        from hyperloop.Python.pod.cycle.lite_flow_path import lite_flow_path_kernel
+
+        # The lite Cycle goes through the same Sweep and variable names as pycycle
+        filename = os.path.join(tempfile.mkdtemp(), 'flow_path.npz')
+        flow_path_surrogate.generate_training_data(filename, num_samples=4, num_procs=1,
+                                                   fidelity='lite')
+        data = np.load(filename)
+
+        assert data['X'].shape == (4, len(flow_path_surrogate.SURROGATE_INPUTS))
+        assert data['Y'].shape == (4, len(flow_path_surrogate.SURROGATE_OUTPUTS))
+        assert np.isclose(data['Ps_exhaust'], 0.05588)
+
+        inputs = dict(zip(flow_path_surrogate.SURROGATE_INPUTS, data['X'].T))
+        inputs['nozzle.Ps_exhaust'] = 0.05588
+        out = lite_flow_path_kernel(inputs)
+        for j, name in enumerate(flow_path_surrogate.SURROGATE_OUTPUTS):
+            assert np.allclose(data['Y'][:, j], out[name], rtol=1e-6)
+
+    def test_case5_error_estimate_on_fallback(self):
+
+        filename, X, Y = create_training_data()
+        prob = flow_path_surrogate.create_problem(surrogate=filename)
+        prob.setup(check=False)
+        surrogate = prob.root.Cycle.FlowPath
+        surrogate.error_estimate = dict((name, 0.0) for name in flow_path_surrogate.SURROGATE_OUTPUTS)
+
+        # Exhaust pressure other than the training value, answered by pycycle
+        prob['des_vars.PsE'] = 0.1
+        prob.run()
+
+        assert surrogate.num_fallback > 0
+        assert all(np.isinf(error) for error in surrogate.error_estimate.values())
@@ -0,0 +1,75 @@
+import os
+import tempfile
+
+import numpy as np
+
+from hyperloop.Python.pod.cycle import flow_path_table
+
+def create_table():
+    # Axes in a different order than TABLE_INPUTS, with a fixed exhaust pressure
+    axes = [('comp.map.PRdes', np.array([2., 6., 10., 15.])),
+            ('fl_start.MN_target', np.array([.5, .7, .9])),
+            ('nozzle.Ps_exhaust', np.array([0.05588])),
+            ('fl_start.P', np.array([.01, .1, 1.])),
+            ('fl_start.T', np.array([500., 700.]))]
+    PR, MN, PsE, P, T = np.meshgrid(*[values for name, values in axes], indexing='ij')
+
+    # Multilinear in every input, so the table reproduces it exactly
+    num_outputs = len(flow_path_table.TABLE_OUTPUTS)
+    coefs = np.arange(1.0, num_outputs + 1.0)
+    values = (1.0 + PR*MN + 2.0*P*T + .01*T)[..., None]*coefs
+
+    filename = os.path.join(tempfile.mkdtemp(), 'flow_path_table.npz')
+    arrays = dict(('axis_%d' % i, axis[1]) for i, axis in enumerate(axes))
+    np.savez_compressed(filename, names=np.array([name for name, values in axes]),
+                        outputs=np.array(flow_path_table.TABLE_OUTPUTS), values=values, **arrays)
+    return filename, coefs
+
+def exact(x, coefs):
+    MN, P, T, W, PR, PsE = x
+    y = (1.0 + PR*MN + 2.0*P*T + .01*T)*coefs
+    extensive = np.array([name in flow_path_table.EXTENSIVE_OUTPUTS
+                          for name in flow_path_table.TABLE_OUTPUTS])
+    return np.where(extensive, y*W, y)
+
+class TestFlowPathTable(object):
+    def test_case1_interpolation(self):
+
+        filename, coefs = create_table()
+        table = flow_path_table.PerformanceTable(filename)
+
+        x = np.array([.63, .37, 610., 7.5, 8.2, 0.05588])
+        y, dy_dx = table.evaluate(x)
+
+        assert np.allclose(y, exact(x, coefs))
+        for j in range(len(x) - 1):
+            dx = np.zeros(len(x))
+            dx[j] = 1e-6*max(abs(x[j]), 1.0)
+            fd = (exact(x + dx, coefs) - exact(x - dx, coefs))/(2.0*dx[j])
+            assert np.allclose(dy_dx[:, j], fd, rtol=1e-6)
+        assert np.all(dy_dx[:, -1] == 0.0)
+
+    def test_case2_batch(self):
+
+        filename, coefs = create_table()
+        table = flow_path_table.PerformanceTable(filename)
+
+        rng = np.random.RandomState(0)
+        X = np.column_stack([.5 + .4*rng.rand(50), .01 + rng.rand(50)*.99, 500. + 200.*rng.rand(50),
+                             10.*rng.rand(50), 2. + 13.*rng.rand(50), 0.05588*np.ones(50)])
+        y, dy_dx = table.evaluate(X.reshape(5, 10, 6))
+
+        assert y.shape == (5, 10, len(flow_path_table.TABLE_OUTPUTS))
+        assert dy_dx.shape == (5, 10, len(flow_path_table.TABLE_OUTPUTS), 6)
+        assert np.allclose(y.reshape(50, -1), [exact(x, coefs) for x in X])
+
+    def test_case3_envelope(self):
+
+        filename, coefs = create_table()
+        table = flow_path_table.PerformanceTable(filename)
+
+        x = np.array([.63, .37, 610., 7.5, 8.2, 0.05588])
+        assert table.in_envelope(x)
+        assert not table.in_envelope(np.where(np.arange(6) == 5, 0.1, x))
+        assert not table.in_envelope(np.where(np.arange(6) == 1, 2.0, x))
+        assert not table.in_envelope(np.where(np.arange(6) == 3, 0.0, x))
@@ -0,0 +1,26 @@
+"""
+Import cost of the top level model, which every sweep worker pays on start.
+"""
+import subprocess
+import sys
+
+# Seconds allowed for `import hyperloop.Python.tube_and_pod` in a fresh
+# interpreter, including OpenMDAO, pycycle and scipy.
+IMPORT_TIME_BUDGET = 5.0
+
+SCRIPT = """
+import sys, time
+t0 = time.time()
+import hyperloop.Python.tube_and_pod
+print(time.time() - t0)
+print('matplotlib' in sys.modules)
+"""
+
+class TestImportTime(object):
+    def test_case1_tube_and_pod(self):
+
+        out = subprocess.check_output([sys.executable, '-c', SCRIPT])
+        import_time, matplotlib_loaded = out.decode().split()
+
+        assert matplotlib_loaded == 'False'
+        assert float(import_time) < IMPORT_TIME_BUDGET
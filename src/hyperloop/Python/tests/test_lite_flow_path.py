@@ -0,0 +1,132 @@
+"""
+Test for lite_flow_path.py. Compared to the NPSS values of test_cycle_group
+with the tolerance of a perfect-gas model.
+"""
+import subprocess
+import sys
+
+import numpy as np
+from openmdao.api import Group, Problem, IndepVarComp
+from openmdao.units.units import convert_units as cu
+
+from hyperloop.Python.pod.cycle.cycle_group import Cycle, flow_path_variable, FLOW_PATH_PROMOTES
+from hyperloop.Python.pod.cycle.flow_path_inputs import flow_path_inputs_kernel
+from hyperloop.Python.pod.cycle.lite_flow_path import lite_flow_path_kernel, accuracy, LITE_OUTPUTS
+
+# Builds and runs a lite Cycle with pycycle blocked from importing
+NO_PYCYCLE_SCRIPT = """
+import sys
+sys.modules['pycycle'] = None
+from openmdao.api import Group, Problem, IndepVarComp
+from hyperloop.Python.pod.cycle.cycle_group import Cycle
+prob = Problem(Group())
+prob.root.add('Cycle', Cycle(fidelity='lite'))
+prob.root.add('des_vars', IndepVarComp((('pod_mach', .8, {'units': 'unitless'}),
+                                         ('comp_inlet_area', 2.3884, {'units': 'm**2'}))))
+prob.root.connect('des_vars.pod_mach', 'Cycle.pod_mach')
+prob.root.connect('des_vars.comp_inlet_area', 'Cycle.comp_inlet_area')
+prob.setup(check=False)
+prob.run()
+print(prob['Cycle.nozzle.Fg'] > 0.0)
+"""
+
+def flow_path_inputs(pod_mach, PR):
+    out = flow_path_inputs_kernel({'tube_pressure' : 850.,
+                                   'pod_mach' : pod_mach,
+                                   'comp_inlet_area' : 2.3884,
+                                   'tube_temp' : 320.,
+                                   'gamma' : 1.4,
+                                   'comp_mach' : .6,
+                                   'R' : 287.,
+                                   'eta' : .99})
+
+    return {'fl_start.MN_target' : pod_mach,
+            'fl_start.P' : cu(out['Pt'], 'Pa', 'psi'),
+            'fl_start.T' : cu(out['Tt'], 'degK', 'degR'),
+            'fl_start.W' : cu(out['m_dot'], 'kg/s', 'lbm/s'),
+            'comp.map.PRdes' : PR,
+            'nozzle.Ps_exhaust' : 0.05588}
+
+class TestLiteFlowPath(object):
+    def test_case1_vs_npss(self):
+
+        out = lite_flow_path_kernel(flow_path_inputs(.8, 12.6))
+
+        assert np.isclose(cu(out['comp.trq'], 'ft*lbf', 'N*m'), -2622.13, rtol=.01)
+        assert np.isclose(cu(out['comp.power'], 'hp', 'W'), -2745896.44, rtol=.01)
+        assert np.isclose(cu(out['comp.Fl_O:stat:area'], 'inch**2', 'm**2'), 0.314, rtol=.01)
+        assert np.isclose(cu(out['nozzle.Fg'], 'lbf', 'N'), 6562.36, rtol=.01)
+        assert np.isclose(cu(out['inlet.F_ram'], 'lbf', 'N'), 1855.47, rtol=.01)
+        assert np.isclose(cu(out['nozzle.Fl_O:tot:T'], 'degR', 'degK'), 767.132, rtol=.03)
+        assert np.isclose(cu(out['nozzle.Fl_O:stat:W'], 'lbm/s', 'kg/s'), 6.467, rtol=.01)
+
+    def test_case2_vectorized(self):
+
+        pod_mach, PR = np.meshgrid(np.linspace(.5, .9, 5), np.linspace(2., 15., 4))
+        out = lite_flow_path_kernel(flow_path_inputs(pod_mach, PR))
+
+        for i, j in ((0, 0), (2, 3), (3, 4)):
+            point = lite_flow_path_kernel(flow_path_inputs(pod_mach[i, j], PR[i, j]))
+            for name in LITE_OUTPUTS:
+                assert out[name].shape == (4, 5)
+                assert np.isclose(out[name][i, j], point[name], rtol=1e-12)
+
+    def test_case3_cycle_fidelity(self):
+
+        prob = Problem(Group())
+        prob.root.add('Cycle', Cycle(fidelity='lite'))
+
+        params = (('comp_PR', 12.6, {'units': 'unitless'}),
+                  ('PsE', 0.05588, {'units': 'psi'}),
+                  ('pod_mach_number', .8, {'units': 'unitless'}),
+                  ('tube_pressure', 850., {'units': 'Pa'}),
+                  ('tube_temp', 320., {'units': 'K'}),
+                  ('comp_inlet_area', 2.3884, {'units': 'm**2'}))
+
+        prob.root.add('des_vars', IndepVarComp(params))
+
+        prob.root.connect('des_vars.comp_PR', 'Cycle.comp.map.PRdes')
+        prob.root.connect('des_vars.PsE', 'Cycle.nozzle.Ps_exhaust')
+        prob.root.connect('des_vars.pod_mach_number', 'Cycle.pod_mach')
+        prob.root.connect('des_vars.tube_pressure', 'Cycle.tube_pressure')
+        prob.root.connect('des_vars.tube_temp', 'Cycle.tube_temp')
+        prob.root.connect('des_vars.comp_inlet_area', 'Cycle.comp_inlet_area')
+
+        prob.setup(check=False)
+
+        prob['Cycle.FlowPathInputs.gamma'] = 1.4
+        prob['Cycle.FlowPathInputs.R'] = 287.
+        prob['Cycle.FlowPathInputs.eta'] = 0.99
+        prob['Cycle.FlowPathInputs.comp_mach'] = 0.6
+
+        prob.run()
+
+        out = lite_flow_path_kernel(flow_path_inputs(.8, 12.6))
+        for name in LITE_OUTPUTS:
+            assert np.isclose(prob[flow_path_variable(name)], out[name], rtol=1e-6)
+
+    def test_case4_accuracy_names(self):
+
+        # Against itself, so only the Sweep and the variable names are tested
+        errors = accuracy(num_samples=4, num_procs=1, reference='lite')
+
+        assert list(errors.keys()) == list(LITE_OUTPUTS)
+        for name in LITE_OUTPUTS:
+            assert errors[name].shape == (4,)
+            assert np.all(np.abs(errors[name]) < 1e-6)
+
+    def test_case5_lite_without_pycycle(self):
+
+        out = subprocess.check_output([sys.executable, '-c', NO_PYCYCLE_SCRIPT])
+
+        assert out.decode().split()[-1] == 'True'
+
+    def test_case6_accuracy_vs_pycycle(self):
+
+        errors = accuracy(num_samples=6, num_procs=1)
+
+        # The outputs Cycle promotes, at the tolerance test_case1 holds
+        # against NPSS with some margin for the corners of the envelope
+        for name in LITE_OUTPUTS:
+            if name in FLOW_PATH_PROMOTES:
+                assert np.all(np.abs(errors[name]) < .05), name
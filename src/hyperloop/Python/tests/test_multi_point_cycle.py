@@ -0,0 +1,92 @@
+from functools import partial
+
+import numpy as np
+from openmdao.api import Group, Problem, IndepVarComp
+
+from hyperloop.Python.pod.cycle.multi_point_cycle import MultiPointCycle, OUTPUTS
+from hyperloop.Python.tests import cases
+
+def create_problem(num_points, fidelity='pycycle'):
+    root = Group()
+    prob = Problem(root)
+    prob.root.add('Cycle', MultiPointCycle(num_points=num_points, fidelity=fidelity))
+
+    params = (('comp_PR', 6.0, {'units': 'unitless'}),
+              ('PsE', 0.05588, {'units': 'psi'}),
+              ('pod_mach', .8, {'units': 'unitless'}),
+              ('tube_pressure', 850., {'units': 'Pa'}),
+              ('tube_temp', 320., {'units': 'K'}),
+              ('comp_inlet_area', 2.3884, {'units': 'm**2'}))
+    prob.root.add('des_vars', IndepVarComp(params))
+
+    prob.root.connect('des_vars.comp_PR', 'Cycle.comp.map.PRdes')
+    prob.root.connect('des_vars.PsE', 'Cycle.nozzle.Ps_exhaust')
+    prob.root.connect('des_vars.pod_mach', 'Cycle.pod_mach')
+    prob.root.connect('des_vars.tube_pressure', 'Cycle.tube_pressure')
+    prob.root.connect('des_vars.tube_temp', 'Cycle.tube_temp')
+    prob.root.connect('des_vars.comp_inlet_area', 'Cycle.comp_inlet_area')
+
+    for i in range(num_points):
+        point_params = (('pod_mach', .8, {'units': 'unitless'}),
+                        ('tube_pressure', 850., {'units': 'Pa'}),
+                        ('tube_temp', 320., {'units': 'K'}))
+        prob.root.add('point%d_vars' % i, IndepVarComp(point_params))
+        for name in ('pod_mach', 'tube_pressure', 'tube_temp'):
+            prob.root.connect('point%d_vars.%s' % (i, name), 'Cycle.points.point%d.%s' % (i, name))
+    return prob
+
+def run_points(fidelity):
+    prob = cases.checkout(partial(create_problem, 2, fidelity))
+
+    # Point 0 repeats the design point, point 1 halves the tube pressure
+    for i, pressure in enumerate((850., 425.)):
+        prob['point%d_vars.tube_pressure' % i] = pressure
+        prob['Cycle.points.point%d.balance.PR' % i] = 4.0
+    prob.run()
+    return prob
+
+def check_points(prob):
+    # The design point is recovered from a different initial pressure ratio
+    assert np.isclose(prob['Cycle.points.point0.balance.PR'], 6.0, rtol=1e-6)
+    for name in OUTPUTS:
+        assert np.isclose(prob['Cycle.points.point0.' + name], prob['Cycle.' + name], rtol=1e-6)
+
+    # Same inlet area and Mach number, so half the mass flow
+    assert np.isclose(prob['Cycle.points.point1.FlowPathInputs.m_dot'],
+                      .5*prob['Cycle.design.FlowPathInputs.m_dot'], rtol=1e-6)
+    assert np.isclose(prob['Cycle.points.point1.nozzle.Fl_O:stat:W'],
+                      .5*prob['Cycle.nozzle.Fl_O:stat:W'], rtol=1e-3)
+
+    # Off-design the nozzle keeps its design area, so the compressor moves
+    # off its design pressure ratio against the same exhaust pressure
+    assert np.isclose(prob['Cycle.points.point1.FlowPath.nozzle.Fl_O:stat:area'],
+                      prob['Cycle.design.FlowPath.nozzle.Fl_O:stat:area'], rtol=1e-6)
+    assert not np.isclose(prob['Cycle.points.point1.balance.PR'], 6.0, rtol=.05)
+    assert not np.isclose(prob['Cycle.points.point1.nozzle.Fg'], .5*prob['Cycle.nozzle.Fg'], rtol=.05)
+
+class TestMultiPointCycle(object):
+    def test_case1_points_vs_design(self):
+
+        check_points(run_points('pycycle'))
+
+    def test_case2_lite_points_vs_design(self):
+
+        check_points(run_points('lite'))
+
+    def test_case3_lite_points_follow_design_inputs(self):
+
+        prob = cases.checkout(partial(create_problem, 1, 'lite'))
+
+        design = {'effDes': .85, 'shaft_Nmech': 8000., 'duct_dPqP': .02, 'nozzle_Cfg': .98}
+        for name, value in design.items():
+            prob['Cycle.design.FlowPath.input_vars.' + name] = value
+        prob['Cycle.points.point0.balance.PR'] = 4.0
+        prob.run()
+
+        assert np.isclose(prob['Cycle.points.point0.FlowPath.comp.map.effDes'], .85)
+        assert np.isclose(prob['Cycle.points.point0.FlowPath.comp.Nmech'], 8000.)
+
+        # A point at the design conditions still recovers the design point
+        assert np.isclose(prob['Cycle.points.point0.balance.PR'], 6.0, rtol=1e-6)
+        for name in OUTPUTS:
+            assert np.isclose(prob['Cycle.points.point0.' + name], prob['Cycle.' + name], rtol=1e-6)
@@ -0,0 +1,51 @@
+"""
+Analytic partials checked against finite differences.
+"""
+from openmdao.api import Group, Problem
+
+from hyperloop.Python.pod.pod_mach import PodMach
+from hyperloop.Python.tube.tube_wall_temp import TubeWallTemp
+
+def create_problem(component):
+    root = Group()
+    prob = Problem(root)
+    prob.root.add('comp', component)
+    component.deriv_options['check_form'] = 'central'
+    return prob
+
+def assert_partials(prob, rtol=1e-4):
+    data = prob.check_partial_derivatives(out_stream=None)
+    for key, check in data['comp'].items():
+        err = check['abs error'][0]
+        mag = check['magnitude'][2]
+        assert err <= rtol*max(mag, 1.0), key
+
+class TestPartials(object):
+    def test_case1_pod_mach(self):
+
+        prob = create_problem(PodMach())
+        prob.setup(check=False)
+        prob.run()
+
+        assert_partials(prob)
+
+    def test_case2_pod_mach_without_inlet(self):
+
+        prob = create_problem(PodMach())
+        prob.setup(check=False)
+        prob['comp.M_pod'] = .5
+        prob.run()
+
+        assert_partials(prob)
+
+    def test_case3_tube_wall_temp(self):
+
+        prob = create_problem(TubeWallTemp())
+        prob.setup(check=False)
+        prob['comp.nozzle_air_W'] = 1.08
+        prob['comp.nozzle_air_Cp'] = 0.28
+        prob['comp.nozzle_air_Tt'] = 1710.
+        prob['comp.temp_boundary'] = 322.0
+        prob.run()
+
+        assert_partials(prob)
@@ -0,0 +1,54 @@
+import os
+import json
+import tempfile
+
+from openmdao.api import Group, Problem, IndepVarComp, ExecComp
+
+from hyperloop.Python.tools.profiler import Profiler
+
+def create_problem():
+    prob = Problem(Group())
+    prob.root.add('des_vars', IndepVarComp('x', 1.0), promotes=['x'])
+    prob.root.add('f', ExecComp('y = x**2'), promotes=['x', 'y'])
+    prob.root.add('g', ExecComp('z = 2.0*y'), promotes=['y', 'z'])
+    return prob
+
+class TestProfiler(object):
+    def test_case1_counts(self):
+
+        prob = create_problem()
+        prob.setup(check=False)
+        profiler = Profiler(prob.root)
+
+        prob.run()
+        prob.run()
+
+        assert profiler.stats['f']['solve_nonlinear'] == 2
+        assert profiler.stats['g']['solve_nonlinear'] == 2
+        assert profiler.stats['root']['cum_time'] >= profiler.stats['f']['cum_time']
+        assert prob['z'] == 2.0
+
+    def test_case2_trace(self):
+
+        prob = create_problem()
+        prob.setup(check=False)
+        profiler = Profiler(prob.root)
+        prob.run()
+
+        filename = os.path.join(tempfile.mkdtemp(), 'trace.json')
+        profiler.save_trace(filename)
+        with open(filename) as f:
+            events = json.load(f)['traceEvents']
+
+        assert set(event['name'] for event in events) >= set(['root', 'f', 'g'])
+        assert all(event['ph'] == 'X' for event in events)
+
+    def test_case3_detach(self):
+
+        prob = create_problem()
+        prob.setup(check=False)
+        profiler = Profiler(prob.root)
+        profiler.detach()
+        prob.run()
+
+        assert profiler.stats['f']['solve_nonlinear'] == 0
@@ -0,0 +1,55 @@
+import numpy as np
+from hyperloop.Python.sample_mission import coast, coast_adaptive
+from hyperloop.Python.tests import cases
+
+def predictor_corrector(vf, v0, F, c, m_pod, dt=.01):
+    # Fixed step integration SampleMission used before the closed form
+    i = x = 0.0
+    v = vf
+    while v > v0:
+        v_old = v
+        v_init = ((dt/m_pod)*(F - c*(v**2.0))) + v
+        v = v + ((dt/m_pod)*(F - c*(v_init**2.0)) + ((dt/m_pod)*(F - c*(v**2.0))))/2.0
+        x = x + ((v_old+v)/2.0)*dt
+        i = i + 1.0
+    return x, i*dt
+
+class TestSampleMission(object):
+    def test_case1_coast_vs_integration(self):
+
+        for F in (-500.0, 0.0, 500.0):
+            x, t = predictor_corrector(300.0, 285.0, F, 2.0, 10000.0)
+            x_cf, t_cf = coast(300.0, 285.0, F, 2.0, 10000.0)
+            x_ad, t_ad = coast_adaptive(300.0, 285.0, F, 2.0, 10000.0)
+
+            assert np.isclose(x_ad, x, rtol=1e-2)
+            assert np.isclose(t_ad, t, atol=.01)
+            if F != 0.0:
+                assert np.isclose(x_cf, x_ad, rtol=1e-10)
+                assert np.isclose(t_cf, t_ad, rtol=1e-10)
+
+    def test_case2_updates_every_run(self):
+
+        prob = cases.sample_mission_problem()
+        prob.setup(check=False)
+        for name, value in cases.SAMPLE_MISSION_VALUES.items():
+            prob[name] = value
+
+        prob['comp.M_pod'] = .8
+        prob.run()
+        prop_period = prob['comp.prop_period']
+
+        prob['comp.M_pod'] = .7
+        prob.run()
+
+        assert prob['comp.prop_period'] != prop_period
+        assert prob['comp.num_thrust'] == np.ceil(prob['comp.track_length']/prob['comp.prop_period'])
+
+    def test_case3_no_boosters(self):
+
+        prob = cases.sample_mission_problem()
+        prob.setup(check=False)
+        prob.run()
+
+        assert prob['comp.num_thrust'] == 0.0
+        assert prob['comp.prop_period'] == prob['comp.track_length']
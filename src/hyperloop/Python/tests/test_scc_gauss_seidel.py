@@ -0,0 +1,47 @@
+import numpy as np
+from openmdao.api import Group, Problem, IndepVarComp, ExecComp, NLGaussSeidel, ScipyGMRES
+
+from hyperloop.Python.tools.scc_gauss_seidel import SCCGaussSeidel
+
+def create_problem(solver):
+    prob = Problem(Group())
+    root = prob.root
+    root.add('des_vars', IndepVarComp('a', 1.0), promotes=['a'])
+    root.add('pre', ExecComp('z = 2.0*a'), promotes=['a', 'z'])
+    root.add('d1', ExecComp('y1 = z**2 + 0.5 - 0.2*y2', y2=1.0), promotes=['z', 'y1', 'y2'])
+    root.add('d2', ExecComp('y2 = y1**.5 + z', y1=1.0), promotes=['z', 'y1', 'y2'])
+    root.add('post', ExecComp('obj = y1 + y2'), promotes=['y1', 'y2', 'obj'])
+
+    root.nl_solver = solver
+    root.nl_solver.options['atol'] = 1e-10
+    root.nl_solver.options['maxiter'] = 50
+    root.ln_solver = ScipyGMRES()
+    return prob
+
+class TestSCCGaussSeidel(object):
+    def test_case1_matches_gauss_seidel(self):
+
+        prob = create_problem(NLGaussSeidel())
+        prob.setup(check=False)
+        prob.run()
+        expected = prob['obj']
+
+        prob = create_problem(SCCGaussSeidel())
+        prob.setup(check=False)
+        prob.run()
+
+        assert np.isclose(prob['obj'], expected, rtol=1e-8)
+
+    def test_case2_blocks(self):
+
+        solver = SCCGaussSeidel()
+        prob = create_problem(solver)
+        prob.setup(check=False)
+        prob.run()
+
+        pre, loop, post = solver.blocks
+
+        assert set(pre) == set(['des_vars', 'pre'])
+        assert set(loop) == set(['d1', 'd2'])
+        assert post == ['post']
+        assert solver.executions_saved >= 3*(solver.iter_count - 1)
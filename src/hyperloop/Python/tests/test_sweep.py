@@ -0,0 +1,33 @@
+import numpy as np
+from openmdao.api import Group, Problem, IndepVarComp, ExecComp
+
+from hyperloop.Python.tools.sweep import Sweep, grid
+
+def create_problem():
+    root = Group()
+    prob = Problem(root)
+    prob.root.add('des_vars', IndepVarComp((('x', 1.0), ('y', 1.0))))
+    prob.root.add('comp', ExecComp('f = x**2 + 3.0*y'))
+    prob.root.connect('des_vars.x', 'comp.x')
+    prob.root.connect('des_vars.y', 'comp.y')
+    return prob
+
+class TestSweep(object):
+    def test_case1_grid_order(self):
+
+        cases = grid(('des_vars.x', [1.0, 2.0]), ('des_vars.y', [0.0, 1.0, 2.0]))
+
+        assert len(cases) == 6
+        assert cases[1] == {'des_vars.x' : 1.0, 'des_vars.y' : 1.0}
+        assert cases[3] == {'des_vars.x' : 2.0, 'des_vars.y' : 0.0}
+
+    def test_case2_parallel_matches_serial(self):
+
+        x = np.linspace(0.0, 5.0, num = 11)
+        cases = [{'des_vars.x' : val, 'des_vars.y' : 2.0*val} for val in x]
+
+        serial = Sweep(create_problem, ['comp.f'], num_procs=1).run(cases)
+        parallel = Sweep(create_problem, ['comp.f'], num_procs=2).run(cases)
+
+        assert np.allclose(serial['comp.f'], x**2 + 6.0*x)
+        assert np.allclose(parallel['comp.f'], serial['comp.f'])
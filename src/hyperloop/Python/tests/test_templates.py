@@ -0,0 +1,75 @@
+import numpy as np
+from openmdao.api import Group, Problem, IndepVarComp, ExecComp
+from openmdao.util.options import OptionsDictionary
+
+from hyperloop.Python.tools import templates
+from hyperloop.Python.tools.sweep import Sweep
+
+def create_problem():
+    root = Group()
+    prob = Problem(root)
+    prob.root.add('des_vars', IndepVarComp((('x', 1.0),)))
+    prob.root.add('comp', ExecComp('f = 2.0*x'))
+    prob.root.connect('des_vars.x', 'comp.x')
+    return prob
+
+class TestTemplates(object):
+    def test_case1_checkout_resets(self):
+
+        templates.clear_templates()
+        template = templates.template(create_problem)
+
+        prob = template.checkout()
+        f0 = prob['comp.f']
+        prob['des_vars.x'] = 3.0
+        prob.run()
+        assert prob['comp.f'] == 6.0
+
+        prob = templates.template(create_problem).checkout()
+        assert prob['des_vars.x'] == 1.0
+        assert prob['comp.f'] == f0
+        assert template.num_checkouts == 2
+
+    def test_case2_sweeps_share_setup(self):
+
+        templates.clear_templates()
+        x = np.linspace(0.0, 5.0, num = 11)
+        cases = [{'des_vars.x' : val} for val in x]
+
+        serial = Sweep(create_problem, ['comp.f'], num_procs=1).run(cases)
+        template = templates.template(create_problem)
+        Sweep(create_problem, ['comp.f'], num_procs=1).run(cases)
+        parallel = Sweep(create_problem, ['comp.f'], num_procs=2).run(cases)
+
+        assert template is templates.template(create_problem)
+        assert template.num_checkouts == 2
+        assert np.allclose(serial['comp.f'], 2.0*x)
+        assert np.allclose(parallel['comp.f'], serial['comp.f'])
+
+    def test_case3_checkout_after_other_setup(self):
+
+        templates.clear_templates()
+        template = templates.template(create_problem)
+
+        # Another Problem built after the template was set up
+        create_problem()
+
+        prob = template.checkout()
+        prob['des_vars.x'] = 2.0
+        prob.run()
+        assert prob['comp.f'] == 4.0
+
+    def test_case4_lock_stays_with_checkout(self):
+
+        templates.clear_templates()
+        template = templates.template(create_problem)
+        other = create_problem()
+
+        prob = template.checkout()
+        assert prob.root.deriv_options.locked
+        assert prob.root.comp.deriv_options.locked
+        assert not OptionsDictionary.locked
+        assert not other.root.deriv_options.locked
+
+        prob.run()
+        assert prob['comp.f'] == 2.0
@@ -0,0 +1,69 @@
+import numpy as np
+
+from hyperloop.Python.pod.cycle.flow_path_table import create_problem
+from hyperloop.Python.tools.thermo_cache import ThermoCache, THERMO_CACHE
+
+def run_flow_path(PRdes, prob=None):
+    if prob is None:
+        prob = create_problem()
+        prob.setup(check=False)
+    prob['des_vars.PRdes'] = PRdes
+    prob.run()
+    return prob
+
+class TestThermoCache(object):
+    def test_case1_quantized_hits(self):
+
+        cache = ThermoCache(digits=8)
+        state = np.array([1.0, 2.0, 3.0])
+        cache.put(cache.key('air', [.1879, 605.06, np.array([1.0, 2.0])]), state)
+
+        # Round off below the quantization still hits
+        hit = cache.get(cache.key('air', [.1879*(1.0 + 1e-12), 605.06, np.array([1.0, 2.0])]))
+        assert np.all(hit == state)
+        hit[0] = 10.0
+        assert cache.get(cache.key('air', [.1879, 605.06, np.array([1.0, 2.0])]))[0] == 1.0
+
+        assert cache.get(cache.key('air', [.1880, 605.06, np.array([1.0, 2.0])])) is None
+        assert cache.get(cache.key('fuel', [.1879, 605.06, np.array([1.0, 2.0])])) is None
+
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['size']) == (2, 2, 1)
+        assert stats['hit_rate'] == .5
+
+    def test_case2_eviction(self):
+
+        cache = ThermoCache(max_size=2)
+        for P in (1.0, 2.0, 3.0):
+            cache.put(cache.key('air', [P]), np.array([P]))
+            # Keeps the first state recently used
+            cache.get(cache.key('air', [1.0]))
+
+        assert cache.get(cache.key('air', [2.0])) is None
+        assert cache.get(cache.key('air', [3.0]))[0] == 3.0
+        assert cache.get(cache.key('air', [1.0]))[0] == 1.0
+
+        cache.clear()
+        assert cache.stats() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0}
+
+    def test_case3_memoized_flow_start(self):
+
+        THERMO_CACHE.clear()
+        prob = run_flow_path(6.0)
+        misses = THERMO_CACHE.misses
+
+        # Same flow start, so the second run only hits
+        hits = THERMO_CACHE.hits
+        run_flow_path(12.0, prob)
+        assert THERMO_CACHE.misses == misses
+        assert THERMO_CACHE.hits > hits
+
+        THERMO_CACHE.clear()
+        cold = run_flow_path(12.0)
+
+        fl_start, cold_fl_start = prob.root.FlowPath.fl_start, cold.root.FlowPath.fl_start
+        assert np.allclose(fl_start.unknowns.vec, cold_fl_start.unknowns.vec, rtol=1e-10)
+        assert np.allclose(fl_start.params.vec, cold_fl_start.params.vec, rtol=1e-10)
+        assert np.allclose(fl_start.resids.vec, cold_fl_start.resids.vec, atol=1e-10)
+        for name in ('comp.power', 'nozzle.Fg', 'nozzle.Fl_O:stat:W'):
+            assert np.isclose(prob['FlowPath.' + name], cold['FlowPath.' + name], rtol=1e-8)
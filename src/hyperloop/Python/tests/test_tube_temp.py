@@ -1,44 +1,18 @@
 from __future__ import print_function
 import numpy as np
 
-from openmdao.api import Problem, Group
-from openmdao.components.indep_var_comp import IndepVarComp
-
-from hyperloop.Python.tube.tube_wall_temp import TubeTemp
-
-def create_problem(tempGroup):
-    root = Group()
-    prob = Problem(root)
-    prob.root.add('tt', tempGroup)
-    return prob
+from hyperloop.Python.tests import cases
 
 class TestTubeWall(object):
     def test_tube_temp(self):
-        prob = create_problem(TubeTemp())
-
-        params = (('P', 0.304434211, {'units': 'psi'}),
-                  ('T', 1710., {'units': 'degR'}))
-        prob.root.add('des_vars', IndepVarComp(params), promotes=['*'])
-        #prob.root.connect('P', 'tt.nozzle_air.P')
-        prob.root.connect('T', 'tt.nozzle_air_Tt')
+        prob = cases.tube_temp_problem()
 
         prob.setup(check=True)
 
         #tm.nozzle_air.setTotalTP(1710, 0.304434211)
 
-        prob['tt.nozzle_air_W'] = 1.08
-        prob['tt.tube_thickness'] = .05 #, units = ''
-        prob['tt.tm.nozzle_air_Cp'] = 0.28 #fudged to hit original calcs (no more bearings)
-
-        prob[
-            'tt.tube_area'] = 3.9057  #, units = 'm', iotype='in', desc='Tube out diameter') #7.3ft
-        prob[
-            'tt.length_tube'] = 482803.  #, units = 'm', iotype='in', desc='Length of entire Hyperloop') #300 miles, 1584000ft
-        prob[
-            'tt.num_pods'] = 34.  #, units = 'K', iotype='in', desc='Number of Pods in the Tube at a given time') #
-        #prob['tt.temp_boundary'] = 322.361#, units = 'K', iotype='in', desc='Average Temperature of the tube') #
-        prob[
-            'tt.tm.temp_outside_ambient'] = 305.6  #, units = 'K', iotype='in', desc='Average Temperature of the outside air') #
+        for name, value in cases.TUBE_TEMP_VALUES.items():
+            prob[name] = value
 
         prob.run()
 
@@ -2,7 +2,69 @@ from __future__ import print_function
 
 import numpy as np
 from openmdao.api import IndepVarComp, Component, Group, Problem, ExecComp
-import matplotlib.pylab as plt
+
+def ticket_cost_kernel(p):
+	'''
+	Vectorized TicketCost. Takes a dict of params by name, as scalars or
+	arrays of design points, and returns a dict of outputs.
+	'''
+	land_cost = p['land_cost']
+	water_cost = p['water_cost']
+	pod_cost= p['pod_cost']
+	capital_cost = p['capital_cost']
+	energy_cost = p['energy_cost']
+	ib = p['ib']
+	bm = p['bm']
+	operating_time = p['operating_time']
+	JtokWh = p['JtokWh']
+	m_pod = p['m_pod']
+	n_passengers = p['n_passengers']
+	pod_period = p['pod_period']
+	avg_speed = p['avg_speed']
+	track_length = p['track_length']
+	land_length = p['land_length']
+	water_length = p['water_length']
+	pod_power = -1.0*p['pod_power']
+	prop_power = p['prop_power']
+	vac_power = p['vac_power']
+	steady_vac_power = -1.0*p['steady_vac_power']
+	vf = p['vf']
+	g = p['g']
+	Cd = p['Cd']
+	S = p['S']
+	p_tunnel = p['p_tunnel']
+	T_tunnel = p['T_tunnel']
+	R = p['R']
+	eta = p['eta']
+	D_mag = p['D_mag']
+	thrust_time = p['thrust_time']
+	prop_period = p['prop_period']
+	num_thrust = p['num_thrust']
+
+	length_cost = ((water_length/track_length)*water_cost) + ((land_length/track_length)*land_cost)
+	pod_frequency = 1.0/pod_period
+	num_pods = np.ceil((track_length/avg_speed)*pod_frequency)
+	flights_per_pod = (operating_time*pod_frequency)/num_pods
+	energy_per_flight = pod_power*(track_length/avg_speed)*.9
+	pod_energy = energy_per_flight*flights_per_pod*num_pods*JtokWh
+	vac_energy = steady_vac_power*operating_time*JtokWh
+
+	rho = p_tunnel/(R*T_tunnel)
+	start_distance = (vf**2)/(2*g)
+	start_energy = ((m_pod*g+D_mag)*start_distance + (.5*Cd*rho*g*S*(start_distance**2)))/eta
+
+	prop_energy = (num_thrust*thrust_time*prop_power + start_energy)*flights_per_pod*num_pods*JtokWh
+	tube_energy = prop_energy + vac_energy
+
+	cost_ticket = (length_cost*(track_length/1000.0) + pod_cost*num_pods + capital_cost*(1.0+ib) + \
+		energy_cost*(tube_energy + pod_energy)*365.0)/(n_passengers*pod_frequency*bm*365.0*24.0*3600.0)
+
+	return {'num_pods' : num_pods,
+	        'prop_energy_cost' : prop_energy*energy_cost*365,
+	        'tube_energy_cost' : tube_energy*energy_cost*365,
+	        'total_energy_cost' : (pod_energy+tube_energy)*energy_cost*365,
+	        'ticket_cost' : cost_ticket}
+
 
 class TicketCost(Component):
 	'''
@@ -120,62 +182,12 @@ class TicketCost(Component):
 		self.add_output('tube_energy_cost', val = 0.0, desc = 'Cost of tube energy', units = 'USD')
 		self.add_output('total_energy_cost', val = 0.0, desc = 'Cost of energy consumpition per year', units = 'USD')
 
+	kernel = staticmethod(ticket_cost_kernel)
+
 	def solve_nonlinear(self, p, u,r):
 
-		land_cost = p['land_cost']
-		water_cost = p['water_cost']
-		pod_cost= p['pod_cost']
-		capital_cost = p['capital_cost']
-		energy_cost = p['energy_cost']
-		ib = p['ib']
-		bm = p['bm']
-		operating_time = p['operating_time']
-		JtokWh = p['JtokWh']
-		m_pod = p['m_pod']
-		n_passengers = p['n_passengers']
-		pod_period = p['pod_period']
-		avg_speed = p['avg_speed']
-		track_length = p['track_length']
-		land_length = p['land_length']
-		water_length = p['water_length']
-		pod_power = -1.0*p['pod_power']
-		prop_power = p['prop_power']
-		vac_power = p['vac_power']
-		steady_vac_power = -1.0*p['steady_vac_power']
-		vf = p['vf']
-		g = p['g']
-		Cd = p['Cd']
-		S = p['S']
-		p_tunnel = p['p_tunnel']
-		T_tunnel = p['T_tunnel']
-		R = p['R']
-		eta = p['eta']
-		D_mag = p['D_mag']
-		thrust_time = p['thrust_time']
-		prop_period = p['prop_period']
-		num_thrust = p['num_thrust']
-
-		length_cost = ((water_length/track_length)*water_cost) + ((land_length/track_length)*land_cost)
-		pod_frequency = 1.0/pod_period
-		num_pods = np.ceil((track_length/avg_speed)*pod_frequency)
-		flights_per_pod = (operating_time*pod_frequency)/num_pods
-		energy_per_flight = pod_power*(track_length/avg_speed)*.9
-		pod_energy = energy_per_flight*flights_per_pod*num_pods*JtokWh
-		vac_energy = steady_vac_power*operating_time*JtokWh
-
-		rho = p_tunnel/(R*T_tunnel)
-		start_distance = (vf**2)/(2*g)
-		start_energy = ((m_pod*g+D_mag)*start_distance + (.5*Cd*rho*g*S*(start_distance**2)))/eta
-
-		prop_energy = (num_thrust*thrust_time*prop_power + start_energy)*flights_per_pod*num_pods*JtokWh
-		tube_energy = prop_energy + vac_energy
-
-		u['num_pods'] = num_pods
-		u['prop_energy_cost'] = prop_energy*energy_cost*365
-		u['tube_energy_cost'] = tube_energy*energy_cost*365
-		u['total_energy_cost'] = (pod_energy+tube_energy)*energy_cost*365
-		u['ticket_cost'] = cost_ticket = (length_cost*(track_length/1000.0) + pod_cost*num_pods + capital_cost*(1.0+ib) + \
-			energy_cost*(tube_energy + pod_energy)*365.0)/(n_passengers*pod_frequency*bm*365.0*24.0*3600.0)
+		for name, val in ticket_cost_kernel(p).items():
+			u[name] = val
 
 if __name__ == '__main__':
 
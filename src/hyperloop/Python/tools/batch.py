@@ -0,0 +1,62 @@
+"""
+Batch evaluation of closed-form components.
+
+Components whose outputs are explicit functions of their params (PodMach,
+TubeAndPylon, TicketCost, ...) expose a pure NumPy `kernel` that takes a
+dict of params and returns a dict of outputs. Each param may be a scalar or
+an array of design points, so a screening study over 10^5-10^6 points is a
+single vectorized call instead of one Problem run per point.
+"""
+from __future__ import print_function
+
+import numpy as np
+
+
+def batch_evaluate(component, **params):
+    """
+    Evaluates `component.kernel` over arrays of design points.
+
+    Params
+    ------
+    component : Component
+        Instance of a component with a `kernel`. Params not given fall back
+        to the defaults declared in its `add_param` calls.
+    params : dict
+        {param name : value}. Values are broadcast against each other.
+
+    Returns
+    -------
+    unknowns : dict
+        {output name : array} with one entry per design point.
+    """
+    if not hasattr(component, 'kernel'):
+        raise TypeError("%s does not provide a batch kernel" % type(component).__name__)
+
+    p = {}
+    for name, meta in component._init_params_dict.items():
+        p[name] = meta['val']
+    for name, val in params.items():
+        if name not in p:
+            raise KeyError("%s has no param '%s'" % (type(component).__name__, name))
+        p[name] = np.asarray(val)
+
+    # np.broadcast takes at most 32 arguments, so fold one param at a time
+    shape = ()
+    for val in p.values():
+        shape = np.broadcast(np.broadcast_to(0.0, shape), val).shape
+
+    unknowns = {}
+    for name, val in component.kernel(p).items():
+        unknowns[name] = np.broadcast_to(val, shape).copy()
+    return unknowns
+
+if __name__ == '__main__':
+    import time
+    from hyperloop.Python.pod.pod_mach import PodMach
+
+    M_pod = np.linspace(.5, .9, 1000)
+    p_tube = np.linspace(100., 2000., 1000)[:, None]
+
+    t0 = time.time()
+    results = batch_evaluate(PodMach(), M_pod=M_pod, p_tube=p_tube)
+    print('%d design points in %f s' % (results['A_tube'].size, time.time() - t0))
@@ -0,0 +1,267 @@
+"""
+Benchmark suite for the model groups.
+
+Each case builds one of the model groups with the inputs used by its test,
+shared through `hyperloop/Python/tests/cases.py` (or its module demo where
+there is no test), then times `setup` and `run` separately, counts
+nonlinear solver iterations and records the peak memory allocated. Results are written to a
+JSON baseline and later runs are compared against it, flagging any metric
+that grew by more than the regression threshold.
+
+Usage::
+
+    python -m hyperloop.Python.tools.benchmark --save
+    python -m hyperloop.Python.tools.benchmark --threshold .25 Cycle TubeTemp
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import platform
+import sys
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from hyperloop.Python.tests import cases
+from hyperloop.Python.tools.iteration_counter import IterationCounter
+from hyperloop.Python.tools.sweep import evaluate
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+METRICS = ('setup_time', 'run_time', 'iterations', 'peak_memory')
+
+
+def tube_and_pod_case():
+    from hyperloop.Python import tube_and_pod
+    return tube_and_pod.create_problem(), {}, [{}]
+
+
+def tube_and_pod_sweep_case():
+    from hyperloop.Python import tube_and_pod
+    M_pod = np.linspace(.5, .9, num = 10)
+    return tube_and_pod.create_problem(), {}, [{'des_vars.pod_mach' : M} for M in M_pod]
+
+
+def pod_group_case():
+    from hyperloop.Python.pod import pod_group
+    return pod_group.create_problem(), {}, [{}]
+
+
+def tube_group_case():
+    return cases.tube_group_problem(), cases.TUBE_GROUP_VALUES, [{}]
+
+
+def cycle_case(fidelity='pycycle'):
+    return cases.cycle_problem(fidelity), cases.CYCLE_VALUES, [{}]
+
+
+def cycle_lite_case():
+    # Cycle with the perfect-gas LiteFlowPath, accuracy is reported by
+    # lite_flow_path.accuracy
+    return cycle_case(fidelity='lite')
+
+
+def motor_group_case():
+    return cases.motor_problem(), cases.MOTOR_VALUES, [{}]
+
+
+def drivetrain_case():
+    return cases.drivetrain_problem(), cases.DRIVETRAIN_VALUES, [{}]
+
+
+def lev_group_case():
+    return cases.lev_group_problem(), cases.LEV_GROUP_VALUES, [{}]
+
+
+def tube_temp_case():
+    return cases.tube_temp_problem(), cases.TUBE_TEMP_VALUES, [{}]
+
+
+def tube_temp_fd_case():
+    # TubeTemp with the Newton Jacobian of TubeWallTemp taken by finite
+    # difference instead of its linearize, for comparison with TubeTemp
+    prob, values, points = tube_temp_case()
+    prob.root.tt.tm.deriv_options['type'] = 'fd'
+    return prob, values, points
+
+
+def sample_mission_case():
+    M_pod = np.linspace(.6, .9, num = 10)
+    return cases.sample_mission_problem(), cases.SAMPLE_MISSION_VALUES, \
+        [{'comp.M_pod' : M} for M in M_pod]
+
+
+# Each case returns (Problem before setup, values set after setup, design
+# points run one after another on the same Problem).
+CASES = OrderedDict([('TubeAndPod', tube_and_pod_case),
+                     ('TubeAndPodSweep', tube_and_pod_sweep_case),
+                     ('PodGroup', pod_group_case),
+                     ('TubeGroup', tube_group_case),
+                     ('Cycle', cycle_case),
+                     ('CycleLite', cycle_lite_case),
+                     ('MotorGroup', motor_group_case),
+                     ('Drivetrain', drivetrain_case),
+                     ('LevGroup', lev_group_case),
+                     ('TubeTemp', tube_temp_case),
+                     ('TubeTempFD', tube_temp_fd_case),
+                     ('SampleMission', sample_mission_case)])
+
+
+def run_case(case):
+    """
+    Sets up and runs one case, returning (setup time, run time, iterations).
+    """
+    prob, values, points = case()
+
+    t0 = time.time()
+    prob.setup(check=False)
+    setup_time = time.time() - t0
+
+    for name, value in values.items():
+        prob[name] = value
+    counter = IterationCounter(prob.root)
+
+    t0 = time.time()
+    for point in points:
+        evaluate(prob, point, [])
+    run_time = time.time() - t0
+
+    return setup_time, run_time, counter.total()
+
+
+def measure(case, repeat=3):
+    """
+    Benchmarks one case.
+
+    Params
+    ------
+    case : callable
+        Entry of `CASES`.
+    repeat : int
+        Number of timed repetitions. The fastest setup and run are kept.
+
+    Returns
+    -------
+    result : dict
+        setup_time and run_time (s), iterations (total nonlinear solver
+        iterations over all groups) and peak_memory (bytes allocated during
+        setup and run, None where tracemalloc is unavailable).
+    """
+    times = [run_case(case) for i in range(repeat)]
+
+    result = {'setup_time' : min(t[0] for t in times),
+              'run_time' : min(t[1] for t in times),
+              'iterations' : times[-1][2],
+              'peak_memory' : None}
+
+    # Memory is traced on a separate pass since tracing slows the model down
+    if tracemalloc is not None:
+        tracemalloc.start()
+        run_case(case)
+        result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return result
+
+
+def run(names=None, repeat=3):
+    """
+    Benchmarks the named cases (all of them by default).
+    """
+    if not names:
+        names = list(CASES.keys())
+
+    results = OrderedDict()
+    for name in names:
+        results[name] = measure(CASES[name], repeat)
+    return results
+
+
+def compare(results, baseline, threshold=.25):
+    """
+    Lists the metrics that regressed relative to `baseline`.
+
+    Params
+    ------
+    results : dict
+        {case : {metric : value}} from `run`.
+    baseline : dict
+        Same layout, usually the 'cases' entry of a saved baseline.
+    threshold : float
+        Allowed relative growth of wall time and memory. Iteration counts are
+        deterministic, so any increase is flagged.
+
+    Returns
+    -------
+    regressions : list
+        (case, metric, baseline value, new value) tuples.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric in METRICS:
+            old = baseline[name].get(metric)
+            new = result.get(metric)
+            if old is None or new is None:
+                continue
+            allowed = old if metric == 'iterations' else old*(1.0 + threshold)
+            if new > allowed:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def save_baseline(results, filename):
+    data = {'python' : platform.python_version(),
+            'machine' : platform.platform(),
+            'cases' : results}
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(filename):
+    with open(filename) as f:
+        return json.load(f)['cases']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the hyperloop model groups.')
+    parser.add_argument('cases', nargs='*', help='cases to run (default: all of %s)' % ', '.join(CASES))
+    parser.add_argument('--baseline', default='benchmark_baseline.json', help='baseline JSON file')
+    parser.add_argument('--save', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=.25, help='allowed relative slowdown')
+    parser.add_argument('--repeat', type=int, default=3, help='timed repetitions per case')
+    args = parser.parse_args(argv)
+
+    results = run(args.cases, args.repeat)
+
+    print('%-16s %12s %12s %12s %14s' % ('case', 'setup (s)', 'run (s)', 'iterations', 'peak mem (MB)'))
+    for name, result in results.items():
+        memory = result['peak_memory']
+        print('%-16s %12.4f %12.4f %12d %14s' % (name, result['setup_time'], result['run_time'],
+                                                 result['iterations'],
+                                                 '-' if memory is None else '%.1f' % (memory/1.0e6)))
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print('baseline written to %s' % args.baseline)
+        return 0
+
+    try:
+        baseline = load_baseline(args.baseline)
+    except IOError:
+        print('no baseline at %s, run with --save to create one' % args.baseline)
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, metric, old, new in regressions:
+        print('REGRESSION %s %s: %s -> %s' % (name, metric, old, new))
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Warm-start continuation for sequential design sweeps.
+
+Consecutive points of a trade study differ by a small step in one or two
+design variables, so the converged unknowns of one point are a much better
+starting guess for the next than whatever state the solvers were left in.
+`Continuation` orders the sweep along a path, seeds every solve with the
+previous converged unknowns (extrapolated to first order once two points
+are known) and counts how many nonlinear iterations that saves over a cold
+start from the post-setup state.
+"""
+from __future__ import print_function
+
+import numpy as np
+
+from hyperloop.Python.tools.sweep import setup_problem, evaluate
+from hyperloop.Python.tools.iteration_counter import IterationCounter
+
+
+def design_matrix(cases):
+    """
+    Returns the design vectors of `cases` as rows, each variable scaled to
+    [0, 1] over the sweep so that no single variable dominates distances.
+    """
+    names = sorted(cases[0].keys())
+    X = np.array([np.concatenate([np.atleast_1d(np.asarray(case[name], dtype=float)).ravel()
+                                  for name in names]) for case in cases])
+    span = X.max(axis=0) - X.min(axis=0)
+    span[span == 0.0] = 1.0
+    return (X - X.min(axis=0))/span
+
+
+def path_order(cases):
+    """
+    Orders `cases` into a path through design space.
+
+    Starts at the first case and repeatedly steps to the nearest point not
+    yet visited. For a single swept variable this is simply the sorted
+    order; for grids it walks neighbouring rows instead of jumping back to
+    the start of every row.
+
+    Returns
+    -------
+    order : list
+        Case indices in the order they should be run.
+    """
+    X = design_matrix(cases)
+    remaining = list(range(1, len(cases)))
+    order = [0]
+    while remaining:
+        d = np.sum((X[remaining] - X[order[-1]])**2, axis=1)
+        order.append(remaining.pop(int(np.argmin(d))))
+    return order
+
+
+class Continuation(object):
+    """
+    Runs a sweep serially along a path, warm starting every point.
+
+    Params
+    ------
+    problem_factory : callable
+        Function returning a Problem that has not been set up.
+    outputs : list
+        Names of the variables to collect from each run.
+    extrapolate : bool
+        Seed with a first order extrapolation of the last two converged
+        points rather than the last point alone.
+    compare_cold : bool
+        After the warm sweep, run every point again from the post-setup
+        state to measure the iterations a cold start needs.
+    max_step_ratio : float
+        Upper bound on the ratio of the next step to the previous step used
+        when extrapolating.
+
+    Notes
+    -----
+    Extrapolated unknowns that would change sign relative to the last
+    converged point are reset to that point, which keeps pressures,
+    temperatures and mass flows physical near the ends of a sweep.
+    """
+
+    def __init__(self, problem_factory, outputs, extrapolate=True, compare_cold=False,
+                 max_step_ratio=2.0):
+        self.problem_factory = problem_factory
+        self.outputs = list(outputs)
+        self.extrapolate = extrapolate
+        self.compare_cold = compare_cold
+        self.max_step_ratio = max_step_ratio
+
+        self.report = {}
+
+    def run(self, cases):
+        """
+        Runs every case and returns a dict mapping each output name to an
+        array with one row per case, in the order the cases were given.
+        Iteration counts are stored in `self.report`.
+        """
+        cases = list(cases)
+        order = path_order(cases)
+        X = design_matrix(cases)
+
+        prob = setup_problem(self.problem_factory)
+        unknowns = prob.root.unknowns
+        cold_state = unknowns.vec.copy()
+        counter = IterationCounter(prob.root)
+
+        rows = [None]*len(cases)
+        warm_iterations = np.zeros(len(cases), dtype=int)
+        history = []
+
+        for k, i in enumerate(order):
+            if history:
+                unknowns.vec[:] = self.seed(history, X[order[k-1]], X[i],
+                                            X[order[k-2]] if k > 1 else None)
+
+            counter.reset()
+            rows[i] = evaluate(prob, cases[i], self.outputs)
+            warm_iterations[i] = counter.total()
+
+            history = [unknowns.vec.copy()] + history[:1]
+
+        self.report = {'order' : order,
+                       'warm_iterations' : warm_iterations,
+                       'total_warm_iterations' : int(warm_iterations.sum())}
+
+        if self.compare_cold:
+            cold_iterations = np.zeros(len(cases), dtype=int)
+            for i in order:
+                unknowns.vec[:] = cold_state
+                counter.reset()
+                evaluate(prob, cases[i], self.outputs)
+                cold_iterations[i] = counter.total()
+
+            self.report['cold_iterations'] = cold_iterations
+            self.report['total_cold_iterations'] = int(cold_iterations.sum())
+            self.report['iterations_saved'] = int(cold_iterations.sum() - warm_iterations.sum())
+
+        results = {}
+        for j, name in enumerate(self.outputs):
+            results[name] = np.array([row[j] for row in rows])
+        return results
+
+    def seed(self, history, x_last, x_next, x_prev=None):
+        """
+        Starting unknowns for the point at `x_next` given the converged
+        unknowns in `history` (most recent first).
+        """
+        u_last = history[0]
+        if not self.extrapolate or len(history) < 2 or x_prev is None:
+            return u_last
+
+        step_prev = np.linalg.norm(x_last - x_prev)
+        if step_prev == 0.0:
+            return u_last
+
+        ratio = min(np.linalg.norm(x_next - x_last)/step_prev, self.max_step_ratio)
+        u_seed = u_last + ratio*(u_last - history[1])
+
+        flipped = np.sign(u_seed) != np.sign(u_last)
+        u_seed[flipped] = u_last[flipped]
+        return u_seed
+
+if __name__ == '__main__':
+    from hyperloop.Python import tube_and_pod
+
+    M_pod = np.linspace(.5, .9, num = 25)
+    outputs = ['TubeAndPod.pod.A_tube', 'TubeAndPod.cost.total_energy_cost']
+
+    sweep = Continuation(tube_and_pod.create_problem, outputs, compare_cold=True)
+    results = sweep.run([{'des_vars.pod_mach' : M} for M in M_pod])
+
+    print('warm start iterations              %d' % sweep.report['total_warm_iterations'])
+    print('cold start iterations              %d' % sweep.report['total_cold_iterations'])
+    print('iterations saved                   %d' % sweep.report['iterations_saved'])
@@ -0,0 +1,172 @@
+"""
+Persistent on-disk cache of model evaluations.
+
+Each entry is keyed on a hash of the design point, the problem factory that
+built the model and a fingerprint of the `hyperloop.Python` source tree.
+Editing any model module changes the fingerprint, and every entry written
+under the old fingerprint is dropped the next time the cache is opened.
+Entries are evicted least recently used first once the cache grows past
+`max_entries` or `max_bytes`.
+"""
+from __future__ import print_function
+
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import time
+
+import numpy as np
+
+
+def model_fingerprint(root=None):
+    """
+    Hash of every module under `hyperloop.Python`, tests excluded.
+    """
+    if root is None:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    sha = hashlib.sha1()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in ('tests', 'archive', '__pycache__'))
+        for filename in sorted(filenames):
+            if not filename.endswith('.py'):
+                continue
+            path = os.path.join(dirpath, filename)
+            sha.update(os.path.relpath(path, root).replace(os.sep, '/').encode('utf-8'))
+            with open(path, 'rb') as f:
+                sha.update(f.read())
+    return sha.hexdigest()
+
+
+def factory_id(problem_factory):
+    """
+    Identifies a problem factory by name and by the source of the module it
+    is defined in, so edits to a trade script's factory also miss the cache.
+    functools.partial factories also include their bound arguments.
+    """
+    func = getattr(problem_factory, 'func', problem_factory)
+    name = '%s.%s' % (func.__module__, func.__name__)
+    if func is not problem_factory:
+        name += repr((problem_factory.args, sorted((problem_factory.keywords or {}).items())))
+    try:
+        with open(inspect.getsourcefile(func), 'rb') as f:
+            source = f.read()
+    except (TypeError, IOError, OSError):
+        source = b''
+    return name + ':' + hashlib.sha1(source).hexdigest()
+
+
+def case_key(case, context=''):
+    """
+    Hash of a design point. Values are hashed as float64 bytes so 850 and
+    850.0 map to the same entry.
+    """
+    sha = hashlib.sha1(context.encode('utf-8'))
+    for name in sorted(case.keys()):
+        sha.update(name.encode('utf-8'))
+        sha.update(np.ascontiguousarray(case[name], dtype=np.float64).tobytes())
+    return sha.hexdigest()
+
+
+class EvalCache(object):
+    """
+    sqlite backed store of {output name : value} dicts.
+
+    Params
+    ------
+    path : str
+        Cache file. Created if it does not exist.
+    max_entries : int
+        Largest number of design points kept.
+    max_bytes : int
+        Largest total size of the stored outputs. None for no limit.
+    fingerprint : str
+        Model fingerprint. Defaults to `model_fingerprint()`.
+
+    Notes
+    -----
+    Only the process that owns a `Sweep` reads and writes the cache; workers
+    never touch it.
+    """
+
+    def __init__(self, path, max_entries=10000, max_bytes=None, fingerprint=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint or model_fingerprint()
+
+        self.hits = 0
+        self.misses = 0
+
+        self.db = sqlite3.connect(path)
+        self.db.execute('CREATE TABLE IF NOT EXISTS entries ('
+                        'key TEXT PRIMARY KEY, fingerprint TEXT, '
+                        'last_access REAL, size INTEGER, data BLOB)')
+        self.db.execute('DELETE FROM entries WHERE fingerprint != ?', (self.fingerprint,))
+        self.db.commit()
+
+    def key(self, case, context=''):
+        return case_key(case, self.fingerprint + context)
+
+    def get(self, key, outputs):
+        """
+        Returns the cached values of `outputs` in order, or None if the
+        point is not cached or was cached without one of the outputs.
+        """
+        row = self.db.execute('SELECT data FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            values = pickle.loads(bytes(row[0]))
+            if all(name in values for name in outputs):
+                self.db.execute('UPDATE entries SET last_access = ? WHERE key = ?',
+                                (time.time(), key))
+                self.hits += 1
+                return [values[name] for name in outputs]
+        self.misses += 1
+        return None
+
+    def put(self, key, values):
+        """
+        Stores a dict of output values, merging with any outputs already
+        cached for the same point.
+        """
+        row = self.db.execute('SELECT data FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            merged = pickle.loads(bytes(row[0]))
+            merged.update(values)
+            values = merged
+
+        data = pickle.dumps(values, protocol=2)
+        self.db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)',
+                        (key, self.fingerprint, time.time(), len(data), sqlite3.Binary(data)))
+
+    def evict(self):
+        """
+        Drops least recently used entries until both limits are met.
+        """
+        count, size = self.db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        rows = self.db.execute('SELECT key, size FROM entries ORDER BY last_access ASC').fetchall()
+        stale = []
+        for key, entry_size in rows:
+            if count <= self.max_entries and (self.max_bytes is None or size <= self.max_bytes):
+                break
+            stale.append((key,))
+            count -= 1
+            size -= entry_size
+        self.db.executemany('DELETE FROM entries WHERE key = ?', stale)
+
+    def commit(self):
+        self.evict()
+        self.db.commit()
+
+    def clear(self):
+        self.db.execute('DELETE FROM entries')
+        self.db.commit()
+
+    def close(self):
+        self.commit()
+        self.db.close()
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
@@ -0,0 +1,52 @@
+"""
+Counts nonlinear solver iterations across every group in a model.
+
+Solvers such as NLGaussSeidel and Newton reset `iter_count` each time they
+are called, so the number left on a nested solver after a run only reflects
+its last call. `IterationCounter` wraps each group's nonlinear solver and
+accumulates `iter_count` after every call instead.
+"""
+from __future__ import print_function
+
+
+class IterationCounter(object):
+    """
+    Accumulates nonlinear iterations per group pathname.
+
+    Params
+    ------
+    root : Group
+        Root of a Problem that has been set up.
+    """
+
+    def __init__(self, root):
+        self.counts = {}
+        self.calls = {}
+
+        for group in root.subgroups(recurse=True, include_self=True):
+            name = group.pathname or 'root'
+            self._wrap(name, group.nl_solver)
+
+    def _wrap(self, name, solver):
+        solve = solver.solve
+
+        def counted_solve(*args, **kwargs):
+            result = solve(*args, **kwargs)
+            self.counts[name] = self.counts.get(name, 0) + getattr(solver, 'iter_count', 0)
+            self.calls[name] = self.calls.get(name, 0) + 1
+            return result
+
+        solver.solve = counted_solve
+
+    def reset(self):
+        """
+        Zeros all counts.
+        """
+        self.counts = {}
+        self.calls = {}
+
+    def total(self):
+        """
+        Returns the number of nonlinear iterations summed over all groups.
+        """
+        return sum(self.counts.values())
@@ -0,0 +1,167 @@
+"""
+Opt-in per-system timing for OpenMDAO models.
+
+`Profiler` wraps `solve_nonlinear` and `apply_nonlinear` of every Component
+and Group below a root, and records how often each pathname was executed
+and how long it took. Cumulative time includes the systems called from
+inside a pathname; self time excludes them, so for a Group it is the cost
+of its solver and data transfers. Every call is also kept as an event for
+a Chrome trace (chrome://tracing or https://ui.perfetto.dev).
+
+Nothing is wrapped until a Profiler is created, so models pay no overhead
+unless profiling is asked for.
+"""
+from __future__ import print_function
+
+import json
+import time
+from collections import OrderedDict
+
+from hyperloop.Python.tools.sweep import setup_problem, evaluate
+
+METHODS = ('solve_nonlinear', 'apply_nonlinear')
+
+
+class Profiler(object):
+    """
+    Records call counts and timing per system pathname.
+
+    Params
+    ------
+    root : Group
+        Root of a Problem that has been set up.
+    events : bool
+        Keep a timeline of every call for `save_trace`. Turn off for long
+        sweeps where only the totals are needed.
+
+    Notes
+    -----
+    `stats` maps each pathname to its call counts per method, 'cum_time'
+    and 'self_time' in seconds. A system re-entered while it is already
+    running (e.g. a Component's default `apply_nonlinear` calling its own
+    `solve_nonlinear`) is counted as a call but its time is not added to
+    the cumulative time twice.
+    """
+
+    def __init__(self, root, events=True):
+        self.root = root
+        self.keep_events = events
+        self.stats = OrderedDict()
+        self.events = []
+
+        self._stack = []
+        self._t0 = time.time()
+        self._wrapped = []
+
+        for system in root.subsystems(recurse=True, include_self=True):
+            name = system.pathname or 'root'
+            self.stats[name] = dict([(method, 0) for method in METHODS],
+                                    cum_time=0.0, self_time=0.0)
+            for method in METHODS:
+                self._wrap(system, name, method)
+
+    def _wrap(self, system, name, method):
+        func = getattr(system, method)
+        stats = self.stats[name]
+        stack = self._stack
+
+        def timed(*args, **kwargs):
+            stats[method] += 1
+            frame = [name, 0.0]
+            stack.append(frame)
+            t0 = time.time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.time() - t0
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+                stats['self_time'] += elapsed - frame[1]
+                if all(f[0] != name for f in stack):
+                    stats['cum_time'] += elapsed
+                if self.keep_events:
+                    self.events.append((name, method, t0 - self._t0, elapsed))
+
+        setattr(system, method, timed)
+        self._wrapped.append((system, method))
+
+    def detach(self):
+        """
+        Restores the original methods.
+        """
+        for system, method in self._wrapped:
+            delattr(system, method)
+        self._wrapped = []
+
+    def reset(self):
+        """
+        Zeros all counts and drops recorded events.
+        """
+        for stats in self.stats.values():
+            for key in stats:
+                stats[key] = 0.0 if key.endswith('time') else 0
+        self.events = []
+        self._t0 = time.time()
+
+    def report(self, sort='self_time', limit=None, out=None):
+        """
+        Prints one line per pathname, sorted by `sort` (a method name,
+        'cum_time' or 'self_time'), largest first.
+        """
+        rows = sorted(self.stats.items(), key=lambda item: item[1][sort], reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+
+        lines = ['%-50s %8s %8s %12s %12s' % ('pathname', 'solve', 'apply', 'cum (s)', 'self (s)')]
+        for name, stats in rows:
+            if not (stats['solve_nonlinear'] or stats['apply_nonlinear']):
+                continue
+            lines.append('%-50s %8d %8d %12.4f %12.4f' % (name, stats['solve_nonlinear'],
+                                                         stats['apply_nonlinear'],
+                                                         stats['cum_time'], stats['self_time']))
+        text = '\n'.join(lines)
+        print(text, file=out)
+        return text
+
+    def trace(self):
+        """
+        Returns the recorded events in Chrome trace event format.
+        """
+        events = []
+        for name, method, start, elapsed in self.events:
+            events.append({'name' : name,
+                           'cat' : method,
+                           'ph' : 'X',
+                           'ts' : start*1.0e6,
+                           'dur' : elapsed*1.0e6,
+                           'pid' : 0,
+                           'tid' : 0})
+        return {'traceEvents' : events, 'displayTimeUnit' : 'ms'}
+
+    def save_trace(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.trace(), f)
+
+    def save_stats(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.stats, f, indent=2)
+
+
+def profile_sweep(problem_factory, cases, events=True):
+    """
+    Runs `cases` one after another on a single Problem built by
+    `problem_factory` and returns the Profiler covering the whole sweep.
+    """
+    prob = setup_problem(problem_factory)
+    profiler = Profiler(prob.root, events=events)
+    for case in cases:
+        evaluate(prob, case, [])
+    return profiler
+
+if __name__ == '__main__':
+    from hyperloop.Python import tube_and_pod
+
+    profiler = profile_sweep(tube_and_pod.create_problem, [{}])
+    profiler.report(limit=20)
+    profiler.save_trace('tube_and_pod_trace.json')
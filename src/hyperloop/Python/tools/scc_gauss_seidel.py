@@ -0,0 +1,220 @@
+"""
+Gauss-Seidel that only iterates the coupled part of a Group.
+
+NLGaussSeidel re-executes every subsystem of its Group on every iteration,
+even subsystems that nothing inside the loop depends on. `SCCGaussSeidel`
+splits the Group's data flow graph into its strongly connected components
+and sorts the subsystems into three blocks:
+
+* pre : feed forward subsystems upstream of every cycle, run once first
+* loop : subsystems in a cycle, or between two cycles, iterated to convergence
+* post : feed forward subsystems downstream of every cycle, run once after
+
+In TubeAndPod, `pod`, `mission` and `tube` form the loop and `cost` only
+runs once per solve.
+"""
+from __future__ import print_function
+
+from math import isnan
+
+import networkx as nx
+import numpy as np
+
+from openmdao.api import NLGaussSeidel
+from openmdao.core.component import Component
+from openmdao.core.system import AnalysisError
+from openmdao.solvers.solver_base import error_wrap_nl
+from openmdao.util.record_util import update_local_meta, create_local_meta
+
+
+def partition(order, graph):
+    """
+    Splits an execution order into (pre, loop, post) blocks.
+
+    Params
+    ------
+    order : list
+        Subsystem names in execution order.
+    graph : networkx.DiGraph
+        Data flow graph between the subsystems. Subsystems that are not in
+        the graph are treated as uncoupled.
+
+    Returns
+    -------
+    pre, loop, post : list
+        Subsystem names of each block, in execution order.
+    """
+    coupled = set()
+    for scc in nx.strongly_connected_components(graph):
+        scc = set(scc)
+        if len(scc) > 1 or any(graph.has_edge(node, node) for node in scc):
+            coupled.update(scc)
+
+    upstream = set()
+    downstream = set()
+    for node in coupled:
+        upstream.update(nx.ancestors(graph, node))
+        downstream.update(nx.descendants(graph, node))
+
+    loop = coupled | (upstream & downstream)
+    pre = [name for name in order if name not in loop and name not in downstream]
+    post = [name for name in order if name not in loop and name in downstream]
+    loop = [name for name in order if name in loop]
+    return pre, loop, post
+
+
+class SCCGaussSeidel(NLGaussSeidel):
+    """
+    NLGaussSeidel that only iterates the strongly connected subsystems.
+
+    Accepts the same options as NLGaussSeidel.
+
+    Notes
+    -----
+    The blocks are worked out on the first solve, after the Group's
+    execution order has been set. Convergence is checked on the residuals of
+    the loop block only. `executions_saved` counts the subsystem executions
+    (solve_nonlinear and apply_nonlinear) plain NLGaussSeidel would have made
+    on the last solve that were skipped, and `total_executions_saved` sums
+    them over every solve.
+    """
+
+    def __init__(self):
+        super(SCCGaussSeidel, self).__init__()
+
+        self.print_name = 'NLN_SCC_GS'
+        self.blocks = None
+        self.executions_saved = 0
+        self.total_executions_saved = 0
+
+    def _partition(self, system):
+        sz = len(system.pathname) + 1 if system.pathname else 0
+
+        graph = nx.DiGraph()
+        for src, tgt in system._get_sys_graph().edges():
+            graph.add_edge(src[sz:], tgt[sz:])
+
+        return partition(system.list_order(), graph)
+
+    def _run(self, system, names, metadata):
+        for name in names:
+            sub = system._subsystems[name]
+            system._transfer_data(name)
+            if sub.is_active():
+                with sub._dircontext:
+                    if isinstance(sub, Component):
+                        sub._sys_solve_nonlinear(sub.params, sub.unknowns, sub.resids)
+                    else:
+                        sub.solve_nonlinear(sub.params, sub.unknowns, sub.resids, metadata)
+
+    def _apply(self, system, names, metadata):
+        # Residual norm of the loop block
+        normval = 0.0
+        for name in names:
+            sub = system._subsystems[name]
+            if not sub._run_apply:
+                continue
+            system._transfer_data(name)
+            if sub.is_active():
+                if isinstance(sub, Component):
+                    sub._sys_apply_nonlinear(sub.params, sub.unknowns, sub.resids)
+                else:
+                    sub.apply_nonlinear(sub.params, sub.unknowns, sub.resids, metadata)
+                normval += sub.resids.norm()**2
+        return np.sqrt(normval)
+
+    @error_wrap_nl
+    def solve(self, params, unknowns, resids, system, metadata=None):
+        """ Solves the system with Gauss Seidel on the coupled subsystems.
+
+        Args
+        ----
+        params : `VecWrapper`
+            `VecWrapper` containing parameters. (p)
+
+        unknowns : `VecWrapper`
+            `VecWrapper` containing outputs and states. (u)
+
+        resids : `VecWrapper`
+            `VecWrapper` containing residuals. (r)
+
+        system : `System`
+            Parent `System` object.
+
+        metadata : dict, optional
+            Dictionary containing execution metadata (e.g. iteration coordinate).
+        """
+        if self.blocks is None:
+            self.blocks = self._partition(system)
+        pre, loop, post = self.blocks
+
+        atol = self.options['atol']
+        rtol = self.options['rtol']
+        utol = self.options['utol']
+        maxiter = self.options['maxiter']
+        iprint = self.options['iprint']
+
+        self.iter_count = 1
+
+        local_meta = create_local_meta(metadata, system.pathname)
+        system.ln_solver.local_meta = local_meta
+        update_local_meta(local_meta, (self.iter_count,))
+
+        self._run(system, pre, local_meta)
+        self._run(system, loop, local_meta)
+
+        normval = 0.0
+        basenorm = 1.0
+        if loop and maxiter > 1:
+            unknowns_cache = np.zeros(unknowns.vec.shape)
+
+            normval = self._apply(system, loop, local_meta)
+            basenorm = normval if normval > atol else 1.0
+            u_norm = 1.0e99
+
+            if iprint == 2:
+                self.print_norm(self.print_name, system, 1, normval, basenorm)
+
+            while self.iter_count < maxiter and \
+                    normval > atol and \
+                    normval/basenorm > rtol and \
+                    u_norm > utol:
+
+                self.iter_count += 1
+                update_local_meta(local_meta, (self.iter_count,))
+                unknowns_cache[:] = unknowns.vec
+
+                self._run(system, loop, local_meta)
+                self.recorders.record_iteration(system, local_meta)
+
+                normval = self._apply(system, loop, local_meta)
+                u_norm = np.linalg.norm(unknowns.vec - unknowns_cache)
+
+                if iprint == 2:
+                    self.print_norm(self.print_name, system, self.iter_count, normval,
+                                    basenorm, u_norm=u_norm)
+
+        self._run(system, post, local_meta)
+        self.recorders.record_iteration(system, local_meta)
+
+        # NLGaussSeidel runs every subsystem on each iteration and applies
+        # the ones marked _run_apply after each of them
+        skipped = [system._subsystems[name] for name in pre + post]
+        self.executions_saved = (self.iter_count - 1)*len(skipped)
+        if maxiter > 1:
+            self.executions_saved += self.iter_count*len([sub for sub in skipped if sub._run_apply])
+        self.total_executions_saved += self.executions_saved
+
+        fail = (loop and 1 < maxiter <= self.iter_count) or isnan(normval)
+        if fail:
+            msg = 'FAILED to converge after %d iterations' % self.iter_count
+        else:
+            msg = 'Converged in %d iterations' % self.iter_count
+
+        if iprint > 0 or (fail and iprint > -1):
+            self.print_norm(self.print_name, system, self.iter_count, normval,
+                            basenorm, msg=msg)
+
+        if fail and self.options['err_on_maxiter']:
+            raise AnalysisError("Solve in '%s': SCCGaussSeidel %s" %
+                                (system.pathname, msg))
@@ -0,0 +1,200 @@
+"""
+Parallel design sweeps over OpenMDAO problems.
+
+A `Sweep` takes a factory that builds a Problem (e.g.
+`hyperloop.Python.tube_and_pod.create_problem`), hands every worker in a
+process pool its own set-up copy of that Problem and evaluates a list of
+design points across the pool. The Problem is set up once per machine where
+workers can be forked from a set-up template, see `templates`. Results are
+gathered in the order the cases were given, so the trade scripts can save
+them exactly as the old serial loops did.
+"""
+from __future__ import print_function
+
+import itertools
+import multiprocessing
+
+import numpy as np
+
+from hyperloop.Python.tools.eval_cache import factory_id
+from hyperloop.Python.tools.templates import template, fork_pool
+
+# Problem owned by a pool worker. Checked out once by _init_worker and reused
+# for every case that worker is handed.
+_worker_problem = None
+
+
+def setup_problem(problem_factory):
+    """
+    Builds and sets up a Problem from `problem_factory`.
+    """
+    prob = problem_factory()
+    prob.setup(check=False)
+    return prob
+
+
+def evaluate(prob, case, outputs):
+    """
+    Sets the values in `case` on `prob`, runs it and returns copies of the
+    requested `outputs` in order.
+    """
+    for name, value in case.items():
+        prob[name] = value
+
+    prob.run()
+
+    return [np.array(prob[name], dtype=float) for name in outputs]
+
+
+def _init_worker(problem_factory):
+    global _worker_problem
+    _worker_problem = template(problem_factory).checkout()
+
+
+def _run_case(args):
+    case, outputs = args
+    return evaluate(_worker_problem, case, outputs)
+
+
+def grid(*axes):
+    """
+    Full factorial list of cases.
+
+    Params
+    ------
+    axes : tuple
+        (name, values) pairs. The last axis varies fastest, matching the
+        nested loops the trade scripts used to write by hand.
+
+    Returns
+    -------
+    cases : list
+        One dict of {name : value} per design point.
+    """
+    names = [axis[0] for axis in axes]
+    values = [axis[1] for axis in axes]
+    return [dict(zip(names, point)) for point in itertools.product(*values)]
+
+
+class Sweep(object):
+    """
+    Evaluates a list of design points on a pool of worker processes.
+
+    Params
+    ------
+    problem_factory : callable
+        Module level function returning a Problem that has not been set up.
+        It must be importable by name so it can be sent to the workers.
+    outputs : list
+        Names of the variables to collect from each run.
+    num_procs : int
+        Number of worker processes. Defaults to the number of cores. With
+        one process the cases are run in the calling process.
+    chunksize : int
+        Number of consecutive cases sent to a worker at a time. Defaults to
+        an even split, so every worker walks a contiguous piece of the sweep
+        and starts each point from its neighbour's converged state just like
+        a serial loop does.
+    cache : EvalCache
+        Optional on-disk cache. Cached points are returned without running
+        and only the remaining points are sent to the pool.
+
+    Notes
+    -----
+    The Problem comes from the process's `ProblemTemplate`. Workers are
+    forked after the template is built, so the setup cost is paid once per
+    machine; where processes cannot fork, once per core. Every sweep starts
+    from the post-setup values of the root vectors, but component
+    attributes such as the FlowPathSurrogate counters and the THERMO_CACHE
+    entries carry over from earlier sweeps in the same process.
+
+    The checked-out Problem has its own options locked, as `setup` left
+    them. The process-wide OptionsDictionary lock is not touched, so other
+    Problems built or set up alongside a sweep behave as they would
+    without it.
+    """
+
+    def __init__(self, problem_factory, outputs, num_procs=None, chunksize=None, cache=None):
+        self.problem_factory = problem_factory
+        self.outputs = list(outputs)
+        self.num_procs = num_procs
+        self.chunksize = chunksize
+        self.cache = cache
+
+    def run(self, cases):
+        """
+        Runs every case and returns a dict mapping each output name to an
+        array with one row per case, in case order.
+        """
+        cases = list(cases)
+
+        if self.cache is None:
+            return self.gather(self.evaluate(cases))
+
+        context = factory_id(self.problem_factory)
+        keys = [self.cache.key(case, context) for case in cases]
+        rows = [self.cache.get(key, self.outputs) for key in keys]
+
+        todo = [i for i, row in enumerate(rows) if row is None]
+        for i, row in zip(todo, self.evaluate([cases[i] for i in todo])):
+            rows[i] = row
+            self.cache.put(keys[i], dict(zip(self.outputs, row)))
+        self.cache.commit()
+
+        return self.gather(rows)
+
+    def evaluate(self, cases):
+        """
+        Runs `cases` on the pool and returns one list of output values per
+        case, in case order.
+        """
+        if not cases:
+            return []
+
+        num_procs = self.num_procs
+        if num_procs is None:
+            num_procs = multiprocessing.cpu_count()
+        num_procs = max(1, min(num_procs, len(cases)))
+
+        if num_procs == 1:
+            prob = template(self.problem_factory).checkout()
+            return [evaluate(prob, case, self.outputs) for case in cases]
+
+        chunksize = self.chunksize
+        if chunksize is None:
+            chunksize = int(np.ceil(len(cases)/float(num_procs)))
+
+        pool = fork_pool(self.problem_factory, num_procs,
+                         initializer=_init_worker,
+                         initargs=(self.problem_factory,))
+        try:
+            return pool.map(_run_case,
+                            [(case, self.outputs) for case in cases],
+                            chunksize)
+        finally:
+            pool.close()
+            pool.join()
+
+    def gather(self, rows):
+        """
+        Stacks per-case output rows into one array per output name.
+        """
+        results = {}
+        for i, name in enumerate(self.outputs):
+            results[name] = np.array([row[i] for row in rows])
+        return results
+
+if __name__ == '__main__':
+    import time
+    from hyperloop.Python import tube_and_pod
+
+    M_pod = np.linspace(.5, .9, num = 8)
+    outputs = ['TubeAndPod.pod.A_tube', 'TubeAndPod.cost.total_energy_cost']
+
+    for num_procs in (1, None):
+        t0 = time.time()
+        sweep = Sweep(tube_and_pod.create_problem, outputs, num_procs=num_procs)
+        results = sweep.run([{'des_vars.pod_mach' : M} for M in M_pod])
+        print('num_procs = %s: %f s' % (num_procs, time.time() - t0))
+
+    print(results['TubeAndPod.pod.A_tube'])
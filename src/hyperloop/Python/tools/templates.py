@@ -0,0 +1,147 @@
+"""
+Set-up Problems reused across runs and worker processes.
+
+Setting up a `TubeAndPod` Problem builds the pycycle janaf elements, the
+des_vars connections and the unit conversions, and costs far more than
+running it. A `ProblemTemplate` builds and sets up the Problem of a factory
+once per process and snapshots its post-setup vectors. `checkout` restores
+the root unknowns, params and resids of that snapshot, so every caller
+starts from the variable values a fresh setup would have left.
+
+Only those vectors are reset. State that components keep as attributes
+carries over from earlier checkouts: the `num_surrogate`, `num_table` and
+`num_fallback` counters and the last `error_estimate` of FlowPathSurrogate
+and FlowPathTable, their `_use_surrogate`/`_use_table` flags until the next
+solve_nonlinear sets them again, and the entries of the process-wide
+THERMO_CACHE. Callers that count evaluations have to take differences of
+the counters instead of reading them from zero.
+
+`template` keeps one ProblemTemplate per factory, identified like the
+eval-cache does, so repeated sweeps and tests in a process share it. Pools
+started with `fork_pool` are forked after the template is built, and every
+worker inherits its own copy of the set-up Problem instead of setting one up
+again.
+"""
+from __future__ import print_function
+
+import multiprocessing
+import time
+
+from hyperloop.Python.tools.eval_cache import factory_id
+
+# ProblemTemplates of this process by factory id
+_templates = {}
+
+
+class ProblemTemplate(object):
+    """
+    A Problem built and set up once, handed out with its root vectors reset
+    to their post-setup values.
+
+    Params
+    ------
+    problem_factory : callable
+        Function returning a Problem that has not been set up.
+
+    Notes
+    -----
+    `setup_time` is the time the factory and `setup` took. `checkout`
+    returns the template's own Problem, so within a process it must not be
+    used by two callers at once. Component attributes are not reset, see
+    the module docstring.
+    """
+
+    def __init__(self, problem_factory):
+        self.problem_factory = problem_factory
+
+        t0 = time.time()
+        self.problem = problem_factory()
+        self.problem.setup(check=False)
+        self.setup_time = time.time() - t0
+
+        root = self.problem.root
+        self._unknowns = root.unknowns.vec.copy()
+        self._params = root.params.vec.copy()
+        self.num_checkouts = 0
+
+    def checkout(self):
+        """
+        Returns the Problem with its unknowns and params reset to their
+        post-setup values and its resids zeroed.
+        """
+        root = self.problem.root
+        root.unknowns.vec[:] = self._unknowns
+        root.params.vec[:] = self._params
+        root.resids.vec[:] = 0.0
+        lock_options(self.problem)
+        self.num_checkouts += 1
+        return self.problem
+
+
+def lock_options(problem):
+    """
+    Locks the options of the driver and of every system and solver of
+    `problem`, as its setup did.
+
+    Notes
+    -----
+    `setup` locks options by setting the OptionsDictionary class attribute,
+    and building any other Problem or Component in the process clears it
+    again, after which `run` refuses to start. The lock is set on this
+    Problem's own dictionaries instead, so other Problems in the process
+    keep whatever state their own setup left.
+    """
+    options = [problem.driver.options]
+    for system in problem.root.subsystems(recurse=True, include_self=True):
+        options.append(system.deriv_options)
+        # Components have no solvers of their own
+        for solver in (getattr(system, 'nl_solver', None), getattr(system, 'ln_solver', None)):
+            if solver is None:
+                continue
+            options.append(solver.options)
+            line_search = getattr(solver, 'line_search', None)
+            if line_search is not None:
+                options.append(line_search.options)
+    for opts in options:
+        opts.locked = True
+
+
+def template(problem_factory):
+    """
+    ProblemTemplate of `problem_factory` in this process, built on first
+    use.
+    """
+    key = factory_id(problem_factory)
+    if key not in _templates:
+        _templates[key] = ProblemTemplate(problem_factory)
+    return _templates[key]
+
+
+def clear_templates():
+    _templates.clear()
+
+
+def can_fork():
+    """
+    True if worker processes can be forked from this one.
+    """
+    get_start_methods = getattr(multiprocessing, 'get_all_start_methods', None)
+    if get_start_methods is None:
+        # Python 2 forks on every platform but Windows
+        return hasattr(multiprocessing.os, 'fork')
+    return 'fork' in get_start_methods()
+
+
+def fork_pool(problem_factory, num_procs, initializer=None, initargs=()):
+    """
+    Builds the template of `problem_factory` in this process and returns a
+    pool of `num_procs` workers forked from it, or a plain pool when this
+    platform cannot fork.
+    """
+    if not can_fork():
+        return multiprocessing.Pool(num_procs, initializer=initializer, initargs=initargs)
+
+    template(problem_factory)
+    get_context = getattr(multiprocessing, 'get_context', None)
+    context = multiprocessing if get_context is None else get_context('fork')
+    return context.Pool(num_procs, initializer=initializer, initargs=initargs)
@@ -0,0 +1,144 @@
+"""
+In-memory cache of converged pycycle flow states.
+
+`FlowPath` and `SteadyStateVacuum` each start their flow with a pycycle
+`FlowStart`, whose SetTotal and SetStatic groups solve the janaf chemical
+equilibrium of AIR_MIX. Inside the Gauss-Seidel loops of `TubeAndPod` those
+groups are run again and again with the same (P, T, W, MN) while only
+unrelated parts of the model change. `MemoizedFlowStart` looks its inputs up
+in a `ThermoCache` first and, on a hit, copies the converged state back in
+place of the solve.
+
+Inputs are quantized to `digits` significant digits before they are used as
+a key, so states that only differ by round off from an upstream solver still
+hit. All MemoizedFlowStart instances share `THERMO_CACHE` unless given their
+own.
+"""
+from __future__ import print_function
+
+from collections import OrderedDict
+
+import numpy as np
+
+from pycycle.components import FlowStart
+
+# Inputs of a FlowStart that determine its converged state
+FLOW_START_PARAMS = ('P', 'T', 'W', 'MN_target')
+
+
+class ThermoCache(object):
+    """
+    Bounded least recently used map from quantized inputs to state vectors.
+
+    Params
+    ------
+    max_size : int
+        Number of states kept. Default value is 256.
+    digits : int
+        Significant digits inputs are rounded to in keys. Default value
+        is 10.
+
+    Notes
+    -----
+    `hits` and `misses` count lookups since the last `clear`.
+    """
+
+    def __init__(self, max_size=256, digits=10):
+        self.max_size = max_size
+        self.digits = digits
+        self._states = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, context, values):
+        """
+        Key of the input `values` (scalars or arrays) of an element
+        identified by the string `context`.
+        """
+        fmt = '%%.%de' % (self.digits - 1)
+        return (context,) + tuple(fmt % x for value in values for x in np.ravel(value))
+
+    def get(self, key):
+        """
+        Copy of the state stored under `key`, or None.
+        """
+        state = self._states.pop(key, None)
+        if state is None:
+            self.misses += 1
+            return None
+        self._states[key] = state
+        self.hits += 1
+        return state.copy()
+
+    def put(self, key, state):
+        """
+        Stores a copy of `state` under `key`, dropping the least recently
+        used states beyond `max_size`.
+        """
+        self._states.pop(key, None)
+        self._states[key] = np.array(state, dtype=float)
+        while len(self._states) > self.max_size:
+            self._states.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits/float(lookups) if lookups else 0.0
+
+    def stats(self):
+        """
+        Dict of hits, misses, hit_rate and the number of stored states.
+        """
+        return {'hits' : self.hits,
+                'misses' : self.misses,
+                'hit_rate' : self.hit_rate,
+                'size' : len(self._states)}
+
+    def clear(self):
+        self._states.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+THERMO_CACHE = ThermoCache()
+
+
+class MemoizedFlowStart(FlowStart):
+    """
+    FlowStart that reuses converged states from a `ThermoCache`.
+
+    Params
+    ------
+    thermo_data, elements :
+        As for FlowStart.
+    cache : ThermoCache
+        Cache to share. Default value is THERMO_CACHE.
+
+    Notes
+    -----
+    The unknown, param and residual vectors of the group, chemical
+    equilibrium states included, are stored after every solve and restored
+    on a hit. The params of the inner components are restored with them,
+    because a hit skips the data transfers of the solve, and a later
+    linearize would otherwise see the inputs of the last solved state.
+    """
+
+    def __init__(self, thermo_data, elements, cache=None):
+        super(MemoizedFlowStart, self).__init__(thermo_data=thermo_data, elements=elements)
+
+        self.cache = THERMO_CACHE if cache is None else cache
+        self._context = '%s:%s:%r' % (type(self).__name__, getattr(thermo_data, '__name__', thermo_data),
+                                      sorted(elements.items()))
+
+    def solve_nonlinear(self, params, unknowns, resids, metadata=None):
+        key = self.cache.key(self._context, [params[name] for name in FLOW_START_PARAMS])
+        state = self.cache.get(key)
+        if state is not None:
+            n_u, n_p = len(unknowns.vec), len(params.vec)
+            unknowns.vec[:] = state[:n_u]
+            params.vec[:] = state[n_u:n_u + n_p]
+            resids.vec[:] = state[n_u + n_p:]
+            return
+
+        super(MemoizedFlowStart, self).solve_nonlinear(params, unknowns, resids, metadata)
+        self.cache.put(key, np.concatenate((unknowns.vec, params.vec, resids.vec)))
@@ -8,6 +8,38 @@ from __future__ import print_function
 import numpy as np
 from openmdao.api import IndepVarComp, Component, Group, Problem
 
+def propulsion_mechanics_kernel(p):
+    """Evaluate function Preq = (1/eta)*(mg*(1+sin(theta))*(vf-vo)+(1/6)*(Cd*rho*S*(vf^3 - vo^3))+D_mag*(vf-v0))
+    for a dict of params given as scalars or arrays of design points.
+    Friction and magnetic drag are neglected for now.
+    """
+
+    eta = p['eta']
+    g = p['g']
+    vf = p['vf']
+    v0 = p['v0']
+    Cd = p['Cd']
+    S = p['S']
+    m_pod = p['m_pod']
+
+    #Calculate intermediate variables
+    rho = p['p_tube'] / (p['R'] * p['T_ambient']
+                         )  #Calculate air density, rho = P/(RT)
+    pod_thrust = p['nozzle_thrust'] - p['ram_drag']
+
+    #Evaluate equation
+    D = .5 * rho * (vf**2.0) * S * Cd
+    pwr_req = (1.0 / eta) * (
+        (m_pod * g * (1 + np.sin(p['theta']))* (vf - v0)) + (1.0 / 6.0) * (Cd * rho * S * (
+            (vf**3.0) - (v0**3.0))) + p['D_mag'] *
+        (vf - v0) - pod_thrust * (vf - v0))
+
+    return {'D' : D,
+            'pwr_req' : pwr_req,
+            'Fg_dP' : (m_pod * g) / pwr_req,
+            'm_dP' : m_pod / pwr_req}
+
+
 class PropulsionMechanics(Component):
     """
     Notes
@@ -93,34 +125,15 @@ class PropulsionMechanics(Component):
         self.add_output('Fg_dP', val=0.0)  #Define Thrust per unit Power output
         self.add_output('m_dP', val=0.0)  #Define mass per unit power as output
 
+    kernel = staticmethod(propulsion_mechanics_kernel)
+
     def solve_nonlinear(self, params, unknowns, resids):
         """Evaluate function Preq = (1/eta)*(mg*(1+sin(theta))*(vf-vo)+(1/6)*(Cd*rho*S*(vf^3 - vo^3))+D_mag*(vf-v0))
         Can be optimized in the future.  Friction and magnetic drag are neglected for now.
         """
 
-        eta = params['eta']
-        g = params['g']
-        vf = params['vf']
-        v0 = params['v0']
-        Cd = params['Cd']
-        S = params['S']
-        m_pod = params['m_pod']
-
-        #Calculate intermediate variables
-        rho = params['p_tube'] / (params['R'] * params['T_ambient']
-                                  )  #Calculate air density, rho = P/(RT)
-        pod_thrust = params['nozzle_thrust'] - params['ram_drag']
-        L = ((vf**2) - (v0**2)) / (2 * g)  #Calculate necessary track length
-
-        #Evaluate equation
-        unknowns['D'] = .5 * rho * (vf**2.0) * S * Cd
-        unknowns['pwr_req'] = (1.0 / eta) * (
-            (m_pod * g * (1 + np.sin(params['theta']))* (vf - v0)) + (1.0 / 6.0) * (Cd * rho * S * (
-                (vf**3.0) - (v0**3.0))) + params['D_mag'] *
-            (vf - v0) - pod_thrust * (vf - v0))
-        unknowns['Fg_dP'] = (m_pod * g) / unknowns['pwr_req']
-
-        unknowns['m_dP'] = m_pod / unknowns['pwr_req']
+        for name, val in propulsion_mechanics_kernel(params).items():
+            unknowns[name] = val
 
 if __name__ == '__main__':
 
@@ -14,6 +14,7 @@ from pycycle.species_data import janaf
 from pycycle.connect_flow import connect_flow
 from pycycle.constants import AIR_FUEL_MIX, AIR_MIX
 from pycycle.constants import R_UNIVERSAL_ENG, R_UNIVERSAL_SI
+from hyperloop.Python.tools.thermo_cache import MemoizedFlowStart
 
 from openmdao.solvers.ln_gauss_seidel import LinearGaussSeidel
 from openmdao.solvers.ln_direct import DirectSolver
@@ -70,7 +71,7 @@ class SteadyStateVacuum(Group):
 
         self.add('input_vars',IndepVarComp(des_vars))
 
-        self.add('fl_start', FlowStart(thermo_data=janaf, elements=AIR_MIX))
+        self.add('fl_start', MemoizedFlowStart(thermo_data=janaf, elements=AIR_MIX))
         # internal flow
         self.add('comp', Compressor(thermo_data=janaf, elements=AIR_MIX))
         self.add('q', ExecComp('Prc = Pa/Ps'), promotes = ['Prc', 'Pa'])
@@ -1,9 +1,29 @@
 from __future__ import print_function
 
 import numpy as np
-import matplotlib.pylab as plt
 from openmdao.api import IndepVarComp, Component, Group, Problem
 
+def submerged_tube_kernel(p):
+	'''
+	Vectorized SubmergedTube for a dict of params given as scalars or arrays
+	of design points.
+
+	t = (p*r)/(Su/SF); p = pa + rho*g*h; F_buoyant/L = rho*A_tube*g
+	'''
+	p_ambient = p['Pa'] + p['rho_water']*p['depth']*p['g']
+	dp = p_ambient - p['p_tube']
+	r = np.sqrt(p['A_tube']/np.pi)
+	t = ((p_ambient-p['p_tube'])*r)/(p['Su']/p['SF'])
+	t_crit = r * (((4.0 * dp * (1.0 - (p['v_tube']**2))) / p['E_tube'])**(1.0 / 3.0))
+
+	t = np.where(np.real(t) > np.real(t_crit), t, t_crit)
+	return {'t' : t,
+	        'dF_buoyancy' : p['rho_water']*p['g']*p['A_tube'],
+	        'material_cost' : (np.pi*((r+t)**2)-p['A_tube'])*p['rho_tube']*p['unit_cost_tube'],
+	        'm_prime' : (np.pi*((r+t)**2)-p['A_tube'])*p['rho_tube'],
+	        't_crit' : t_crit}
+
+
 class SubmergedTube(Component):
 	'''
 	Params
@@ -62,26 +82,17 @@ class SubmergedTube(Component):
 		self.add_output('m_prime', val = 1.0, desc = 'Tube mass per unit length')
 		self.add_output('t_crit', 1.0, desc = 'Critical buckling thickness', units = 'm')
 
+	kernel = staticmethod(submerged_tube_kernel)
+
 	def solve_nonlinear(self, p, u, r):
 		'''
 		t = (p*r)/(Su/SF); p = pa + rho*g*h; F_buoyant/L = rho*A_tube*g
 		'''
-		p_ambient = p['Pa'] + p['rho_water']*p['depth']*p['g']
-		dp = p_ambient - p['p_tube']
-		r = np.sqrt(p['A_tube']/np.pi)
-		t = ((p_ambient-p['p_tube'])*r)/(p['Su']/p['SF'])
-		t_crit = r * (((4.0 * dp * (1.0 - (p['v_tube']**2))) / p['E_tube'])**(1.0 / 3.0))
-		
-		if t>t_crit:
-			u['t'] = t
-		else:
-			u['t'] = t_crit
-		u['dF_buoyancy'] = p['rho_water']*p['g']*p['A_tube']
-		u['material_cost'] = (np.pi*((r+u['t'])**2)-p['A_tube'])*p['rho_tube']*p['unit_cost_tube']
-		u['m_prime'] = (np.pi*((r+u['t'])**2)-p['A_tube'])*p['rho_tube']
-		u['t_crit'] = t_crit
+		for name, val in submerged_tube_kernel(p).items():
+			u[name] = val
 
 if __name__ == '__main__':
+	import matplotlib.pylab as plt
 	top = Problem()
 	root = top.root = Group()
 
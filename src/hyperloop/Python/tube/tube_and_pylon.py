@@ -3,6 +3,75 @@ from __future__ import print_function
 import numpy as np
 from openmdao.api import IndepVarComp, Component, Group, Problem, ExecComp, ScipyOptimizer
 
+def tube_and_pylon_kernel(p):
+    '''Vectorized TubeAndPylon for a dict of params given as scalars or
+    arrays of design points.
+
+    total material cost = ($/kg_tunnel)*m_prime + ($/kg_pylon)*m_pylon*(1/dx)
+    m_prime = mass of tunnel per unit length = rho_tube*pi*((r+t)^2-r^2)
+    m_pylon = mass of single pylon = rho_pylon*pi*(r_pylon^2)*h
+
+    Constraint equations derived from yield on buckling conditions
+
+    '''
+
+    rho_tube = p['rho_tube']
+    E_tube = p['E_tube']
+    v_tube = p['v_tube']
+    alpha_tube = p['alpha_tube']
+    dT_tube = p['dT_tube']
+    unit_cost_tube = p['unit_cost_tube']
+    g = p['g']
+    tube_area = p['tube_area']
+    t = p['t']
+    m_pod = p['m_pod']
+    p_tunnel = p['p_tunnel']
+    p_ambient = p['p_ambient']
+    Su_pylon = p['Su_pylon']
+    sf = p['sf']
+    rho_pylon = p['rho_pylon']
+    r_pylon = p['r_pylon']
+    unit_cost_pylon = p['unit_cost_pylon']
+    h = p['h']
+
+    #Compute intermediate variable
+    r = np.sqrt(tube_area/np.pi)
+    q = rho_tube * np.pi * ((
+        (r + t)**2) - (r**2)) * g  #Calculate distributed load
+    dp = p_ambient - p_tunnel  #Calculate delta pressure
+    I_tube = (np.pi / 4.0) * ((
+        (r + t)**4) - (r**4))  #Calculate moment of inertia of tube
+
+    m_prime = rho_tube * np.pi * ((
+        (r + t)**2) - (r**2))  #Calculate mass per unit length
+    dx = ((2 * (Su_pylon / sf) * np.pi *
+           (r_pylon**2)) - m_pod * g) / (m_prime * g)  #Calculate dx
+    M = (q * (
+        (dx**2) / 8.0)) + (m_pod * g * (dx / 2.0))  #Calculate max moment
+    sig_theta = (dp * r) / t  #Calculate hoop stress
+    sig_axial = ((dp * r) / (2 * t)) + (
+        (M * r) / I_tube
+    ) + alpha_tube * E_tube * dT_tube  #Calculate axial stress
+    von_mises = np.sqrt((((sig_theta**2) + (sig_axial**2) + (
+        (sig_axial - sig_theta)**2)) /
+                2.0))  #Calculate Von Mises stress
+    m_pylon = rho_pylon * np.pi * (r_pylon**
+                                2) * h  #Calculate mass of single pylon
+
+    return {'total_material_cost' : (unit_cost_tube * (rho_tube * np.pi * ((
+                (r + t)**2) - (r**2)))) + (unit_cost_pylon * m_pylon * (1 / (
+                    ((2 * (Su_pylon / sf) * np.pi * (r_pylon**2)) - m_pod * g) /
+                    (m_prime * g)))),
+            'm_prime' : m_prime,
+            'von_mises' : von_mises,
+            'delta' : (5.0 * q * (dx**4)) / (384.0 * E_tube * I_tube),
+            'm_pylon' : m_pylon,
+            'R' : .5 * m_prime * dx * g + .5 * m_pod * g,
+            'dx' : dx,
+            't_crit' : r * ((
+                (4.0 * dp * (1.0 - (v_tube**2))) / E_tube)**(1.0 / 3.0))}
+
+
 class TubeAndPylon(Component):
     """
     Notes
@@ -182,6 +251,8 @@ class TubeAndPylon(Component):
                         units='m',
                         desc='Minimum tunnel thickness for buckling')
 
+    kernel = staticmethod(tube_and_pylon_kernel)
+
     def solve_nonlinear(self, params, unknowns, resids):
         '''total material cost = ($/kg_tunnel)*m_prime + ($/kg_pylon)*m_pylon*(1/dx)
         m_prime = mass of tunnel per unit length = rho_tube*pi*((r+t)^2-r^2)
@@ -191,65 +262,8 @@ class TubeAndPylon(Component):
 
         '''
 
-        rho_tube = params['rho_tube']
-        E_tube = params['E_tube']
-        v_tube = params['v_tube']
-        alpha_tube = params['alpha_tube']
-        dT_tube = params['dT_tube']
-        unit_cost_tube = params['unit_cost_tube']
-        g = params['g']
-        tube_area = params['tube_area']
-        #r = params['r']
-        t = params['t']
-        m_pod = params['m_pod']
-        p_tunnel = params['p_tunnel']
-        p_ambient = params['p_ambient']
-        Su_pylon = params['Su_pylon']
-        sf = params['sf']
-        rho_pylon = params['rho_pylon']
-        E_pylon = params['E_pylon']
-        r_pylon = params['r_pylon']
-        unit_cost_pylon = params['unit_cost_pylon']
-        h = params['h']
-        vac_weight = params['vac_weight']
-
-        #Compute intermediate variable
-        r = np.sqrt(tube_area/np.pi)
-        #print(r)
-        q = rho_tube * np.pi * ((
-            (r + t)**2) - (r**2)) * g  #Calculate distributed load
-        dp = p_ambient - p_tunnel  #Calculate delta pressure
-        I_tube = (np.pi / 4.0) * ((
-            (r + t)**4) - (r**4))  #Calculate moment of inertia of tube
-
-        m_prime = rho_tube * np.pi * ((
-            (r + t)**2) - (r**2))  #Calculate mass per unit length
-        dx = ((2 * (Su_pylon / sf) * np.pi *
-               (r_pylon**2)) - m_pod * g) / (m_prime * g)  #Calculate dx
-        M = (q * (
-            (dx**2) / 8.0)) + (m_pod * g * (dx / 2.0))  #Calculate max moment
-        sig_theta = (dp * r) / t  #Calculate hoop stress
-        sig_axial = ((dp * r) / (2 * t)) + (
-            (M * r) / I_tube
-        ) + alpha_tube * E_tube * dT_tube  #Calculate axial stress
-        von_mises = np.sqrt((((sig_theta**2) + (sig_axial**2) + (
-            (sig_axial - sig_theta)**2)) /
-                    2.0))  #Calculate Von Mises stress
-        m_pylon = rho_pylon * np.pi * (r_pylon**
-                                    2) * h  #Calculate mass of single pylon
-
-        unknowns['total_material_cost'] = (unit_cost_tube * (rho_tube * np.pi * ((
-            (r + t)**2) - (r**2)))) + (unit_cost_pylon * m_pylon * (1 / (
-                ((2 * (Su_pylon / sf) * np.pi * (r_pylon**2)) - m_pod * g) /
-                (m_prime * g))))
-        unknowns['m_prime'] = m_prime
-        unknowns['von_mises'] = von_mises
-        unknowns['delta'] = (5.0 * q * (dx**4)) / (384.0 * E_tube * I_tube)
-        unknowns['m_pylon'] = m_pylon
-        unknowns['R'] = .5 * m_prime * dx * g + .5 * m_pod * g
-        unknowns['dx'] = dx
-        unknowns['t_crit'] = r * ((
-            (4.0 * dp * (1.0 - (v_tube**2))) / E_tube)**(1.0 / 3.0))
+        for name, val in tube_and_pylon_kernel(params).items():
+            unknowns[name] = val
 
 
 if __name__ == '__main__':
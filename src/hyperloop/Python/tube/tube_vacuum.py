@@ -7,6 +7,34 @@ from math import pi
 
 import numpy as np
 
+def vacuum_kernel(p):
+    """
+    Vectorized Vacuum. Takes a dict of params by name, as scalars or arrays
+    of design points, and returns a dict of outputs.
+    """
+
+    volft = p['tube_area'] * p['tube_length']  # Volume of the tube in cubic feet
+
+    vol = volft * 28.3168  # Volume of the tube in liters
+
+    # Number of pumps needed
+    n = (vol / p['speed']) * np.log(
+        p['pressure_initial'] / p['pressure_final']) * 2.0 * (1.0 / p['time_down'])
+
+    # Energy Consumption of a Single Pump in one day
+    energy_tot = p['pwr'] * n * (p['gamma'] * 86400.0)
+
+    # Cost to Run the Vacuum for One Year
+    cost_annual = energy_tot * 365.0 * p['electricity_price'] / (
+        1000.0 * 60.0 * 60.0 * (1.0 / 1000.0))
+
+    return {'cost_annual' : cost_annual,
+            'weight_tot' : p['pump_weight'] * n,  # Total weight of all of the pumps.
+            'energy_tot' : energy_tot*.01,
+            'number_pumps' : n,
+            'pwr_tot' : p['pwr'] * n}
+
+
 class Vacuum(Component):
     """
     Params
@@ -114,32 +142,12 @@ class Vacuum(Component):
                         desc='total pwr of the pumps',
                         units='kW')
 
-    def solve_nonlinear(self, params, unknowns, resids):
-
-        volft = params['tube_area'] * params['tube_length']  # Volume of the tube in cubic feet
-
-        vol = volft * 28.3168  # Volume of the tube in liters
-
-        # Number of pumps needed
-        n = (vol / params['speed']) * np.log(
-            params['pressure_initial'] / params['pressure_final']) * 2.0 * (1.0 / params['time_down'])
+    kernel = staticmethod(vacuum_kernel)
 
-        # Energy Consumption of a Single Pump in one day
-        energy_tot = params['pwr'] * n * (params['gamma'] * 86400.0)
-
-        # Cost to Run the Vacuum for One Year
-        unknowns['cost_annual'] = energy_tot * 365.0 * params['electricity_price'] / (
-            1000.0 * 60.0 * 60.0 * (1.0 / 1000.0))
-
-        # Total weight of all of the pumps.
-        unknowns['weight_tot'] = params['pump_weight'] * n
-
-        # unknowns['vol'] = vol
-        # unknowns['volft'] = volft
-        unknowns['energy_tot'] = energy_tot*.01
-        unknowns['number_pumps'] = n
+    def solve_nonlinear(self, params, unknowns, resids):
 
-        unknowns['pwr_tot'] = params['pwr'] * n
+        for name, val in vacuum_kernel(params).items():
+            unknowns[name] = val
 
 if __name__ == '__main__':
 
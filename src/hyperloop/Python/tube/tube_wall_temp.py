@@ -11,6 +11,8 @@
     """
 from math import log, pi, sqrt, e
 
+import numpy as np
+
 from openmdao.core.group import Group, Component, IndepVarComp
 from openmdao.solvers.newton import Newton
 from openmdao.units.units import convert_units as cu
@@ -150,7 +152,6 @@ class TubeWallTemp(Component):
 
     def __init__(self, thermo_data=species_data.janaf, elements=AIR_MIX):
         super(TubeWallTemp, self).__init__()
-        self.deriv_options['type'] = 'fd'
 
         #--Inputs--
         #Hyperloop Parameters/Design Variables
@@ -398,6 +399,131 @@ class TubeWallTemp(Component):
         # print("u['ss_temp_residual'] ", u['ss_temp_residual'])
         # print("temp boundary", p['temp_boundary'])
 
+    def linearize(self, p, u, r):
+        """Analytic partials of every output with respect to every param.
+
+        Each intermediate is carried with its gradient over `params`, in the
+        same order as solve_nonlinear, and the chain rule is applied step by
+        step. Branches follow solve_nonlinear.
+        """
+        params = ('tube_area', 'tube_thickness', 'length_tube', 'num_pods',
+                  'temp_boundary', 'temp_outside_ambient', 'nozzle_air_W',
+                  'nozzle_air_Cp', 'nozzle_air_Tt', 'solar_insolation',
+                  'nn_incidence_factor', 'surface_reflectance',
+                  'emissivity_tube', 'sb_constant', 'Nu_multiplier')
+        n = len(params)
+        d = dict((name, np.eye(n)[i]) for i, name in enumerate(params))
+
+        Tb = p['temp_boundary']
+        Ta = p['temp_outside_ambient']
+        L = p['length_tube']
+
+        D = 2*sqrt(p['tube_area']/pi) + p['tube_thickness']
+        dD = d['tube_area']/sqrt(pi*p['tube_area']) + d['tube_thickness']
+
+        c_W = cu(1., 'lbm/s', 'kg/s')
+        c_Cp = cu(1., 'Btu/(lbm*degR)', 'J/(kg*K)')
+        c_T = cu(1., 'degR', 'degK')
+        W = c_W*p['nozzle_air_W']
+        Cp = c_Cp*p['nozzle_air_Cp']
+        dT = c_T*p['nozzle_air_Tt'] - Tb
+        q_pod = W*Cp*dT
+        dq_pod = (c_W*d['nozzle_air_W']*Cp*dT + W*c_Cp*d['nozzle_air_Cp']*dT +
+                  W*Cp*(c_T*d['nozzle_air_Tt'] - d['temp_boundary']))
+        dq_pods = dq_pod*p['num_pods'] + q_pod*d['num_pods']
+
+        if (Ta < 400):
+            GrDelTL3 = 41780000000000000000 * Ta**(-4.639)
+            dGrDelTL3 = -4.639*GrDelTL3/Ta*d['temp_outside_ambient']
+            Pr = 1.23 * Ta**(-0.09685)
+            dPr = -0.09685*Pr/Ta*d['temp_outside_ambient']
+            k = 0.0001423 * Ta**(0.9138)
+            dk = 0.9138*k/Ta*d['temp_outside_ambient']
+        else:
+            GrDelTL3 = 4985000000000000000 * Ta**(-4.284)
+            dGrDelTL3 = -4.284*GrDelTL3/Ta*d['temp_outside_ambient']
+            Pr = 0.59 * Ta**(0.0239)
+            dPr = 0.0239*Pr/Ta*d['temp_outside_ambient']
+            k = 0.0002494 * Ta**(0.8152)
+            dk = 0.8152*k/Ta*d['temp_outside_ambient']
+
+        sgn = np.sign(Tb - Ta)
+        Gr = GrDelTL3 * abs(Tb - Ta) * D**3
+        dGr = (dGrDelTL3 * abs(Tb - Ta) * D**3 +
+               GrDelTL3 * sgn * (d['temp_boundary'] - d['temp_outside_ambient']) * D**3 +
+               GrDelTL3 * abs(Tb - Ta) * 3 * D**2 * dD)
+        Ra = Pr*Gr
+        dRa = dPr*Gr + Pr*dGr
+
+        Nu = u['Nu']
+        dNu = np.zeros(n)
+        if (Ra <= 10**12):
+            g = (0.559 / Pr)**(9. / 16.)
+            f = (1 + g)**(8. / 27.)
+            df = (8. / 27.) * (1 + g)**(8. / 27. - 1) * (-9. / 16.) * g / Pr * dPr
+            X = 0.6 + 0.387 * Ra**(1. / 6.) / f
+            dX = 0.387 * ((1. / 6.) * Ra**(-5. / 6.) * dRa / f - Ra**(1. / 6.) * df / f**2)
+            Nu = p['Nu_multiplier'] * X**2
+            dNu = X**2 * d['Nu_multiplier'] + p['Nu_multiplier'] * 2 * X * dX
+
+        h = (k * Nu) / D
+        dh = (dk * Nu + k * dNu) / D - (k * Nu) / D**2 * dD
+        area_convection = pi * L * D
+        darea_convection = pi * (d['length_tube'] * D + L * dD)
+        q_nat = h * (Tb - Ta)
+        dq_nat = dh * (Tb - Ta) + h * (d['temp_boundary'] - d['temp_outside_ambient'])
+        dq_nat_tot = dq_nat * area_convection + q_nat * darea_convection
+
+        area_viewing = L * D
+        darea_viewing = d['length_tube'] * D + L * dD
+        sr = p['surface_reflectance']
+        nn = p['nn_incidence_factor']
+        S = p['solar_insolation']
+        q_solar = (1 - sr) * nn * S
+        dq_solar = -d['surface_reflectance'] * nn * S + (1 - sr) * (d['nn_incidence_factor'] * S +
+                                                                     nn * d['solar_insolation'])
+        dq_solar_tot = dq_solar * area_viewing + q_solar * darea_viewing
+
+        sb = p['sb_constant']
+        em = p['emissivity_tube']
+        q_rad = sb * em * (Tb**4 - Ta**4)
+        dq_rad = ((d['sb_constant'] * em + sb * d['emissivity_tube']) * (Tb**4 - Ta**4) +
+                  sb * em * 4 * (Tb**3 * d['temp_boundary'] - Ta**3 * d['temp_outside_ambient']))
+        dq_rad_tot = dq_rad * area_convection + q_rad * darea_convection
+
+        dq_out = dq_rad_tot + dq_nat_tot
+        dq_in = dq_solar_tot + dq_pods
+
+        grads = {'diameter_outer_tube' : dD,
+                 'nozzle_q' : dq_pod,
+                 'heat_rate_pod' : dq_pod,
+                 'total_heat_rate_pods' : dq_pods,
+                 'GrDelTL3' : dGrDelTL3,
+                 'Pr' : dPr,
+                 'Gr' : dGr,
+                 'Ra' : dRa,
+                 'Nu' : dNu,
+                 'k' : dk,
+                 'h' : dh,
+                 'area_convection' : darea_convection,
+                 'q_per_area_nat_conv' : dq_nat,
+                 'total_q_nat_conv' : dq_nat_tot,
+                 'area_viewing' : darea_viewing,
+                 'q_per_area_solar' : dq_solar,
+                 'q_total_solar' : dq_solar_tot,
+                 'area_rad' : darea_convection,
+                 'q_rad_per_area' : dq_rad,
+                 'q_rad_tot' : dq_rad_tot,
+                 'q_total_out' : dq_out,
+                 'q_total_in' : dq_in,
+                 'ss_temp_residual' : (dq_out - dq_in) / 1e6}
+
+        J = {}
+        for out, grad in grads.items():
+            for i, name in enumerate(params):
+                J[out, name] = grad[i]
+        return J
+
 class TubeTemp(Group):
     """An Assembly that computes Steady State temp"""
 
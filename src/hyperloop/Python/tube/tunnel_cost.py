@@ -9,7 +9,20 @@ from openmdao.core.group import Group
 from openmdao.core.component import Component
 import math
 from collections import namedtuple
-from Python.tools import io_helper
+
+import numpy as np
+
+from hyperloop.Python.tools import io_helper
+
+
+def tunnel_cost_kernel(p):
+    """
+    Vectorized TunnelCost for a dict of params ('length' in km, 'diameter'
+    in m) given as scalars or arrays of tunnels.
+    """
+    # formula taken from conventional subway excavation data [1]
+    return {'cost' : 1000000 * 10**(1.10 + (0.933 * np.log10(p['length'])) +
+                                    (0.614 * np.log10(p['diameter'])))}
 
 
 class DefaultsHandler(object):
@@ -93,6 +106,8 @@ class TunnelCost(Component):
                         desc=defaults.cost.desc,
                         units=defaults.cost.unit)
 
+    kernel = staticmethod(tunnel_cost_kernel)
+
     # formula taken from conventional subway excavation data
     def solve_nonlinear(self, params, unknowns, resids):
 
@@ -104,9 +119,8 @@ class TunnelCost(Component):
         # TODO for final publish store all citations in common document not inline
         # formula taken from conventional subway excavation data
         # https://www.researchgate.net/publication/233926915_Planning_level_tunnel_cost_estimation_based_on_statistical_analysis_of_historical_data
-        unknowns[defaults.cost.name] = 1000000 * math.pow(10, (
-            1.10 + (0.933 * math.log10(params[defaults.len.name])) +
-            (0.614 * math.log10(params[defaults.diam.name]))))
+        for name, val in tunnel_cost_kernel(params).items():
+            unknowns[name] = val
 
     def print_results(self):
         print("{} ({}): {}".format(defaults.diam.name, defaults.diam.unit,
@@ -7,12 +7,12 @@ from hyperloop.Python.tube.tube_group import TubeGroup
 from hyperloop.Python.pod.pod_group import PodGroup
 from hyperloop.Python.ticket_cost import TicketCost
 from hyperloop.Python.sample_mission import SampleMission
+from hyperloop.Python.tools.scc_gauss_seidel import SCCGaussSeidel
 
 import numpy as np 
-import matplotlib.pylab as plt 
 
 class TubeAndPod(Group):
-    def __init__(self):
+    def __init__(self, cycle_surrogate=None, cycle_table=None, cycle_fidelity='pycycle'):
         """
         Params
         ------
@@ -84,12 +84,15 @@ class TubeAndPod(Group):
            Bradley University, 2004. N.p.: n.p., n.d. Print.
         """
         super(TubeAndPod, self).__init__()
-        self.add('pod', PodGroup(), promotes=['pod_mach', 'tube_pressure', 'comp.map.PRdes',
-                                              'nozzle.Ps_exhaust', 'comp_inlet_area', 'des_time',
-                                              'time_of_flight', 'motor_max_current', 'motor_LD_ratio',
-                                              'motor_oversize_factor', 'inverter_efficiency', 'battery_cross_section_area',
-                                              'n_passengers', 'A_payload', 'S', 'total_pod_mass', 'vel_b',
-                                              'h_lev', 'vel', 'mag_drag', 'L_pod'])
+        pod = PodGroup(cycle_surrogate=cycle_surrogate, cycle_table=cycle_table,
+                       cycle_fidelity=cycle_fidelity)
+        self.add('pod', pod, promotes=['pod_mach', 'tube_pressure', 'comp.map.PRdes',
+                                       'nozzle.Ps_exhaust', 'comp_inlet_area', 'des_time',
+                                       'time_of_flight', 'motor_max_current', 'motor_LD_ratio',
+                                       'motor_oversize_factor', 'inverter_efficiency',
+                                       'battery_cross_section_area', 'n_passengers', 'A_payload',
+                                       'S', 'total_pod_mass', 'vel_b', 'h_lev', 'vel', 'mag_drag',
+                                       'L_pod'])
         self.add('tube', TubeGroup(), promotes=['pressure_initial', 'pwr', 'num_pods',
                                               'speed', 'time_down', 'gamma', 'pump_weight',
                                               'electricity_price', 'tube_thickness', 'r_pylon',
@@ -137,7 +140,9 @@ class TubeAndPod(Group):
         self.connect('mission.num_thrust', ['tube.num_thrust', 'cost.num_thrust'])
         self.connect('mission.thrust_time', 'cost.thrust_time')
 
-        self.nl_solver = NLGaussSeidel()
+        # Only pod, mission and tube are coupled. cost runs once after they
+        # converge instead of on every iteration.
+        self.nl_solver = SCCGaussSeidel()
         self.nl_solver.options['maxiter'] = 20
         self.nl_solver.options['atol'] = 0.0001
         # self.nl_solver.options['iprint'] = 2
@@ -145,11 +150,32 @@ class TubeAndPod(Group):
         self.ln_solver = ScipyGMRES()
         self.ln_solver.options['maxiter'] = 20
 
-if __name__ == '__main__':
+def create_problem(cycle_surrogate=None, cycle_table=None, cycle_fidelity='pycycle'):
+    """
+    Builds the baseline TubeAndPod problem used by the trade studies.
+
+    Params
+    ------
+    cycle_surrogate : str
+        Optional FlowPath surrogate training data passed to `Cycle`. Use
+        functools.partial to hand this to a `Sweep`.
+    cycle_table : str
+        Optional FlowPath performance table passed to `Cycle`, likewise.
+    cycle_fidelity : str
+        'pycycle', or 'lite' for the perfect-gas LiteFlowPath.
+
+    Returns
+    -------
+    prob : Problem
+        Problem with a `TubeAndPod` group and a `des_vars` IndepVarComp
+        holding the baseline design. `setup` has not been called so the
+        caller may still add a driver or change solver options.
+    """
 
     prob = Problem()
     root = prob.root = Group()
-    root.add('TubeAndPod', TubeAndPod())
+    root.add('TubeAndPod', TubeAndPod(cycle_surrogate=cycle_surrogate, cycle_table=cycle_table,
+                                         cycle_fidelity=cycle_fidelity))
 
     params = (('tube_pressure', 850.0, {'units' : 'Pa'}),
               ('pressure_initial', 760.2, {'units' : 'torr'}),
@@ -238,6 +264,11 @@ if __name__ == '__main__':
     prob.root.connect('des_vars.operating_time', 'TubeAndPod.operating_time')
     prob.root.connect('des_vars.W', 'TubeAndPod.fl_start.W')
 
+    return prob
+
+if __name__ == '__main__':
+
+    prob = create_problem()
     prob.setup()
 
     prob.run()
@@ -302,3 +333,9 @@ if __name__ == '__main__':
     print('estimated ticket cost              %f USD' % prob['TubeAndPod.cost.ticket_cost'])
 
     print('\n')
+    print('------ Solver ------')
+    print('coupled subsystems                 %s' % ', '.join(prob.root.TubeAndPod.nl_solver.blocks[1]))
+    print('iterations                         %d' % prob.root.TubeAndPod.nl_solver.iter_count)
+    print('redundant executions skipped       %d' % prob.root.TubeAndPod.nl_solver.executions_saved)
+
+    print('\n')
@@ -1,7 +1,6 @@
 from __future__ import print_function
 
 import numpy as np
-import matplotlib.pylab as plt
 from openmdao.api import IndepVarComp, Component, Group, Problem, ExecComp, ScipyOptimizer
 
 class UnderwaterOptimization(Component):
@@ -257,6 +256,7 @@ class UnderwaterOptimization(Component):
 
 
 if __name__ == '__main__':
+    import matplotlib.pylab as plt
 
     top = Problem()
     root = top.root = Group()